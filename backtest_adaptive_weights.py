@@ -8,6 +8,7 @@ import sys
 import os
 from typing import Dict, List, Tuple
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
 import numpy as np
 from datetime import datetime
@@ -15,13 +16,63 @@ import matplotlib.pyplot as plt
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from regime_weights import RegimeAdaptiveWeights
+from _njit import njit, prange
+from regime_weights import RegimeAdaptiveWeights, REGIME_CATEGORIES
 from enhanced_predictor_adaptive import (
-    fetch_4hour_data, compute_enhanced_features, 
-    enhanced_prediction_adaptive, generate_trading_levels
+    fetch_4hour_data, fetch_4hour_data_batch, compute_enhanced_features_batch,
+    prediction_components_batch, STATIC_WEIGHTS
 )
 
 
+# One row per evaluated bar
+TRADE_DTYPE = np.dtype([
+    ('entry', 'f8'),
+    ('exit', 'f8'),
+    ('signal', 'U5'),
+    ('actual', 'U5'),
+    ('correct', '?'),
+    ('return', 'f8'),
+    ('confidence', 'f4')
+])
+
+
+@njit(parallel=True, cache=True)
+def run_backtest_kernel(components, weight_table, regime_codes, cur_close, next_close):
+    """Score, signal and settle every bar in one pass.
+    
+    Args:
+        components: (n, 5) component scores per bar
+        weight_table: (k, 5) weights per regime
+        regime_codes: Row index into weight_table for each bar
+        cur_close: Close at each signal bar
+        next_close: Close one bar later
+    
+    Returns:
+        Tuple of (is_long, confidence, trade_return, correct) arrays
+    """
+    n = components.shape[0]
+    is_long = np.empty(n, dtype=np.bool_)
+    confidence = np.empty(n, dtype=np.float64)
+    trade_return = np.empty(n, dtype=np.float64)
+    correct = np.empty(n, dtype=np.bool_)
+    
+    for i in prange(n):
+        weights = weight_table[regime_codes[i]]
+        score = 0.0
+        for j in range(components.shape[1]):
+            score += components[i, j] * weights[j]
+        
+        long_signal = score > 0.5
+        move = (next_close[i] - cur_close[i]) / cur_close[i]
+        
+        is_long[i] = long_signal
+        confidence[i] = abs(score - 0.5) * 200
+        trade_return[i] = move if long_signal else -move
+        correct[i] = long_signal == (next_close[i] > cur_close[i])
+    
+    return is_long, confidence, trade_return, correct
+
+
 def backtest_strategy(ticker: str,
                       optimizer: RegimeAdaptiveWeights = None,
                       use_adaptive: bool = False,
@@ -48,101 +99,75 @@ def backtest_strategy(ticker: str,
     if len(df) < lookback + 1:
         return None
     
-    # Backtest metrics
-    trades = []
-    correct = 0
-    incorrect = 0
-    total_return = 0
-    entry_price = None
-    position = None  # 'long', 'short', or None
+    # Features for bar i come from bars [i-lookback, i), i.e. row i-1.
+    # Stored as contiguous float32 columns; prices for PnL stay float64.
+    features = compute_enhanced_features_batch(df, window=lookback)
+    features = {k: np.ascontiguousarray(v[lookback - 1:-2], dtype=np.float32)
+                for k, v in features.items()}
     
-    for i in range(lookback, len(df) - 1):
-        historical_df = df.iloc[max(0, i-lookback):i].copy()
-        
-        if len(historical_df) < 5:
-            continue
-        
-        try:
-            features = compute_enhanced_features(historical_df)
-            current_price = df['Close'].iloc[i]
-            
-            # Get prediction
-            pred = enhanced_prediction_adaptive(
-                features, optimizer, use_adaptive_weights=use_adaptive
-            )
-            
-            predicted_signal = pred['prediction']
-            confidence = pred['confidence']
-            
-            # Simple trading logic
-            atr = features.get('atr', current_price * 0.01)
-            levels = generate_trading_levels(current_price, atr)
-            
-            # Next price
-            next_price = df['Close'].iloc[i + 1]
-            actual_direction = 'LONG' if next_price > current_price else 'SHORT'
-            
-            # Check if prediction was correct
-            if predicted_signal == actual_direction:
-                correct += 1
-            else:
-                incorrect += 1
-            
-            # Calculate return if we took the trade
-            if predicted_signal == 'LONG':
-                entry = current_price
-                exit_price = next_price
-                trade_return = (exit_price - entry) / entry
-            else:
-                entry = current_price
-                exit_price = next_price
-                trade_return = (entry - exit_price) / entry
-            
-            trades.append({
-                'entry': entry if predicted_signal == 'LONG' else current_price,
-                'exit': exit_price,
-                'signal': predicted_signal,
-                'actual': actual_direction,
-                'correct': predicted_signal == actual_direction,
-                'return': trade_return,
-                'confidence': confidence
-            })
-            
-            total_return += trade_return
-            
-        except Exception:
-            continue
+    components = prediction_components_batch(features)
+    n_bars = len(components)
+    
+    if use_adaptive and optimizer is not None and optimizer.is_trained:
+        weight_table = np.stack([optimizer.get_weight_vector(c) for c in REGIME_CATEGORIES])
+        regime_codes = optimizer.regime_codes_batch(features)
+    else:
+        # Untrained optimizers fall back to the same static weights
+        weight_table = STATIC_WEIGHTS[np.newaxis, :]
+        regime_codes = np.zeros(n_bars, dtype=np.intp)
     
-    if not trades:
+    close = np.ascontiguousarray(df['Close'].to_numpy(), dtype=np.float64)
+    cur_close = close[lookback:-1]
+    next_close = close[lookback + 1:]
+    
+    is_long, confidence, trade_return, is_correct = run_backtest_kernel(
+        np.ascontiguousarray(components, dtype=np.float64), weight_table,
+        regime_codes, cur_close, next_close
+    )
+    predicted_signal = np.where(is_long, 'LONG', 'SHORT')
+    actual_direction = np.where(next_close > cur_close, 'LONG', 'SHORT')
+    
+    n_trades = len(trade_return)
+    if n_trades == 0:
         return None
     
-    # Calculate metrics
-    df_trades = pd.DataFrame(trades)
+    trades = np.empty(n_trades, dtype=TRADE_DTYPE)
+    trades['entry'] = cur_close
+    trades['exit'] = next_close
+    trades['signal'] = predicted_signal
+    trades['actual'] = actual_direction
+    trades['correct'] = is_correct
+    trades['return'] = trade_return
+    trades['confidence'] = confidence
     
-    accuracy = correct / (correct + incorrect) * 100 if (correct + incorrect) > 0 else 0
-    win_count = len(df_trades[df_trades['correct'] == True])
-    win_rate = (win_count / len(trades)) * 100 if len(trades) > 0 else 0
+    # Calculate metrics
+    returns = trades['return']
+    win_count = int(trades['correct'].sum())
+    accuracy = win_count / n_trades * 100
+    win_rate = accuracy
+    total_return = returns.sum()
     
-    profitable_trades = df_trades[df_trades['return'] > 0]
-    losing_trades = df_trades[df_trades['return'] <= 0]
+    wins = returns[returns > 0]
+    losses = returns[returns <= 0]
     
-    avg_win = profitable_trades['return'].mean() * 100 if len(profitable_trades) > 0 else 0
-    avg_loss = losing_trades['return'].mean() * 100 if len(losing_trades) > 0 else 0
+    avg_win = wins.mean() * 100 if len(wins) > 0 else 0
+    avg_loss = losses.mean() * 100 if len(losses) > 0 else 0
     
-    profit_factor = (profitable_trades['return'].sum() / abs(losing_trades['return'].sum())) if len(losing_trades) > 0 and losing_trades['return'].sum() != 0 else 0
+    loss_sum = losses.sum()
+    profit_factor = (wins.sum() / abs(loss_sum)) if len(losses) > 0 and loss_sum != 0 else 0
     
     return {
         'ticker': ticker,
         'accuracy': accuracy,
         'win_rate': win_rate,
         'total_return': total_return * 100,
-        'num_trades': len(trades),
+        'num_trades': n_trades,
         'winning_trades': win_count,
-        'losing_trades': len(trades) - win_count,
+        'losing_trades': n_trades - win_count,
         'avg_win': avg_win,
         'avg_loss': avg_loss,
         'profit_factor': profit_factor,
-        'trades_df': df_trades
+        'trades_df': pd.DataFrame(trades)
     }
 
 
@@ -204,9 +229,28 @@ def main():
     print("Running backtests...")
     print("-"*80)
     
+    # One batched download up front; forked workers inherit the warm cache
+    fetch_4hour_data_batch(args.tickers, days=args.days)
+    
+    # Tickers are independent, so run static and adaptive backtests in parallel
+    results = {}
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {}
+        for ticker in args.tickers:
+            futures[executor.submit(backtest_strategy, ticker, None, False, args.days)] = (ticker, 'static')
+            futures[executor.submit(backtest_strategy, ticker, optimizer, True, args.days)] = (ticker, 'adaptive')
+        
+        for future in as_completed(futures):
+            ticker, mode = futures[future]
+            try:
+                results[(ticker, mode)] = future.result()
+            except Exception as e:
+                print(f"Error backtesting {ticker} ({mode}): {e}")
+                results[(ticker, mode)] = None
+    
     for ticker in args.tickers:
-        static = backtest_strategy(ticker, optimizer=None, use_adaptive=False, days=args.days)
-        adaptive = backtest_strategy(ticker, optimizer=optimizer, use_adaptive=True, days=args.days)
+        static = results.get((ticker, 'static'))
+        adaptive = results.get((ticker, 'adaptive'))
         
         if static and adaptive:
             static_results.append(static)
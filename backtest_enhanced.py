@@ -1,15 +1,46 @@
 """Backtest the enhanced predictor strategy."""
 
-import pandas as pd
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import numpy as np
 from src.enhanced_predictor import (
-    fetch_4hour_data, compute_enhanced_features, enhanced_prediction,
-    generate_trading_levels
+    fetch_4hour_data, fetch_4hour_data_batch, compute_enhanced_features,
+    enhanced_prediction_batch, features_to_array, generate_trading_levels
 )
 
 
-def backtest_enhanced(ticker: str, days: int = 60, initial_capital: float = 10000):
-    """Backtest enhanced predictor."""
+def _first_exit(close: np.ndarray, start: int, stop_loss: float,
+                take_profit: float, is_long: bool):
+    """Find the first bar at or after ``start`` that hits the stop or target.
+    
+    Returns:
+        Tuple of (bar index, exit reason), or (None, None) if never hit
+    """
+    window = close[start:]
+    if is_long:
+        stop_hit = window <= stop_loss
+        target_hit = window >= take_profit
+    else:
+        stop_hit = window >= stop_loss
+        target_hit = window <= take_profit
+    
+    hit = stop_hit | target_hit
+    offset = int(np.argmax(hit))
+    if not hit[offset]:
+        return None, None
+    # Stop loss takes precedence when both trigger on the same bar
+    reason = "Stop Loss" if stop_hit[offset] else "Take Profit"
+    return start + offset, reason
+
+
+def backtest_enhanced(ticker: str, days: int = 60, initial_capital: float = 10000,
+                      min_move: float = 0.001):
+    """Backtest enhanced predictor.
+    
+    Bars whose 3-bar price move is below ``min_move`` (fraction of price) are
+    treated as flat: no features, prediction or entry are computed for them.
+    Pass ``min_move=0`` to evaluate every bar.
+    """
     print(f"\n{'='*70}")
     print(f"ENHANCED BACKTEST: {ticker}")
     print(f"{'='*70}")
@@ -20,120 +51,86 @@ def backtest_enhanced(ticker: str, days: int = 60, initial_capital: float = 1000
         print(f"Error: {e}")
         return None
     
-    trades = []
-    predictions = []
     equity = initial_capital
-    position = None
-    entry_price = 0
     
     window_size = 5
+    close = df["Close"].to_numpy(dtype=np.float64)
+    n = len(df)
+    
+    # Trade PnLs (the only field the metrics use), preallocated and filled by counter
+    pnls = np.empty(n)
+    num_trades = 0
+    
+    # Cheap pre-check: skip the featurizer on bars with no recent movement
+    quick_mom = np.zeros_like(close)
+    quick_mom[3:] = np.abs(close[3:] - close[:-3]) / close[3:]
     
+    # Per-bar features (needed later only for entry levels), scored in one batch
+    bar_features = {}
     for i in range(window_size, len(df)):
-        df_window = df.iloc[i-window_size:i]
-        features = compute_enhanced_features(df_window)
-        result = enhanced_prediction(features)
+        if quick_mom[i] < min_move:
+            continue
         
-        current_price = df.iloc[i]["Close"]
-        current_time = df.index[i]
+        df_window = df.iloc[i-window_size:i]
+        bar_features[i] = compute_enhanced_features(df_window)
+    
+    bars = np.fromiter(bar_features, dtype=np.intp, count=len(bar_features))
+    batch = enhanced_prediction_batch(features_to_array(list(bar_features.values())))
+    bar_pos = {i: pos for pos, i in enumerate(bar_features)}
+    
+    # Track predictions
+    tracked = bars + 1 < n
+    pred_correct = batch["prediction"][tracked] == np.where(
+        close[bars[tracked] + 1] > close[bars[tracked]], "Up", "Down")
+    num_predictions = len(pred_correct)
+    
+    # Trading logic: enter on the first confident bar, then jump straight to
+    # the first bar that touches the stop or target instead of walking bars
+    i = window_size
+    while i < len(df):
+        pos = bar_pos.get(i)
+        if pos is None:
+            i += 1
+            continue
         
-        # Track predictions
-        if i + 1 < len(df):
-            next_price = df.iloc[i + 1]["Close"]
-            actual_direction = "Up" if next_price > current_price else "Down"
-            was_correct = result["prediction"] == actual_direction
-            
-            predictions.append({
-                "time": current_time,
-                "predicted": result["prediction"],
-                "actual": actual_direction,
-                "correct": was_correct,
-                "confidence": result["confidence"]
-            })
+        if batch["confidence"][pos] <= 20:  # Lowered confidence filter
+            i += 1
+            continue
         
-        # Trading logic
-        if position is None and result["confidence"] > 20:  # Lowered confidence filter
-            levels = generate_trading_levels(
-                current_price, result["prediction"],
-                features["atr"], features
-            )
-            
-            if result["prediction"] == "Up":
-                position = "LONG"
-                entry_price = current_price
-                stop_loss = levels["stop_loss"]
-                take_profit = levels["take_profit"]
-                
-            else:
-                position = "SHORT"
-                entry_price = current_price
-                stop_loss = levels["stop_loss"]
-                take_profit = levels["take_profit"]
+        prediction = str(batch["prediction"][pos])
+        features = bar_features[i]
+        entry_price = close[i]
+        levels = generate_trading_levels(
+            entry_price, prediction,
+            features["atr"], features
+        )
+        position = "LONG" if prediction == "Up" else "SHORT"
         
-        # Check exits
-        if position == "LONG":
-            if current_price <= stop_loss:
-                pnl = current_price - entry_price
-                equity += pnl
-                trades.append({
-                    "Entry": entry_price,
-                    "Exit": current_price,
-                    "Type": "LONG",
-                    "PnL": pnl,
-                    "Reason": "Stop Loss"
-                })
-                position = None
-                
-            elif current_price >= take_profit:
-                pnl = current_price - entry_price
-                equity += pnl
-                trades.append({
-                    "Entry": entry_price,
-                    "Exit": current_price,
-                    "Type": "LONG",
-                    "PnL": pnl,
-                    "Reason": "Take Profit"
-                })
-                position = None
+        exit_index, reason = _first_exit(close, i, levels["stop_loss"],
+                                         levels["take_profit"], position == "LONG")
+        if exit_index is None:
+            break  # Position still open at the end of the data
         
-        elif position == "SHORT":
-            if current_price >= stop_loss:
-                pnl = entry_price - current_price
-                equity += pnl
-                trades.append({
-                    "Entry": entry_price,
-                    "Exit": current_price,
-                    "Type": "SHORT",
-                    "PnL": pnl,
-                    "Reason": "Stop Loss"
-                })
-                position = None
-                
-            elif current_price <= take_profit:
-                pnl = entry_price - current_price
-                equity += pnl
-                trades.append({
-                    "Entry": entry_price,
-                    "Exit": current_price,
-                    "Type": "SHORT",
-                    "PnL": pnl,
-                    "Reason": "Take Profit"
-                })
-                position = None
+        exit_price = close[exit_index]
+        pnl = exit_price - entry_price if position == "LONG" else entry_price - exit_price
+        equity += pnl
+        pnls[num_trades] = pnl
+        num_trades += 1
+        i = exit_index + 1
     
     # Calculate metrics
-    if len(trades) == 0:
+    if num_trades == 0:
         print(f"No trades for {ticker}")
         return None
     
     total_return = ((equity - initial_capital) / initial_capital) * 100
-    wins = len([t for t in trades if t["PnL"] > 0])
-    losses = len([t for t in trades if t["PnL"] <= 0])
-    win_rate = (wins / len(trades)) * 100 if len(trades) > 0 else 0
-    
-    if len(predictions) > 0:
-        predictions_df = pd.DataFrame(predictions)
-        correct = len(predictions_df[predictions_df["correct"] == True])
-        pred_accuracy = (correct / len(predictions_df)) * 100
+    wins = (pnls[:num_trades] > 0).sum()
+    losses = num_trades - wins
+    win_rate = (wins / num_trades) * 100
+    
+    if num_predictions > 0:
+        correct = int(pred_correct[:num_predictions].sum())
+        pred_accuracy = (correct / num_predictions) * 100
     else:
         pred_accuracy = 0
     
@@ -141,7 +138,7 @@ def backtest_enhanced(ticker: str, days: int = 60, initial_capital: float = 1000
     print(f"  Initial Capital: ${initial_capital:,.2f}")
     print(f"  Final Equity: ${equity:,.2f}")
     print(f"  Total Return: {total_return:+.2f}%")
-    print(f"\n  Total Trades: {len(trades)}")
+    print(f"\n  Total Trades: {num_trades}")
     print(f"  Wins: {wins} | Losses: {losses}")
     print(f"  Win Rate: {win_rate:.1f}%")
     print(f"  Prediction Accuracy: {pred_accuracy:.1f}%")
@@ -149,7 +146,7 @@ def backtest_enhanced(ticker: str, days: int = 60, initial_capital: float = 1000
     return {
         "ticker": ticker,
         "return": total_return,
-        "trades": len(trades),
+        "trades": num_trades,
         "win_rate": win_rate,
         "accuracy": pred_accuracy,
         "equity": equity
@@ -158,16 +155,29 @@ def backtest_enhanced(ticker: str, days: int = 60, initial_capital: float = 1000
 
 if __name__ == "__main__":
     tickers = ["AAPL", "MSFT", "GOOGL", "AMZN", "TSLA"]
-    results = []
     
     print("=" * 70)
     print("ENHANCED PREDICTOR BACKTEST")
     print("=" * 70)
     
-    for ticker in tickers:
-        result = backtest_enhanced(ticker, days=60, initial_capital=10000)
-        if result:
-            results.append(result)
+    # One batched download up front; forked workers inherit the warm cache
+    fetch_4hour_data_batch(tickers, days=60)
+    
+    by_ticker = {}
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {
+            executor.submit(backtest_enhanced, ticker, 60, 10000): ticker
+            for ticker in tickers
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                by_ticker[ticker] = future.result()
+            except Exception as e:
+                print(f"Error backtesting {ticker}: {e}")
+    
+    # Keep summary in input order regardless of completion order
+    results = [by_ticker[t] for t in tickers if by_ticker.get(t)]
     
     # Summary
     print(f"\n{'='*70}")
@@ -0,0 +1,35 @@
+"""Convert pickled regime weights to the pickle-free .npz + .json format.
+
+The converted files load through ``RegimeAdaptiveWeights.load_weights`` (or
+``get_optimizer``) like the pickle they came from.
+"""
+
+import sys
+import os
+import argparse
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from regime_weights import RegimeAdaptiveWeights
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert regime weights from pickle to .npz + .json"
+    )
+    parser.add_argument(
+        "weights",
+        nargs="+",
+        help="Pickled weights file(s) written by save_weights"
+    )
+    args = parser.parse_args()
+
+    for path in args.weights:
+        optimizer = RegimeAdaptiveWeights()
+        optimizer.load_weights(path)
+        optimizer.save_npz(os.path.splitext(path)[0] + '.npz')
+
+
+if __name__ == "__main__":
+    main()
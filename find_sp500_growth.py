@@ -3,14 +3,21 @@ S&P 500 Growth Opportunity Analyzer
 Identifies shares with 2%+ growth probability today
 """
 
+import os
+import sys
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import yfinance as yf
 import pickle
 import warnings
 from pathlib import Path
 import time
+from tqdm import tqdm
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from _njit import njit
+from data_cache import cached_download
 
 warnings.filterwarnings('ignore')
 
@@ -29,6 +36,109 @@ SP500_TICKERS = [
     'RIVN', 'SOFI', 'UPST', 'VROOM', 'W', 'ABNB', 'UBER', 'LYFT', 'DOCU'
 ]
 
+# Symbols yfinance can't price as stocks (delisted, mutual funds, exchange names)
+INVALID_TICKERS = {'AMEX', 'FXAIX', 'XLNX'}
+
+
+def clean_tickers(tickers):
+    """Drop duplicates and known-bad symbols, keeping order.
+    
+    Class-share dots are converted to Yahoo's dash form (BRK.B -> BRK-B).
+    """
+    cleaned = (t.strip().upper().replace('.', '-') for t in tickers)
+    return [t for t in dict.fromkeys(cleaned) if t not in INVALID_TICKERS]
+
+
+SP500_TICKERS = clean_tickers(SP500_TICKERS)
+
+
+@njit(cache=True)
+def _indicator_kernel(close):
+    """Latest SMA20, SMA50, 5-day momentum, volatility and RSI(14) of a close series.
+    
+    Only the final value of each indicator is needed, so each is computed from
+    the trailing slice rather than a full rolling pass. Unavailable values are
+    NaN (momentum and volatility fall back to 0 for very short series).
+    """
+    n = close.shape[0]
+    sma_20 = close[-20:].mean() if n >= 20 else np.nan
+    sma_50 = close[-50:].mean() if n >= 50 else np.nan
+    
+    # Momentum
+    momentum = (close[-1] - close[-5]) / close[-5] if n >= 5 else 0.0
+    
+    # Volatility (sample std of daily returns)
+    volatility = 0.0
+    if n > 2:
+        returns = np.diff(close) / close[:-1]
+        volatility = np.sqrt(np.sum((returns - returns.mean()) ** 2) / (returns.shape[0] - 1))
+    elif n == 2:
+        volatility = np.nan
+    
+    # RSI
+    rsi = np.nan
+    if n > 14:
+        delta = np.diff(close[-15:])
+        avg_gain = np.where(delta > 0, delta, 0.0).mean()
+        avg_loss = np.where(delta < 0, -delta, 0.0).mean()
+        rs = avg_gain / (avg_loss + 1e-10)
+        rsi = 100 - (100 / (1 + rs))
+    
+    return sma_20, sma_50, momentum, volatility, rsi
+
+
+@njit(cache=True, fastmath={'nsz', 'arcp', 'contract', 'reassoc'})
+def _score_kernel(momentum, price_vs_sma, rsi, vol):
+    """Bullish signal score (0-100) from scalar indicators.
+    
+    A NaN ``price_vs_sma`` means the SMA20 was unavailable and skips that term
+    (so fastmath is restricted to flags that keep NaN checks intact).
+    """
+    signal_score = 50.0  # Base score
+    
+    # 1. Momentum analysis (±30 points)
+    if momentum > 0.05:  # Strong positive momentum
+        signal_score += 30
+    elif momentum > 0.02:  # Good momentum
+        signal_score += 20
+    elif momentum > 0:  # Slight positive
+        signal_score += 10
+    elif momentum < -0.05:  # Negative momentum
+        signal_score -= 30
+    
+    # 2. Price position vs SMA20 (±25 points)
+    if not np.isnan(price_vs_sma):
+        if price_vs_sma > 0.03:  # Well above SMA
+            signal_score += 25
+        elif price_vs_sma > 0.01:  # Moderately above
+            signal_score += 15
+        elif price_vs_sma > -0.01:  # Near or slightly above
+            signal_score += 5
+        else:  # Below SMA
+            signal_score -= 20
+    
+    # 3. RSI analysis (±20 points)
+    if 50 < rsi < 70:  # Bullish but not overbought
+        signal_score += 20
+    elif 40 < rsi < 60:  # Neutral to bullish
+        signal_score += 10
+    elif rsi > 70:  # Overbought - reversal risk
+        signal_score -= 15
+    elif rsi < 30:  # Oversold - potential bounce
+        signal_score += 15
+    
+    # 4. Volatility factor (±15 points)
+    if 0.01 < vol < 0.04:  # Normal volatility - good for trading
+        signal_score += 15
+    elif vol <= 0.01:  # Very low volatility
+        signal_score += 5
+    elif vol > 0.08:  # High volatility - risky
+        signal_score -= 15
+    
+    # Clamp probability to 0-100 range
+    return min(100.0, max(0.0, signal_score))
+
+
 class SP500GrowthAnalyzer:
     """Analyze S&P 500 stocks for growth opportunities"""
     
@@ -65,30 +175,23 @@ class SP500GrowthAnalyzer:
             else:
                 close = df['Close']
             
+            close_arr = np.ascontiguousarray(close.to_numpy(dtype=np.float64))
+            sma_20, sma_50, momentum, volatility, rsi = _indicator_kernel(close_arr)
+            
             indicators = {}
             
             # Trend indicators
-            indicators['SMA_20'] = close.rolling(20).mean().iloc[-1] if len(close) >= 20 else None
-            indicators['SMA_50'] = close.rolling(50).mean().iloc[-1] if len(close) >= 50 else None
+            indicators['SMA_20'] = sma_20 if close_arr.size >= 20 else None
+            indicators['SMA_50'] = sma_50 if close_arr.size >= 50 else None
             
             # Price position relative to SMAs
-            current_price = close.iloc[-1]
+            current_price = close_arr[-1]
             if indicators['SMA_20']:
                 indicators['Price_vs_SMA20'] = (current_price - indicators['SMA_20']) / indicators['SMA_20']
             
-            # Momentum
-            returns_5d = (close.iloc[-1] - close.iloc[-5]) / close.iloc[-5] if len(close) >= 5 else 0
-            indicators['Momentum_5d'] = returns_5d
-            
-            # Volatility
-            indicators['Volatility'] = close.pct_change().std() if len(close) > 1 else 0
-            
-            # RSI
-            delta = close.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
-            rs = gain / (loss + 1e-10)
-            indicators['RSI'] = (100 - (100 / (1 + rs))).iloc[-1]
+            indicators['Momentum_5d'] = momentum
+            indicators['Volatility'] = volatility
+            indicators['RSI'] = rsi
             
             return indicators
             
@@ -102,74 +205,48 @@ class SP500GrowthAnalyzer:
             if not indicators:
                 return None, 0.0
             
-            # Calculate bullish signal score (0-100)
-            signal_score = 50.0  # Base score
-            
-            # 1. Momentum analysis (±30 points)
-            momentum = indicators.get('Momentum_5d', 0)
-            if momentum > 0.05:  # Strong positive momentum
-                signal_score += 30
-            elif momentum > 0.02:  # Good momentum
-                signal_score += 20
-            elif momentum > 0:  # Slight positive
-                signal_score += 10
-            elif momentum < -0.05:  # Negative momentum
-                signal_score -= 30
-            
-            # 2. Price position vs SMA20 (±25 points)
             price_vs_sma = indicators.get('Price_vs_SMA20')
-            if price_vs_sma is not None:
-                if price_vs_sma > 0.03:  # Well above SMA
-                    signal_score += 25
-                elif price_vs_sma > 0.01:  # Moderately above
-                    signal_score += 15
-                elif price_vs_sma > -0.01:  # Near or slightly above
-                    signal_score += 5
-                else:  # Below SMA
-                    signal_score -= 20
-            
-            # 3. RSI analysis (±20 points)
-            rsi = indicators.get('RSI', 50)
-            if 50 < rsi < 70:  # Bullish but not overbought
-                signal_score += 20
-            elif 40 < rsi < 60:  # Neutral to bullish
-                signal_score += 10
-            elif rsi > 70:  # Overbought - reversal risk
-                signal_score -= 15
-            elif rsi < 30:  # Oversold - potential bounce
-                signal_score += 15
-            
-            # 4. Volatility factor (±15 points)
-            vol = indicators.get('Volatility', 0.03)
-            if 0.01 < vol < 0.04:  # Normal volatility - good for trading
-                signal_score += 15
-            elif vol <= 0.01:  # Very low volatility
-                signal_score += 5
-            elif vol > 0.08:  # High volatility - risky
-                signal_score -= 15
-            
-            # Clamp probability to 0-100 range
-            probability = max(0, min(100, signal_score))
+            probability = _score_kernel(
+                float(indicators.get('Momentum_5d', 0)),
+                np.nan if price_vs_sma is None else float(price_vs_sma),
+                float(indicators.get('RSI', 50)),
+                float(indicators.get('Volatility', 0.03))
+            )
             
             return 'UP', probability
             
         except Exception as e:
             return None, 0.0
     
-    def analyze_stock(self, ticker):
-        """Analyze single stock"""
+    def download_all(self, tickers):
+        """Download daily history for all tickers in one request.
+        
+        The batch is cached to ``cache/`` as parquet keyed by date, so re-runs
+        on the same day skip the network entirely.
+        """
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=100)
+        return cached_download(tickers, start_date, end_date, group_by='ticker',
+                               threads=True, prepost=False)
+    
+    def analyze_stock(self, ticker, data=None):
+        """Analyze single stock
+        
+        Args:
+            ticker: Stock ticker
+            data: Pre-downloaded OHLCV frame for the ticker (downloaded if None)
+        
+        Returns:
+            Tuple of (result dict or None, short status for progress display)
+        """
         try:
-            print(f"  Analyzing {ticker}...", end=' ', flush=True)
-            
-            # Fetch data
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=100)
-            
-            data = yf.download(ticker, start=start_date, end=end_date, progress=False, prepost=False)
+            if data is None:
+                end_date = datetime.now()
+                start_date = end_date - timedelta(days=100)
+                data = cached_download(ticker, start_date, end_date, prepost=False)
             
             if data.empty or len(data) < 20:
-                print("❌ Insufficient data")
-                return None
+                return None, "❌ Insufficient data"
             
             # Handle MultiIndex columns (from yfinance)
             if isinstance(data.columns, pd.MultiIndex):
@@ -182,8 +259,7 @@ class SP500GrowthAnalyzer:
             # Calculate indicators
             indicators = self.calculate_technical_indicators(data)
             if not indicators:
-                print("❌ Cannot calculate indicators")
-                return None
+                return None, "❌ Cannot calculate indicators"
             
             # Predict growth
             direction, confidence = self.predict_growth(ticker, indicators)
@@ -200,15 +276,12 @@ class SP500GrowthAnalyzer:
                     'vs_SMA20_%': round(indicators.get('Price_vs_SMA20', 0) * 100, 2) if indicators.get('Price_vs_SMA20') else 0,
                     'Volatility_%': round(indicators.get('Volatility', 0) * 100, 2),
                 }
-                print(f"✓ Confidence: {confidence:.1f}%")
-                return result
+                return result, f"✓ {confidence:.1f}%"
             else:
-                print(f"{'✓ LOW' if direction else '❌'} {confidence:.1f}%")
-                return None
+                return None, f"{'✓ LOW' if direction else '❌'} {confidence:.1f}%"
             
         except Exception as e:
-            print(f"❌ Error: {str(e)[:30]}")
-            return None
+            return None, f"❌ Error: {str(e)[:30]}"
     
     def run(self):
         """Run analysis on all tickers"""
@@ -221,11 +294,19 @@ class SP500GrowthAnalyzer:
         
         start_time = time.time()
         
-        for ticker in SP500_TICKERS:
-            result = self.analyze_stock(ticker)
+        # One batched request for every ticker instead of one per ticker
+        data = self.download_all(SP500_TICKERS)
+        
+        pbar = tqdm(SP500_TICKERS, desc='Analyzing')
+        for ticker in pbar:
+            if ticker in data.columns.get_level_values(0):
+                ticker_data = data[ticker].dropna(how='all')
+            else:
+                ticker_data = pd.DataFrame()
+            result, status = self.analyze_stock(ticker, ticker_data)
+            pbar.set_postfix_str(f"{ticker} {status}")
             if result:
                 self.results.append(result)
-            time.sleep(0.1)  # Rate limiting
         
         elapsed = time.time() - start_time
         
@@ -256,8 +337,8 @@ class SP500GrowthAnalyzer:
             print("\nKEY STATISTICS:")
             print(f"  Average Growth Probability: {df_results['Growth_Probability_%'].mean():.1f}%")
             print(f"  Highest Probability: {df_results['Growth_Probability_%'].max():.1f}%")
-            print(f"  Stocks above 60% probability: {len(df_results[df_results['Growth_Probability_%'] > 60])}")
-            print(f"  Stocks above 70% probability: {len(df_results[df_results['Growth_Probability_%'] > 70])}")
+            print(f"  Stocks above 60% probability: {int((df_results['Growth_Probability_%'] > 60).sum())}")
+            print(f"  Stocks above 70% probability: {int((df_results['Growth_Probability_%'] > 70).sum())}")
             
             # Top recommendations
             print("\n🎯 TOP 5 RECOMMENDATIONS FOR TODAY:")
@@ -6,17 +6,25 @@ from enhanced_predictor_adaptive import (
     fetch_4hour_data, compute_enhanced_features, enhanced_prediction_adaptive,
     generate_trading_levels, detect_volatility_regime
 )
-from regime_weights import RegimeAdaptiveWeights
+from _weights_cache import get_optimizer
 
 # Load weights
-optimizer = RegimeAdaptiveWeights()
-optimizer.load_weights('models/regime_weights_20251210_135927.pkl')
+optimizer = get_optimizer()
 
-# Fetch current data
+# Fetch current data (served from the parquet cache in cache/ for up to an hour)
 df = fetch_4hour_data('BTQ', days=30)
-print(f'\nBTQ - Latest 4-hour Prediction')
-print('='*70)
-print(f'Data points collected: {len(df)}')
+
+# Report lines, written to stdout in one go at the end
+out = []
+out.append(f'\nBTQ - Latest 4-hour Prediction')
+out.append('='*70)
+out.append(f'Data points collected: {len(df)}')
+
+# Latest bar values
+last_close = df['Close'].iat[-1]
+last_high = df['High'].iat[-1]
+last_low = df['Low'].iat[-1]
+last_volume = df['Volume'].iat[-1]
 
 # Get features
 features = compute_enhanced_features(df)
@@ -26,60 +34,62 @@ static_pred = enhanced_prediction_adaptive(features, optimizer=None, use_adaptiv
 adaptive_pred = enhanced_prediction_adaptive(features, optimizer, use_adaptive_weights=True)
 
 # Get trading levels
-levels = generate_trading_levels(df['Close'].iloc[-1], features['atr'])
+levels = generate_trading_levels(last_close, features['atr'])
 
 # Detect regime
 regime = detect_volatility_regime(features)
 
-print(f'\n📊 MARKET DATA')
-print('-'*70)
-print(f'Current Price:      ${df["Close"].iloc[-1]:.2f}')
-print(f'4h High:            ${df["High"].iloc[-1]:.2f}')
-print(f'4h Low:             ${df["Low"].iloc[-1]:.2f}')
-print(f'Volume:             {df["Volume"].iloc[-1]:,.0f}')
-print(f'ATR (Volatility):   ${features["atr"]:.2f} ({features["atr_percent"]:.2f}%)')
-
-print(f'\n🎯 MARKET REGIME')
-print('-'*70)
-print(f'Regime:             {regime}')
-print(f'ADX (Trend):        {features["adx"]:.1f}')
-print(f'RSI:                {features["rsi"]:.1f}')
-print(f'MACD:               {"Bullish" if features["macd"] > features["macd_signal"] else "Bearish"}')
-
-print(f'\n📈 PREDICTIONS')
-print('-'*70)
-print(f'Static Weights:     {static_pred["prediction"]} (Confidence: {static_pred["confidence"]:.1f}%)')
-print(f'Adaptive Weights:   {adaptive_pred["prediction"]} (Confidence: {adaptive_pred["confidence"]:.1f}%)')
-
-print(f'\n📍 WEIGHT DISTRIBUTION')
-print('-'*70)
-print(f'Static Weights:')
+out.append(f'\n📊 MARKET DATA')
+out.append('-'*70)
+out.append(f'Current Price:      ${last_close:.2f}')
+out.append(f'4h High:            ${last_high:.2f}')
+out.append(f'4h Low:             ${last_low:.2f}')
+out.append(f'Volume:             {last_volume:,.0f}')
+out.append(f'ATR (Volatility):   ${features["atr"]:.2f} ({features["atr_percent"]:.2f}%)')
+
+out.append(f'\n🎯 MARKET REGIME')
+out.append('-'*70)
+out.append(f'Regime:             {regime}')
+out.append(f'ADX (Trend):        {features["adx"]:.1f}')
+out.append(f'RSI:                {features["rsi"]:.1f}')
+out.append(f'MACD:               {"Bullish" if features["macd"] > features["macd_signal"] else "Bearish"}')
+
+out.append(f'\n📈 PREDICTIONS')
+out.append('-'*70)
+out.append(f'Static Weights:     {static_pred["prediction"]} (Confidence: {static_pred["confidence"]:.1f}%)')
+out.append(f'Adaptive Weights:   {adaptive_pred["prediction"]} (Confidence: {adaptive_pred["confidence"]:.1f}%)')
+
+out.append(f'\n📍 WEIGHT DISTRIBUTION')
+out.append('-'*70)
+out.append(f'Static Weights:')
 for k, v in static_pred['weights'].items():
-    print(f'  {k:20s}: {v:6.1%}')
+    out.append(f'  {k:20s}: {v:6.1%}')
 
-print(f'\nAdaptive Weights:')
+out.append(f'\nAdaptive Weights:')
 for k, v in adaptive_pred['weights'].items():
-    print(f'  {k:20s}: {v:6.1%}')
-
-print(f'\n💰 TRADING LEVELS')
-print('-'*70)
-print(f'If LONG:')
-print(f'  Entry:              ${df["Close"].iloc[-1]:.2f}')
-print(f'  Stop Loss:          ${levels["long_stop_loss"]:.2f}')
-print(f'  Take Profit:        ${levels["long_take_profit"]:.2f}')
-print(f'  Risk/Reward:        1:{levels["risk_reward_ratio"]:.1f}')
-
-print(f'\nIf SHORT:')
-print(f'  Entry:              ${df["Close"].iloc[-1]:.2f}')
-print(f'  Stop Loss:          ${levels["short_stop_loss"]:.2f}')
-print(f'  Take Profit:        ${levels["short_take_profit"]:.2f}')
-print(f'  Risk/Reward:        1:{levels["risk_reward_ratio"]:.1f}')
-
-print(f'\n🔍 SIGNAL COMPONENTS (Adaptive Weights)')
-print('-'*70)
+    out.append(f'  {k:20s}: {v:6.1%}')
+
+out.append(f'\n💰 TRADING LEVELS')
+out.append('-'*70)
+out.append(f'If LONG:')
+out.append(f'  Entry:              ${last_close:.2f}')
+out.append(f'  Stop Loss:          ${levels["long_stop_loss"]:.2f}')
+out.append(f'  Take Profit:        ${levels["long_take_profit"]:.2f}')
+out.append(f'  Risk/Reward:        1:{levels["risk_reward_ratio"]:.1f}')
+
+out.append(f'\nIf SHORT:')
+out.append(f'  Entry:              ${last_close:.2f}')
+out.append(f'  Stop Loss:          ${levels["short_stop_loss"]:.2f}')
+out.append(f'  Take Profit:        ${levels["short_take_profit"]:.2f}')
+out.append(f'  Risk/Reward:        1:{levels["risk_reward_ratio"]:.1f}')
+
+out.append(f'\n🔍 SIGNAL COMPONENTS (Adaptive Weights)')
+out.append('-'*70)
 for signal in adaptive_pred['signals'][:10]:
-    print(f'  • {signal}')
+    out.append(f'  • {signal}')
 if len(adaptive_pred['signals']) > 10:
-    print(f'  ... and {len(adaptive_pred["signals"])-10} more')
+    out.append(f'  ... and {len(adaptive_pred["signals"])-10} more')
+
+out.append(f'\n' + '='*70)
 
-print(f'\n' + '='*70)
+sys.stdout.write('\n'.join(out) + '\n')
@@ -5,43 +5,133 @@ Fetches real-time data and generates predictions with trade signals
 """
 
 import asyncio
+import copy
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 from src.ibkr_connector import IBKRConnector
 from src.regime_weights import RegimeAdaptiveWeights
-from src.enhanced_predictor_adaptive import enhanced_prediction_adaptive, compute_enhanced_features
+from src._weights_cache import get_optimizer
+from src.enhanced_predictor_adaptive import (
+    enhanced_prediction_adaptive, compute_enhanced_features,
+    StreamingFeatureState, update_streaming_features, REQUIRED_LOOKBACK
+)
+
+
+# Signal strength label by confidence band: <50, 50-70, >=70
+SIGNAL_STRENGTHS = ("⚪ WEAK", "🟡 MODERATE", "🟢 STRONG")
+
+# Recommendation per direction (LONG, SHORT, other) x RSI band (<30, 30-70, >70),
+# followed by the low-confidence entry at NO_TRADE
+RECOMMENDATIONS = (
+    "🟢 BUY SIGNAL - RSI oversold, strong entry",
+    "🟢 BUY - {:.0f}% confidence",
+    "⚠️  WAIT - RSI overbought, watch for pullback",
+    "⚠️  WAIT - RSI oversold, watch for bounce",
+    "🔴 SELL - {:.0f}% confidence",
+    "🔴 SELL SIGNAL - RSI overbought, strong entry",
+    "⚪ NEUTRAL - Wait for clearer signal",
+    "⚪ NEUTRAL - Wait for clearer signal",
+    "⚪ NEUTRAL - Wait for clearer signal",
+    "❌ NO TRADE - Confidence too low",
+)
+NO_TRADE = 9
+
+_DIRECTION_CODES = {'LONG': 0, 'SHORT': 1}
 
 
 class IBKRLivePredictor:
-    """Real-time prediction engine using IBKR live data"""
+    """Real-time prediction engine using IBKR live data
+    
+    The IBKR connection is opened on first use and kept open between
+    predictions; close it with ``aclose()`` or use ``async with``.
+    """
     
     def __init__(self, host: str = '127.0.0.1', port: int = 7497):
         self.connector = IBKRConnector(host, port)
-        self.optimizer = RegimeAdaptiveWeights()
         
-        # Load pre-trained weights
+        # Load pre-trained weights (shared across instances)
         try:
-            self.optimizer.load_weights('models/regime_weights_20251210_135927.pkl')
+            self.optimizer = get_optimizer()
         except Exception as e:
             print(f"Warning: Could not load weights: {e}")
+            self.optimizer = RegimeAdaptiveWeights()
+        
+        # Streaming feature state per (symbol, bar size): (state with every bar
+        # but the newest folded in, time of the last bar folded into it)
+        self._feature_states: Dict[Tuple[str, str], Tuple[StreamingFeatureState, object]] = {}
+    
+    async def __aenter__(self) -> 'IBKRLivePredictor':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
     
-    async def predict_live(self, symbol: str, duration: int = 60, 
+    async def _ensure_connected(self) -> bool:
+        """Connect on first use, or reconnect if the session has dropped"""
+        if self.connector.connected:
+            if self.connector.ib.isConnected():
+                return True
+            self.connector.disconnect()  # Stale session
+        return await self.connector.connect()
+    
+    async def aclose(self):
+        """Close the IBKR connection held open between predictions"""
+        self.connector.disconnect()
+    
+    def _update_features(self, symbol: str, bar_size: str, df: pd.DataFrame) -> Dict[str, float]:
+        """
+        Fold only the bars newer than the previous call into the symbol's
+        streaming feature state, instead of recomputing every indicator
+        over the whole window.
+        
+        The newest bar may still be forming, so it is never kept in the
+        state: it is folded into a copy for this call's features and folded
+        again, with its final values, on the next call. The state is rebuilt
+        from ``df`` on the first call, or when the previously folded bar has
+        dropped out of the fetched window.
+        """
+        if 'DateTime' not in df.columns or len(df) < 2:
+            return compute_enhanced_features(df)
+        
+        key = (symbol, bar_size)
+        times = df['DateTime']
+        entry = self._feature_states.get(key)
+        start = 0
+        if entry is not None:
+            state, last_time = entry
+            start = int(times.searchsorted(last_time, side='right'))
+        if start == 0 or start == len(df):
+            # No overlap with the previous window: start over
+            state = StreamingFeatureState(window=len(df))
+            start = 0
+        
+        bars = df.iloc[start:][['High', 'Low', 'Close', 'Volume']].to_dict('records')
+        for bar in bars[:-1]:
+            state, _ = update_streaming_features(state, bar)
+        self._feature_states[key] = (state, times.iloc[-2])
+        
+        _, features = update_streaming_features(copy.deepcopy(state), bars[-1])
+        return features
+    
+    async def predict_live(self, symbol: str, duration: int = REQUIRED_LOOKBACK, 
                           bar_size: str = '1 min') -> Optional[Dict]:
         """
         Generate prediction using live IBKR data
         
         Args:
             symbol: Stock ticker (e.g., 'AAPL')
-            duration: Minutes of history to fetch
+            duration: Minutes of history to fetch (bars beyond the
+                feature lookback are dropped)
             bar_size: Bar size ('1 min', '5 mins', '15 mins', '1 hour')
         
         Returns:
             Dictionary with prediction, confidence, and trading levels
         """
         try:
-            # Connect to IBKR
-            connected = await self.connector.connect()
+            # Connect to IBKR (reusing the open session)
+            connected = await self._ensure_connected()
             if not connected:
                 return self._error_response("Failed to connect to IBKR")
             
@@ -49,73 +139,111 @@ class IBKRLivePredictor:
             contract = self.connector.create_stock(symbol)
             df = await self.connector.get_market_data(contract, duration, bar_size)
             
-            if df is None or len(df) < 20:
-                self.connector.disconnect()
-                return self._error_response(f"Insufficient data (got {len(df) if df is not None else 0} candles)")
-            
-            # Reset index
-            df = df.reset_index(drop=True)
-            if isinstance(df.columns, pd.MultiIndex):
-                df.columns = df.columns.get_level_values(0)
-            
-            # Get current price
-            current_price = df['Close'].iloc[-1]
-            
-            # Compute features
-            features = compute_enhanced_features(df)
-            
-            # Get prediction
-            prediction = enhanced_prediction_adaptive(features, self.optimizer, use_adaptive_weights=True)
-            
-            # Extract metrics
-            direction = prediction.get('direction', 'NEUTRAL').upper()
-            confidence = prediction.get('confidence', 0)
-            
-            # Calculate trading levels
-            atr = features['atr']
-            rsi = features['rsi']
-            adx = features['adx']
-            
-            entry_price = current_price
-            stop_loss = entry_price - atr if direction == 'LONG' else entry_price + atr
-            take_profit = entry_price + (atr * 2) if direction == 'LONG' else entry_price - (atr * 2)
+            return self._predict_from_data(symbol, df, bar_size)
+        
+        except Exception as e:
+            return self._error_response(f"Prediction error: {str(e)}")
+    
+    async def predict_many(self, symbols: List[str], duration: int = REQUIRED_LOOKBACK,
+                           bar_size: str = '1 min') -> Dict[str, Dict]:
+        """
+        Generate predictions for several symbols over one connection
+        
+        Market data requests are issued concurrently; features and
+        predictions are then computed for each symbol in turn.
+        
+        Args:
+            symbols: Stock tickers
+            duration: Minutes of history to fetch (bars beyond the
+                feature lookback are dropped)
+            bar_size: Bar size ('1 min', '5 mins', '15 mins', '1 hour')
+        
+        Returns:
+            Dictionary mapping each symbol to its prediction (or error) result
+        """
+        connected = await self._ensure_connected()
+        if not connected:
+            return {s: self._error_response("Failed to connect to IBKR") for s in symbols}
+        
+        dfs = await asyncio.gather(
+            *(self.connector.get_market_data(self.connector.create_stock(s), duration, bar_size)
+              for s in symbols),
+            return_exceptions=True
+        )
+        
+        results = {}
+        for symbol, df in zip(symbols, dfs):
+            try:
+                if isinstance(df, BaseException):
+                    raise df
+                results[symbol] = self._predict_from_data(symbol, df, bar_size)
+            except Exception as e:
+                results[symbol] = self._error_response(f"Prediction error: {str(e)}")
+        return results
+    
+    def _predict_from_data(self, symbol: str, df: Optional[pd.DataFrame],
+                           bar_size: str) -> Dict:
+        """Build the prediction result for one symbol from fetched bars"""
+        if df is None or len(df) < 20:
+            return self._error_response(f"Insufficient data (got {len(df) if df is not None else 0} candles)")
+        
+        # Connector frames already have flat OHLCV columns; features only
+        # need the trailing lookback window
+        if len(df) > REQUIRED_LOOKBACK:
+            df = df.tail(REQUIRED_LOOKBACK)
+        # Get current price
+        current_price = df['Close'].iloc[-1]
+        
+        # Compute features (incrementally across calls)
+        features = self._update_features(symbol, bar_size, df)
+        
+        # Get prediction
+        prediction = enhanced_prediction_adaptive(features, self.optimizer, use_adaptive_weights=True)
+        
+        # Extract metrics
+        direction = prediction.get('direction', 'NEUTRAL').upper()
+        confidence = prediction.get('confidence', 0)
+        
+        # Calculate trading levels
+        atr = features['atr']
+        rsi = features['rsi']
+        adx = features['adx']
+        
+        entry_price = current_price
+        stop_loss = entry_price - atr if direction == 'LONG' else entry_price + atr
+        take_profit = entry_price + (atr * 2) if direction == 'LONG' else entry_price - (atr * 2)
+        
+        risk = abs(entry_price - stop_loss)
+        reward = abs(take_profit - entry_price)
+        risk_reward = reward / risk if risk > 0 else 0
+        
+        result = {
+            'timestamp': datetime.now().isoformat(),
+            'symbol': symbol,
+            'current_price': current_price,
+            'direction': direction,
+            'confidence': confidence,
+            'signal_strength': self._get_signal_strength(confidence),
             
-            risk = abs(entry_price - stop_loss)
-            reward = abs(take_profit - entry_price)
-            risk_reward = reward / risk if risk > 0 else 0
+            # Trading Levels
+            'entry': entry_price,
+            'stop_loss': stop_loss,
+            'take_profit': take_profit,
+            'risk_reward_ratio': risk_reward,
             
-            result = {
-                'timestamp': datetime.now().isoformat(),
-                'symbol': symbol,
-                'current_price': current_price,
-                'direction': direction,
-                'confidence': confidence,
-                'signal_strength': self._get_signal_strength(confidence),
-                
-                # Trading Levels
-                'entry': entry_price,
-                'stop_loss': stop_loss,
-                'take_profit': take_profit,
-                'risk_reward_ratio': risk_reward,
-                
-                # Technical Indicators
-                'rsi': rsi,
-                'adx': adx,
-                'atr': atr,
-                'atr_percent': (atr / current_price * 100),
-                
-                # Recommendation
-                'recommendation': self._get_recommendation(direction, confidence, rsi, adx),
-                'data_points': len(df),
-                'bar_size': bar_size
-            }
+            # Technical Indicators
+            'rsi': rsi,
+            'adx': adx,
+            'atr': atr,
+            'atr_percent': (atr / current_price * 100),
             
-            self.connector.disconnect()
-            return result
+            # Recommendation
+            'recommendation': self._get_recommendation(direction, confidence, rsi, adx),
+            'data_points': len(df),
+            'bar_size': bar_size
+        }
         
-        except Exception as e:
-            self.connector.disconnect()
-            return self._error_response(f"Prediction error: {str(e)}")
+        return result
     
     @staticmethod
     def _error_response(message: str) -> Dict:
@@ -129,37 +257,40 @@ class IBKRLivePredictor:
     @staticmethod
     def _get_signal_strength(confidence: float) -> str:
         """Get signal strength label"""
-        if confidence >= 70:
-            return "🟢 STRONG"
-        elif confidence >= 50:
-            return "🟡 MODERATE"
-        else:
-            return "⚪ WEAK"
+        return SIGNAL_STRENGTHS[int(confidence >= 50) + int(confidence >= 70)]
     
     @staticmethod
     def _get_recommendation(direction: str, confidence: float, rsi: float, adx: float) -> str:
         """Generate trading recommendation"""
         if confidence < 40:
-            return "❌ NO TRADE - Confidence too low"
-        
-        if direction == 'LONG':
-            if rsi > 70:
-                return "⚠️  WAIT - RSI overbought, watch for pullback"
-            elif rsi < 30:
-                return "🟢 BUY SIGNAL - RSI oversold, strong entry"
-            else:
-                return f"🟢 BUY - {confidence:.0f}% confidence"
-        
-        elif direction == 'SHORT':
-            if rsi < 30:
-                return "⚠️  WAIT - RSI oversold, watch for bounce"
-            elif rsi > 70:
-                return "🔴 SELL SIGNAL - RSI overbought, strong entry"
-            else:
-                return f"🔴 SELL - {confidence:.0f}% confidence"
-        
-        else:
-            return "⚪ NEUTRAL - Wait for clearer signal"
+            return RECOMMENDATIONS[NO_TRADE]
+        idx = 3 * _DIRECTION_CODES.get(direction, 2) + 1 - int(rsi < 30) + int(rsi > 70)
+        return RECOMMENDATIONS[idx].format(confidence)
+
+
+def signal_strengths_batch(confidences: np.ndarray) -> np.ndarray:
+    """Vectorized ``_get_signal_strength`` over an array of confidences."""
+    confidences = np.asarray(confidences, dtype=np.float64)
+    idx = (confidences >= 50).astype(np.intp) + (confidences >= 70)
+    return np.asarray(SIGNAL_STRENGTHS, dtype=object)[idx]
+
+
+def recommendations_batch(directions: np.ndarray, confidences: np.ndarray,
+                          rsis: np.ndarray) -> np.ndarray:
+    """Vectorized ``_get_recommendation`` over per-symbol arrays."""
+    directions = np.asarray(directions)
+    confidences = np.asarray(confidences, dtype=np.float64)
+    rsis = np.asarray(rsis, dtype=np.float64)
+    
+    direction_idx = np.select([directions == 'LONG', directions == 'SHORT'], [0, 1], 2)
+    rsi_idx = 1 - (rsis < 30).astype(np.intp) + (rsis > 70)
+    idx = np.where(confidences < 40, NO_TRADE, 3 * direction_idx + rsi_idx)
+    
+    out = np.asarray(RECOMMENDATIONS, dtype=object)[idx]
+    # Only the mid-RSI BUY/SELL entries embed the confidence
+    templated = np.flatnonzero((idx == 1) | (idx == 4))
+    out[templated] = [out[i].format(confidences[i]) for i in templated]
+    return out
 
 
 async def print_prediction(result: Dict):
@@ -208,11 +339,10 @@ async def main():
     """Main demo function"""
     print("Starting IBKR Live Predictor...\n")
     
-    predictor = IBKRLivePredictor()
-    
-    # Example: Predict AAPL
-    print("Fetching live AAPL data and generating prediction...")
-    result = await predictor.predict_live('AAPL', duration=60, bar_size='1 min')
+    async with IBKRLivePredictor() as predictor:
+        # Example: Predict AAPL
+        print("Fetching live AAPL data and generating prediction...")
+        result = await predictor.predict_live('AAPL', bar_size='1 min')
     
     await print_prediction(result)
 
@@ -4,20 +4,54 @@ S&P 500 Growth Watchlist Manager
 Quickly access today's top opportunities and set up trading alerts
 """
 
+import os
+from operator import itemgetter
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
 import sys
 
+try:
+    import pyarrow  # noqa: F401  Enables pandas' multithreaded Arrow CSV parser
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+# Confidence bar for each filled-cell count 0-20 (one cell per 5%)
+CONFIDENCE_BARS = tuple("█" * n + "░" * (20 - n) for n in range(21))
+
+# Columns written by export_trading_list
+EXPORT_COLUMNS = ['Ticker', 'Current_Price', 'Growth_Probability_%', 'RSI', 'Momentum_5d_%']
+
+# (directory mtime, latest results filename) from the last directory scan
+_latest_cache = None
+
+def _latest_results_file():
+    """Name of the newest results CSV, rescanning only when the directory changes"""
+    global _latest_cache
+    dir_mtime = os.stat('.').st_mtime_ns
+    if _latest_cache is not None and _latest_cache[0] == dir_mtime:
+        return _latest_cache[1]
+    
+    with os.scandir('.') as entries:
+        latest = max(
+            ((e.name, e.stat().st_mtime_ns) for e in entries
+             if e.name.startswith('sp500_growth_') and e.name.endswith('.csv')),
+            key=itemgetter(1),
+            default=None
+        )
+    _latest_cache = (dir_mtime, latest[0] if latest else None)
+    return _latest_cache[1]
+
 def load_latest_results():
     """Load the most recent S&P 500 growth analysis"""
-    csv_files = list(Path('.').glob('sp500_growth_*.csv'))
-    if not csv_files:
+    latest = _latest_results_file()
+    if latest is None:
         print("❌ No results found. Run 'python find_sp500_growth.py' first.")
         return None
     
-    latest = max(csv_files, key=lambda p: p.stat().st_mtime)
-    return pd.read_csv(latest), str(latest)
+    return pd.read_csv(latest, engine=CSV_ENGINE), latest
 
 def display_top_stocks(df, limit=20):
     """Display top performing stocks"""
@@ -28,10 +62,17 @@ def display_top_stocks(df, limit=20):
     print("="*100)
     print()
     
-    for idx, (_, row) in enumerate(top.iterrows(), 1):
-        confidence_bar = "█" * int(row['Growth_Probability_%'] / 5) + "░" * (20 - int(row['Growth_Probability_%'] / 5))
-        print(f"{idx:2d}. {row['Ticker']:<6} {confidence_bar} {row['Growth_Probability_%']:>6.1f}%  |  "
-              f"Price: ${row['Current_Price']:>8.2f}  RSI: {row['RSI']:>5.1f}  Momentum: {row['Momentum_5d_%']:>6.2f}%")
+    confidence = top['Growth_Probability_%'].to_numpy()
+    bars = (confidence / 5).astype(int).clip(0, 20)
+    lines = (
+        f"{idx:2d}. {ticker:<6} {CONFIDENCE_BARS[bar]} {conf:>6.1f}%  |  "
+        f"Price: ${price:>8.2f}  RSI: {rsi:>5.1f}  Momentum: {mom:>6.2f}%"
+        for idx, ticker, bar, conf, price, rsi, mom in zip(
+            range(1, len(top) + 1), top['Ticker'].to_numpy(), bars, confidence,
+            top['Current_Price'].to_numpy(), top['RSI'].to_numpy(),
+            top['Momentum_5d_%'].to_numpy())
+    )
+    print("\n".join(lines))
     
     print()
 
@@ -48,20 +89,35 @@ def show_momentum_leaders(df, limit=10):
     print()
     
     top_momentum = df.nlargest(limit, 'Momentum_5d_%')
-    for idx, (_, row) in enumerate(top_momentum.iterrows(), 1):
-        print(f"{idx:2d}. {row['Ticker']:<6} Momentum: {row['Momentum_5d_%']:>7.2f}%  |  "
-              f"Price: ${row['Current_Price']:>8.2f}  Confidence: {row['Growth_Probability_%']:.0f}%")
+    lines = (
+        f"{idx:2d}. {ticker:<6} Momentum: {mom:>7.2f}%  |  "
+        f"Price: ${price:>8.2f}  Confidence: {conf:.0f}%"
+        for idx, ticker, mom, price, conf in zip(
+            range(1, len(top_momentum) + 1), top_momentum['Ticker'].to_numpy(),
+            top_momentum['Momentum_5d_%'].to_numpy(),
+            top_momentum['Current_Price'].to_numpy(),
+            top_momentum['Growth_Probability_%'].to_numpy())
+    )
+    print("\n".join(lines))
     print()
 
-def show_technical_summary(df, ticker):
+def build_ticker_map(df):
+    """Map each ticker to the position of its first row in df"""
+    tickers = df['Ticker'].to_numpy()
+    # Filled back to front so duplicates keep their first position
+    return {t: i for i, t in zip(range(len(tickers) - 1, -1, -1), tickers[::-1])}
+
+def show_technical_summary(df, ticker, ticker_map=None):
     """Show detailed technical summary for a stock"""
-    stock = df[df['Ticker'] == ticker.upper()]
+    if ticker_map is None:
+        ticker_map = build_ticker_map(df)
+    pos = ticker_map.get(ticker.upper())
     
-    if stock.empty:
+    if pos is None:
         print(f"❌ {ticker} not found in results")
         return
     
-    row = stock.iloc[0]
+    row = df.iloc[pos]
     
     print("\n" + "="*100)
     print(f"📊 TECHNICAL SUMMARY: {row['Ticker']}")
@@ -103,9 +159,11 @@ def export_trading_list(df, confidence_threshold=75, filename=None):
     if filename is None:
         filename = f"watchlist_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
     
-    filtered = filter_by_confidence(df, confidence_threshold)
-    filtered = filtered[['Ticker', 'Current_Price', 'Growth_Probability_%', 'RSI', 'Momentum_5d_%']].copy()
-    filtered.to_csv(filename, index=False)
+    # Filter and project in one .loc selection (a single copy)
+    mask = df['Growth_Probability_%'].to_numpy() >= confidence_threshold
+    filtered = df.loc[mask, EXPORT_COLUMNS].sort_values('Growth_Probability_%', ascending=False)
+    # Results are stored to at most 2 decimals, so this is lossless
+    filtered.to_csv(filename, index=False, float_format='%.2f')
     
     print(f"✓ Exported {len(filtered)} stocks to {filename}")
     return filename
@@ -118,6 +176,7 @@ def show_menu():
         return
     
     print(f"\n✓ Loaded {len(df)} stocks from {Path(csv_path).name}")
+    ticker_map = build_ticker_map(df)
     
     while True:
         print("\n" + "="*100)
@@ -147,7 +206,7 @@ def show_menu():
                 print(f"  {idx:2d}. {row['Ticker']:<6} {row['Growth_Probability_%']:>6.1f}%")
         elif choice == '4':
             ticker = input("Enter ticker symbol: ").strip()
-            show_technical_summary(df, ticker)
+            show_technical_summary(df, ticker, ticker_map)
         elif choice == '5':
             threshold = float(input("Export stocks with ≥ confidence (default 75): ") or "75")
             export_trading_list(df, threshold)
@@ -156,16 +215,21 @@ def show_menu():
             print("📈 STATISTICS")
             print("="*100)
             print()
+            confidence = df['Growth_Probability_%']
+            conf_stats = confidence.agg(['mean', 'max', 'min'])
+            # One sort, then each threshold count is a binary search
+            probs = np.sort(confidence.dropna().to_numpy())
+            count_ge = lambda t: probs.size - np.searchsorted(probs, t, side='left')
             print(f"  Total Stocks Analyzed: {len(df)}")
-            print(f"  Average Confidence:    {df['Growth_Probability_%'].mean():.1f}%")
-            print(f"  Highest Confidence:    {df['Growth_Probability_%'].max():.1f}%")
-            print(f"  Lowest Confidence:     {df['Growth_Probability_%'].min():.1f}%")
+            print(f"  Average Confidence:    {conf_stats['mean']:.1f}%")
+            print(f"  Highest Confidence:    {conf_stats['max']:.1f}%")
+            print(f"  Lowest Confidence:     {conf_stats['min']:.1f}%")
             print()
-            print(f"  Stocks ≥ 100%: {len(df[df['Growth_Probability_%'] == 100.0])}")
-            print(f"  Stocks ≥ 90%:  {len(df[df['Growth_Probability_%'] >= 90])}")
-            print(f"  Stocks ≥ 80%:  {len(df[df['Growth_Probability_%'] >= 80])}")
-            print(f"  Stocks ≥ 70%:  {len(df[df['Growth_Probability_%'] >= 70])}")
-            print(f"  Stocks ≥ 60%:  {len(df[df['Growth_Probability_%'] >= 60])}")
+            print(f"  Stocks ≥ 100%: {count_ge(100.0)}")
+            print(f"  Stocks ≥ 90%:  {count_ge(90)}")
+            print(f"  Stocks ≥ 80%:  {count_ge(80)}")
+            print(f"  Stocks ≥ 70%:  {count_ge(70)}")
+            print(f"  Stocks ≥ 60%:  {count_ge(60)}")
             print()
             print(f"  Avg 5-Day Momentum:    {df['Momentum_5d_%'].mean():+.2f}%")
             print(f"  Avg RSI:               {df['RSI'].mean():.1f}")
@@ -0,0 +1,19 @@
+"""Optional Numba support.
+
+Exposes ``njit`` and ``prange`` from numba when it is installed, and
+pure-Python stand-ins otherwise so JIT-decorated kernels still run (just
+without compilation).
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op replacement for ``numba.njit``."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
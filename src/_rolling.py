@@ -0,0 +1,34 @@
+"""Optional bottleneck support for moving-window statistics.
+
+``rolling`` computes ``series.rolling(window).<stat>()`` with bottleneck's C
+``move_*`` functions when bottleneck is installed, and with pandas otherwise.
+Either way windows holding a NaN, and the first ``window - 1`` bars, are NaN.
+"""
+
+import numpy as np
+import pandas as pd
+
+try:
+    import bottleneck as bn  # Optional C moving-window functions
+except ImportError:
+    bn = None
+
+
+def rolling(series: pd.Series, window: int, stat: str) -> pd.Series:
+    """Moving ``stat`` ('mean', 'std', 'min' or 'max') of ``series``.
+
+    Matches ``getattr(series.rolling(window), stat)()``, including the
+    sample (ddof=1) standard deviation.
+    """
+    if bn is None:
+        return getattr(series.rolling(window), stat)()
+
+    values = series.to_numpy(dtype=np.float64)
+    if len(values) < window:
+        # bottleneck rejects windows longer than the input
+        out = np.full(len(values), np.nan)
+    elif stat == 'std':
+        out = bn.move_std(values, window, min_count=window, ddof=1)
+    else:
+        out = getattr(bn, 'move_' + stat)(values, window, min_count=window)
+    return pd.Series(out, index=series.index, name=series.name)
@@ -0,0 +1,40 @@
+"""Least-squares slope of equally spaced prices.
+
+For times t = 0..n-1 the centred times sum to zero, so the regression slope is
+a dot product with fixed per-length weights. Five-bar windows (the backtests'
+window size) use the exact difference form instead, which is exactly 0 on
+symmetric windows where the dot product can leave rounding noise of either sign.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def slope_weights(n: int) -> np.ndarray:
+    """Least-squares slope weights (t - mean(t)) / sum((t - mean(t))**2) for t = 0..n-1."""
+    t = np.arange(n) - (n - 1) / 2.0
+    weights = t / (t @ t)
+    weights.flags.writeable = False
+    return weights
+
+
+def slope5(p: np.ndarray) -> np.ndarray:
+    """Slope of 5-bar windows along the last axis: (2*(p4 - p0) + (p3 - p1)) / 10."""
+    return (2.0 * (p[..., 4] - p[..., 0]) + (p[..., 3] - p[..., 1])) / 10.0
+
+
+def window_slopes(windows: np.ndarray) -> np.ndarray:
+    """Slope of each window along the last axis (at least 2 bars)."""
+    if windows.shape[-1] == 5:
+        return slope5(windows)
+    return windows @ slope_weights(windows.shape[-1])
+
+
+def compute_slope(prices: np.ndarray) -> float:
+    """Compute linear regression slope of prices."""
+    prices = np.asarray(prices, dtype=np.float64)
+    if len(prices) < 2:
+        return 0.0
+    return float(window_slopes(prices))
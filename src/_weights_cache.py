@@ -0,0 +1,38 @@
+"""Process-wide cache of trained ``RegimeAdaptiveWeights``.
+
+Prediction scripts and the IBKR predictor all load the same weights pickle.
+``get_optimizer`` loads it once per (path, mtime) and hands back the shared
+instance, so repeated calls in one process skip the unpickle and a retrained
+file on disk is picked up automatically.
+"""
+
+import os
+import sys
+from functools import lru_cache
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from regime_weights import RegimeAdaptiveWeights
+
+DEFAULT_WEIGHTS_PATH = 'models/regime_weights_20251210_135927.pkl'
+
+
+@lru_cache(maxsize=4)
+def _load_optimizer(path: str, mtime_ns: int) -> RegimeAdaptiveWeights:
+    optimizer = RegimeAdaptiveWeights()
+    optimizer.load_weights(path)
+    return optimizer
+
+
+def get_optimizer(path: str = DEFAULT_WEIGHTS_PATH) -> RegimeAdaptiveWeights:
+    """Return the shared optimizer for a weights file.
+
+    Args:
+        path: Weights file written by ``RegimeAdaptiveWeights.save_weights``
+            (pickle) or ``save_npz`` (.npz)
+
+    Returns:
+        Loaded RegimeAdaptiveWeights (shared; treat as read-only)
+    """
+    path = os.path.abspath(path)
+    return _load_optimizer(path, os.stat(path).st_mtime_ns)
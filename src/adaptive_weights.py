@@ -1,19 +1,36 @@
 """Adaptive weight optimizer using machine learning.
 
 This module learns optimal indicator weights from historical backtest performance
-using XGBoost and RandomForest models. Weights are adjusted based on market regime.
+using HistGradientBoosting and RandomForest models. Weights are adjusted based on market regime.
 """
 
 from typing import Dict, Tuple, List
+import os
+import sys
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.preprocessing import StandardScaler
-from sklearn.model_selection import train_test_split
 import warnings
 
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _mmap_pickle import map_pickle
+
 warnings.filterwarnings("ignore")
 
+# Below this many training rows, worker start-up and per-worker data copies
+# cost more than parallel tree building saves
+PARALLEL_MIN_SAMPLES = 50_000
+
+# Features contributing to each weight category
+CATEGORY_FEATURES = {
+    'trend': ['slope', 'sma_20', 'sma_50', 'ema_12', 'ema_26'],
+    'momentum': ['rsi', 'macd', 'macd_signal', 'macd_histogram'],
+    'volatility': ['bb_position', 'atr_percent', 'volatility'],
+    'trend_strength': ['adx'],
+    'stochastic': ['k_stoch', 'd_stoch']
+}
+
 
 class AdaptiveWeightOptimizer:
     """Learn indicator weights from historical performance data."""
@@ -22,12 +39,15 @@ class AdaptiveWeightOptimizer:
         """Initialize optimizer with specified model.
         
         Args:
-            model_type: "random_forest" or "xgboost"
+            model_type: "random_forest" or "hgb" ("xgboost" is an alias for "hgb")
         """
         self.model_type = model_type
         self.models = {}  # Separate model for each weight category
         self.scalers = {}
         self.feature_names = None
+        self._name_to_idx = {}
+        self._category_indices = {}
+        self._importances = None  # model.feature_importances_, fixed after training
         self.is_trained = False
         
     def prepare_training_data(self, 
@@ -53,7 +73,9 @@ class AdaptiveWeightOptimizer:
         
         self.feature_names = X.columns.tolist()
         
-        return X, y
+        # Indicator values don't need float64; float32 halves what the scaler and
+        # tree splitter have to move through memory
+        return X.astype(np.float32), y.astype(np.int8)
     
     def train(self, X: pd.DataFrame, y: pd.Series, test_size: float = 0.2):
         """Train models to predict indicator importance.
@@ -63,16 +85,37 @@ class AdaptiveWeightOptimizer:
             y: Target values (1 = correct prediction, 0 = incorrect)
             test_size: Proportion of data for testing
         """
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=test_size, random_state=42
-        )
+        # sklearn is only needed for training; importing it here keeps it off
+        # the prediction path, which only reads the fitted importances
+        from sklearn.ensemble import HistGradientBoostingRegressor, RandomForestRegressor
+        from sklearn.inspection import permutation_importance
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.model_selection import train_test_split
+        
+        if hasattr(X, 'columns'):
+            self.feature_names = X.columns.tolist()
+        X = np.asarray(X, dtype=np.float32)
+        y = np.asarray(y, dtype=np.int8)
+        
+        # Split data, stratified on the correct/incorrect label so the test
+        # score isn't skewed by an unlucky class balance
+        try:
+            X_train, X_test, y_train, y_test = train_test_split(
+                X, y, test_size=test_size, random_state=42, stratify=y
+            )
+        except ValueError:
+            # A class too small to stratify (e.g. all predictions correct)
+            X_train, X_test, y_train, y_test = train_test_split(
+                X, y, test_size=test_size, random_state=42
+            )
         
-        # Scale features
-        scaler = StandardScaler()
+        # Scale features (the split arrays are fresh copies, so scale in place)
+        scaler = StandardScaler(copy=False)
         X_train_scaled = scaler.fit_transform(X_train)
         X_test_scaled = scaler.transform(X_test)
         
+        n_jobs = -1 if X_train.shape[0] > PARALLEL_MIN_SAMPLES else 1
+        
         # Train model
         if self.model_type == "random_forest":
             model = RandomForestRegressor(
@@ -80,8 +123,20 @@ class AdaptiveWeightOptimizer:
                 max_depth=5,  # Reduced from 10 - prevent overfitting
                 min_samples_split=10,  # Increased from 5
                 min_samples_leaf=5,  # Increased from 2
+                max_features='sqrt',
+                bootstrap=True,
+                max_samples=0.5,  # Half-size bootstrap samples per tree
                 random_state=42,
-                n_jobs=-1
+                n_jobs=n_jobs
+            )
+        elif self.model_type in ("hgb", "xgboost"):
+            # Histogram-binned boosting: far faster and lighter than bagged full trees
+            model = HistGradientBoostingRegressor(
+                max_iter=100,
+                max_depth=5,
+                learning_rate=0.05,
+                early_stopping=True,
+                random_state=42
             )
         else:
             raise ValueError(f"Unknown model type: {self.model_type}")
@@ -104,6 +159,14 @@ class AdaptiveWeightOptimizer:
         # Store model and scaler
         self.models['main'] = model
         self.scalers['main'] = scaler
+        if hasattr(model, 'feature_importances_'):
+            self._importances = model.feature_importances_.copy()
+        else:
+            # Boosted models have no impurity importances; use held-out permutation importance
+            self._importances = permutation_importance(
+                model, X_test_scaled, y_test, n_repeats=5, random_state=42, n_jobs=n_jobs
+            ).importances_mean.clip(min=0.0)
+        self._index_features()
         self.is_trained = True
         
         return train_score, test_score
@@ -120,21 +183,18 @@ class AdaptiveWeightOptimizer:
         if not self.is_trained:
             return self._default_weights()
         
-        # Prepare features for prediction
-        feature_values = np.array([features.get(name, 0.0) for name in self.feature_names]).reshape(1, -1)
-        
-        # Scale features
-        scaler = self.scalers['main']
-        feature_scaled = scaler.transform(feature_values)
-        
-        # Get feature importance from model
-        model = self.models['main']
-        importances = model.feature_importances_
-        
-        # Map importance to indicator categories
-        weights = self._map_importance_to_weights(importances, features)
-        
-        return weights
+        # Importances are global to the fitted model, so the current feature
+        # values don't enter into the weights
+        return self._map_importance_to_weights(self._importances, features)
+    
+    def _index_features(self):
+        """Precompute feature-name and per-category index lookups."""
+        self._name_to_idx = {name: i for i, name in enumerate(self.feature_names or [])}
+        self._category_indices = {
+            category: np.array([self._name_to_idx[f] for f in feature_list if f in self._name_to_idx],
+                               dtype=np.int64)
+            for category, feature_list in CATEGORY_FEATURES.items()
+        }
     
     def _map_importance_to_weights(self, importances: np.ndarray, features: Dict) -> Dict[str, float]:
         """Map feature importance scores to weight categories.
@@ -154,27 +214,12 @@ class AdaptiveWeightOptimizer:
             'stochastic': 0.0
         }
         
-        # Map features to categories
-        category_mapping = {
-            'trend': ['slope', 'sma_20', 'sma_50', 'ema_12', 'ema_26'],
-            'momentum': ['rsi', 'macd', 'macd_signal', 'macd_histogram'],
-            'volatility': ['bb_position', 'atr_percent', 'volatility'],
-            'trend_strength': ['adx'],
-            'stochastic': ['k_stoch', 'd_stoch']
-        }
-        
-        # Accumulate importance scores for each category
-        for category, feature_list in category_mapping.items():
-            score = 0.0
-            count = 0
-            for feature in feature_list:
-                if feature in self.feature_names:
-                    idx = self.feature_names.index(feature)
-                    if idx < len(importances):
-                        score += importances[idx]
-                        count += 1
-            if count > 0:
-                weights[category] = score / count
+        # Average importance over each category's precomputed feature indices
+        n_importances = len(importances)
+        for category, idxs in self._category_indices.items():
+            idxs = idxs[idxs < n_importances]
+            if idxs.size:
+                weights[category] = float(importances[idxs].mean())
         
         # Normalize weights to sum to 1
         total = sum(weights.values())
@@ -237,20 +282,23 @@ class AdaptiveWeightOptimizer:
                 'model': self.models.get('main'),
                 'scaler': self.scalers.get('main'),
                 'feature_names': self.feature_names,
-                'model_type': self.model_type
-            }, f)
+                'model_type': self.model_type,
+                'importances': self._importances
+            }, f, protocol=5)
         print(f"Model saved to {filepath}")
     
     def load_model(self, filepath: str):
         """Load trained model from file."""
-        import pickle
-        with open(filepath, 'rb') as f:
-            data = pickle.load(f)
-            self.models['main'] = data['model']
-            self.scalers['main'] = data['scaler']
-            self.feature_names = data['feature_names']
-            self.model_type = data['model_type']
-            self.is_trained = True
+        data = map_pickle(filepath)
+        self.models['main'] = data['model']
+        self.scalers['main'] = data.get('scaler')
+        self.feature_names = data['feature_names']
+        self.model_type = data['model_type']
+        self._importances = data.get('importances')
+        if self._importances is None:
+            self._importances = self.models['main'].feature_importances_.copy()
+        self._index_features()
+        self.is_trained = True
         print(f"Model loaded from {filepath}")
 
 
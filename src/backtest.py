@@ -4,14 +4,23 @@ This module backtests the predictor on historical data to evaluate performance.
 It simulates trades based on predictions and calculates key metrics.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import partial
+import io
+import os
+import sys
 
 import pandas as pd
 import numpy as np
-import yfinance as yf
-import matplotlib.pyplot as plt
-from sklearn.linear_model import LinearRegression
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from data_cache import cached_history, fetch_bars
+from _njit import njit
+from _slope import compute_slope, window_slopes
 
 
 def _normalize_timezone(df: pd.DataFrame) -> pd.DataFrame:
@@ -21,14 +30,124 @@ def _normalize_timezone(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def _compute_slope(prices: np.ndarray) -> float:
-    """Compute linear regression slope of prices."""
-    if len(prices) < 2:
-        return 0.0
-    times = np.arange(len(prices)).reshape(-1, 1)
-    lr = LinearRegression()
-    lr.fit(times, prices)
-    return float(lr.coef_[0])
+def _rolling_scores(prices: np.ndarray, window: int) -> np.ndarray:
+    """``rule_based_prediction_4h`` score of every trailing window of ``prices``.
+    
+    Fuses ``compute_4h_features`` and the scoring rule, so no per-window
+    feature dict (or dict of feature arrays) is built.
+    
+    Args:
+        prices: Close prices
+        window: Window length (at least 2)
+    
+    Returns:
+        Int array of 0-3 scores, where entry k scores ``prices[k:k + window]``
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    if len(prices) < window:
+        return np.empty(0, dtype=int)
+    
+    windows = np.lib.stride_tricks.sliding_window_view(prices, window)
+    # The std of two points is |a - b| / sqrt(2), so rolling(2).std().mean()
+    # is the mean absolute step over the window divided by sqrt(2)
+    steps = np.lib.stride_tricks.sliding_window_view(np.abs(np.diff(prices)), window - 1)
+    # window_slopes uses the exact 5-bar difference form, so symmetric windows
+    # score a slope of exactly 0 like compute_4h_features does
+    score = (window_slopes(windows) > 0).astype(int)
+    score += windows[:, -1] / windows[:, 0] - 1.0 > 0
+    score += windows.std(axis=1, ddof=1) < steps.mean(axis=1) / np.sqrt(2.0)
+    return score
+
+
+# Trade exit reasons, indexed by the codes _simulate_positions returns
+_EXIT_REASONS = ("Stop Loss", "Take Profit", "End of Period")
+
+
+@njit(cache=True)
+def _simulate_positions(prices, is_up, initial_capital):
+    """Run the one-position long/short strategy bar by bar.
+    
+    When flat, each bar opens a LONG (stop -2%, target +4%) or SHORT
+    (stop +5%, target -5%) position in its predicted direction; open positions
+    exit at their stop or target, or at the last bar.
+    
+    Args:
+        prices: Close of each traded bar
+        is_up: Whether each bar's prediction is "Up"
+        initial_capital: Starting equity
+    
+    Returns:
+        Tuple of (number of trades, final equity, exit bar, entry price, exit
+        price, is_long, exit reason code) with per-trade arrays sized to the
+        number of bars
+    """
+    n = prices.shape[0]
+    exit_bar = np.empty(n, dtype=np.int64)
+    entries = np.empty(n, dtype=np.float64)
+    exits = np.empty(n, dtype=np.float64)
+    is_long = np.empty(n, dtype=np.bool_)
+    reasons = np.empty(n, dtype=np.int64)
+    
+    count = 0
+    equity = initial_capital
+    position = 0  # 1 long, -1 short, 0 flat
+    entry_price = 0.0
+    stop_loss = 0.0
+    take_profit = 0.0
+    
+    for i in range(n):
+        price = prices[i]
+        
+        # Generate entry signals
+        if position == 0:
+            entry_price = price
+            if is_up[i]:
+                position = 1
+                stop_loss = price * 0.98  # -2%
+                take_profit = price * 1.04  # +4%
+            else:
+                position = -1
+                stop_loss = price * 1.05  # +5%
+                take_profit = price * 0.95  # -5%
+        
+        # Check for exit conditions
+        if position == 1:
+            if price <= stop_loss:
+                reason = 0
+            elif price >= take_profit:
+                reason = 1
+            else:
+                continue
+            equity += price - entry_price
+        else:
+            if price >= stop_loss:
+                reason = 0
+            elif price <= take_profit:
+                reason = 1
+            else:
+                continue
+            equity += entry_price - price
+        
+        exit_bar[count] = i
+        entries[count] = entry_price
+        exits[count] = price
+        is_long[count] = position == 1
+        reasons[count] = reason
+        count += 1
+        position = 0
+    
+    # Close any open position at end
+    if position != 0:
+        price = prices[n - 1]
+        equity += price - entry_price if position == 1 else entry_price - price
+        exit_bar[count] = n - 1
+        entries[count] = entry_price
+        exits[count] = price
+        is_long[count] = position == 1
+        reasons[count] = 2
+        count += 1
+    
+    return count, equity, exit_bar, entries, exits, is_long, reasons
 
 
 def fetch_historical_4h(ticker: str, days: int = 60) -> pd.DataFrame:
@@ -41,27 +160,46 @@ def fetch_historical_4h(ticker: str, days: int = 60) -> pd.DataFrame:
     Returns:
         DataFrame with 4-hour OHLCV data
     """
-    t = yf.Ticker(ticker)
-    df = t.history(period=f"{days}d", interval="4h", actions=False)
+    # Served from the parquet cache in cache/ for up to an hour
+    df = cached_history(ticker, period=f"{days}d", interval="4h")
     if df.empty:
         raise RuntimeError(f"No data available for {ticker}")
     return _normalize_timezone(df)
 
 
-def compute_4h_features(df_4h: pd.DataFrame) -> Dict[str, float]:
+def _fetch_many(tickers: List[str], days: int = 60) -> Dict[str, pd.DataFrame]:
+    """Fetch 4-hour data for several tickers in one batched download.
+    
+    Args:
+        tickers: Ticker symbols
+        days: Number of days of historical data (default 60)
+    
+    Returns:
+        Dict of ticker -> 4-hour OHLCV DataFrame (tickers without data are omitted)
+    """
+    frames = fetch_bars(list(tickers), interval="4h", period=f"{days}d", actions=False)
+    return {ticker: _normalize_timezone(df) for ticker, df in frames.items()}
+
+
+def compute_4h_features(df_4h: Union[pd.DataFrame, np.ndarray]) -> Dict[str, float]:
     """Compute features for 4-hour timeframe analysis.
     
     Args:
-        df_4h: DataFrame with 4-hour OHLCV data
+        df_4h: DataFrame with 4-hour OHLCV data, or its Close prices as an array
     
     Returns:
         Dict with slope, last_return, volatility, avg_volatility
     """
-    prices = df_4h["Close"].values
-    slope = _compute_slope(prices)
-    last_return = (prices[-1] / prices[0] - 1.0) if len(prices) >= 2 else 0.0
-    volatility = float(df_4h["Close"].std())
-    avg_volatility = float(df_4h["Close"].rolling(window=2).std().mean())
+    if isinstance(df_4h, pd.DataFrame):
+        df_4h = df_4h["Close"].to_numpy()
+    prices = np.asarray(df_4h, dtype=np.float64)
+    slope = compute_slope(prices)
+    if len(prices) < 2:
+        return {"slope": slope, "last_return": 0.0, "volatility": float("nan"), "avg_volatility": float("nan")}
+    last_return = prices[-1] / prices[0] - 1.0
+    volatility = float(prices.std(ddof=1))
+    # rolling(2).std().mean(), as in _rolling_scores
+    avg_volatility = float(np.abs(np.diff(prices)).mean() / np.sqrt(2.0))
     return {"slope": slope, "last_return": last_return, "volatility": volatility, "avg_volatility": avg_volatility}
 
 
@@ -86,200 +224,132 @@ def rule_based_prediction_4h(features_4h: Dict) -> Tuple[str, int]:
     return prediction, score
 
 
-def backtest_ticker(ticker: str, days: int = 60, initial_capital: float = 10000):
-    """Backtest the predictor on historical data for a ticker."""
-    print(f"\n{'='*70}")
-    print(f"BACKTESTING {ticker}")
-    print(f"{'='*70}")
+def backtest_ticker(ticker: str, days: int = 60, initial_capital: float = 10000,
+                    df: Optional[pd.DataFrame] = None, verbose: bool = True):
+    """Backtest the predictor on historical data for a ticker.
     
-    try:
-        df = fetch_historical_4h(ticker, days=days)
-    except Exception as e:
-        print(f"Error fetching data: {e}")
-        return None
+    ``df`` can supply already-fetched 4-hour data; otherwise it is fetched here.
+    The report is printed in one write at the end unless ``verbose`` is False.
+    """
+    # Report lines, written to stdout in one go before returning
+    out = []
+    out.append(f"\n{'='*70}")
+    out.append(f"BACKTESTING {ticker}")
+    out.append(f"{'='*70}")
+    
+    if df is None:
+        try:
+            df = fetch_historical_4h(ticker, days=days)
+        except Exception as e:
+            out.append(f"Error fetching data: {e}")
+            if verbose:
+                sys.stdout.write('\n'.join(out) + '\n')
+            return None
     
-    trades = []
-    equity = initial_capital
-    position = None
-    entry_price = 0
     predictions = []  # Track all predictions and their outcomes
     
     # Backtest on rolling window
     window_size = 5  # Use last 5 periods for prediction
     
-    for i in range(window_size, len(df)):
-        # Get features from last window_size periods
-        df_window = df.iloc[i-window_size:i]
-        features = compute_4h_features(df_window)
-        prediction, score = rule_based_prediction_4h(features)
-        
-        current_price = df.iloc[i]["Close"]
-        current_time = df.index[i]
-        
-        # Calculate actual next candle movement for accuracy check
-        if i + 1 < len(df):
-            next_price = df.iloc[i + 1]["Close"]
-            actual_direction = "Up" if next_price > current_price else "Down"
-            price_change = ((next_price - current_price) / current_price) * 100
-            was_correct = prediction == actual_direction
-            
-            predictions.append({
-                "time": current_time,
-                "predicted": prediction,
-                "actual": actual_direction,
-                "correct": was_correct,
-                "price_change": price_change
-            })
-        
-        # Generate entry signals
-        if position is None and prediction == "Up":
-            # Open LONG position
-            position = "LONG"
-            entry_price = current_price
-            stop_loss = current_price * 0.98  # -2%
-            take_profit = current_price * 1.04  # +4%
-            
-        elif position is None and prediction == "Down":
-            # Open SHORT position
-            position = "SHORT"
-            entry_price = current_price
-            stop_loss = current_price * 1.05  # +5%
-            take_profit = current_price * 0.95  # -5%
-        
-        # Check for exit conditions
-        if position == "LONG":
-            if current_price <= stop_loss:
-                # Stop loss hit
-                pnl = current_price - entry_price
-                pnl_pct = (pnl / entry_price) * 100
-                equity += pnl
-                trades.append({
-                    "Entry": entry_price,
-                    "Exit": current_price,
-                    "Type": "LONG",
-                    "PnL": pnl,
-                    "PnL%": pnl_pct,
-                    "Reason": "Stop Loss",
-                    "Date": current_time
-                })
-                position = None
-                
-            elif current_price >= take_profit:
-                # Take profit hit
-                pnl = current_price - entry_price
-                pnl_pct = (pnl / entry_price) * 100
-                equity += pnl
-                trades.append({
-                    "Entry": entry_price,
-                    "Exit": current_price,
-                    "Type": "LONG",
-                    "PnL": pnl,
-                    "PnL%": pnl_pct,
-                    "Reason": "Take Profit",
-                    "Date": current_time
-                })
-                position = None
-        
-        elif position == "SHORT":
-            if current_price >= stop_loss:
-                # Stop loss hit
-                pnl = entry_price - current_price
-                pnl_pct = (pnl / entry_price) * 100
-                equity += pnl
-                trades.append({
-                    "Entry": entry_price,
-                    "Exit": current_price,
-                    "Type": "SHORT",
-                    "PnL": pnl,
-                    "PnL%": pnl_pct,
-                    "Reason": "Stop Loss",
-                    "Date": current_time
-                })
-                position = None
-                
-            elif current_price <= take_profit:
-                # Take profit hit
-                pnl = entry_price - current_price
-                pnl_pct = (pnl / entry_price) * 100
-                equity += pnl
-                trades.append({
-                    "Entry": entry_price,
-                    "Exit": current_price,
-                    "Type": "SHORT",
-                    "PnL": pnl,
-                    "PnL%": pnl_pct,
-                    "Reason": "Take Profit",
-                    "Date": current_time
-                })
-                position = None
+    close = df["Close"].to_numpy()
+    times = df.index
     
-    # Close any open position at end
-    if position is not None:
-        final_price = df.iloc[-1]["Close"]
-        if position == "LONG":
-            pnl = final_price - entry_price
-        else:
-            pnl = entry_price - final_price
-        pnl_pct = (pnl / entry_price) * 100
-        equity += pnl
-        trades.append({
-            "Entry": entry_price,
-            "Exit": final_price,
-            "Type": position,
-            "PnL": pnl,
-            "PnL%": pnl_pct,
-            "Reason": "End of Period",
-            "Date": df.index[-1]
+    # rule_based_prediction_4h for every window in one pass;
+    # bar i is predicted from the window close[i - window_size:i]
+    predicted = np.where(_rolling_scores(close[:-1], window_size) >= 2, "Up", "Down")
+    
+    # Actual next candle movement for accuracy check
+    if len(close) > window_size + 1:
+        current_prices = close[window_size:-1]
+        next_prices = close[window_size + 1:]
+        actual = np.where(next_prices > current_prices, "Up", "Down")
+        predictions = pd.DataFrame({
+            "time": times[window_size:-1],
+            "predicted": predicted[:-1],
+            "actual": actual,
+            "correct": predicted[:-1] == actual,
+            "price_change": (next_prices - current_prices) / current_prices * 100
         })
     
+    # Position state machine over every traded bar, compiled when numba is available
+    num_trades, equity, exit_bar, entries, exits, is_long, reasons = _simulate_positions(
+        close[window_size:].astype(np.float64), predicted == "Up", float(initial_capital))
+    
     # Calculate metrics
-    if len(trades) == 0:
-        print(f"No trades executed for {ticker}")
+    if num_trades == 0:
+        out.append(f"No trades executed for {ticker}")
+        if verbose:
+            sys.stdout.write('\n'.join(out) + '\n')
         return None
     
-    trades_df = pd.DataFrame(trades)
+    entries = entries[:num_trades]
+    exits = exits[:num_trades]
+    is_long = is_long[:num_trades]
+    pnl = np.where(is_long, exits - entries, entries - exits)
+    trades_df = pd.DataFrame({
+        "Entry": entries,
+        "Exit": exits,
+        "Type": np.where(is_long, "LONG", "SHORT"),
+        "PnL": pnl,
+        "PnL%": (pnl / entries) * 100,
+        "Reason": np.asarray(_EXIT_REASONS)[reasons[:num_trades]],
+        "Date": times[window_size + exit_bar[:num_trades]]
+    })
     
     total_return = ((equity - initial_capital) / initial_capital) * 100
-    winning_trades = len(trades_df[trades_df["PnL"] > 0])
-    losing_trades = len(trades_df[trades_df["PnL"] <= 0])
-    win_rate = (winning_trades / len(trades_df)) * 100 if len(trades_df) > 0 else 0
+    # All trade statistics from one win/loss mask over the PnL array
+    wins = pnl > 0
+    winning_trades = int(wins.sum())
+    losing_trades = num_trades - winning_trades
+    win_rate = (winning_trades / num_trades) * 100
     
-    avg_win = trades_df[trades_df["PnL"] > 0]["PnL"].mean() if winning_trades > 0 else 0
-    avg_loss = trades_df[trades_df["PnL"] <= 0]["PnL"].mean() if losing_trades > 0 else 0
+    win_pnl = pnl[wins]
+    loss_pnl = pnl[~wins]
+    avg_win = win_pnl.mean() if winning_trades > 0 else 0
+    avg_loss = loss_pnl.mean() if losing_trades > 0 else 0
     
-    profit_factor = abs(trades_df[trades_df["PnL"] > 0]["PnL"].sum()) / abs(trades_df[trades_df["PnL"] <= 0]["PnL"].sum()) if losing_trades > 0 else float('inf')
+    profit_factor = abs(win_pnl.sum()) / abs(loss_pnl.sum()) if losing_trades > 0 else float('inf')
     
     # Calculate prediction accuracy
     if len(predictions) > 0:
-        predictions_df = pd.DataFrame(predictions)
-        correct_predictions = len(predictions_df[predictions_df["correct"] == True])
-        prediction_accuracy = (correct_predictions / len(predictions_df)) * 100
-        avg_move = predictions_df["price_change"].abs().mean()
-        correct_move = predictions_df[predictions_df["correct"] == True]["price_change"].mean()
+        predictions_df = predictions
+        total_predictions = len(predictions_df)
+        correct = predictions_df["correct"].to_numpy()
+        price_change = predictions_df["price_change"].to_numpy()
+        correct_predictions = int(correct.sum())
+        prediction_accuracy = (correct_predictions / len(correct)) * 100
+        avg_move = np.abs(price_change).mean()
+        correct_move = price_change[correct].mean() if correct_predictions > 0 else np.nan
     else:
+        predictions_df = None
+        total_predictions = 0
+        correct_predictions = 0
         prediction_accuracy = 0
         avg_move = 0
         correct_move = 0
     
-    print(f"\nTicker: {ticker}")
-    print(f"Initial Capital: ${initial_capital:,.2f}")
-    print(f"Final Equity: ${equity:,.2f}")
-    print(f"Total Return: {total_return:,.2f}%")
-    print(f"\nPrediction Accuracy:")
-    print(f"Prediction Accuracy: {prediction_accuracy:.2f}%")
-    print(f"Correct Predictions: {correct_predictions}/{len(predictions_df)}")
-    print(f"Average Price Move: {avg_move:.4f}%")
-    print(f"Avg Move on Correct Predictions: {correct_move:.4f}%")
-    print(f"\nTrade Statistics:")
-    print(f"Total Trades: {len(trades_df)}")
-    print(f"Winning Trades: {winning_trades}")
-    print(f"Losing Trades: {losing_trades}")
-    print(f"Win Rate: {win_rate:.2f}%")
-    print(f"Average Win: ${avg_win:,.2f}")
-    print(f"Average Loss: ${avg_loss:,.2f}")
-    print(f"Profit Factor: {profit_factor:.2f}")
-    print(f"\nTrades:")
-    print(trades_df.to_string(index=False))
+    out.append(f"\nTicker: {ticker}")
+    out.append(f"Initial Capital: ${initial_capital:,.2f}")
+    out.append(f"Final Equity: ${equity:,.2f}")
+    out.append(f"Total Return: {total_return:,.2f}%")
+    out.append(f"\nPrediction Accuracy:")
+    out.append(f"Prediction Accuracy: {prediction_accuracy:.2f}%")
+    out.append(f"Correct Predictions: {correct_predictions}/{total_predictions}")
+    out.append(f"Average Price Move: {avg_move:.4f}%")
+    out.append(f"Avg Move on Correct Predictions: {correct_move:.4f}%")
+    out.append(f"\nTrade Statistics:")
+    out.append(f"Total Trades: {len(trades_df)}")
+    out.append(f"Winning Trades: {winning_trades}")
+    out.append(f"Losing Trades: {losing_trades}")
+    out.append(f"Win Rate: {win_rate:.2f}%")
+    out.append(f"Average Win: ${avg_win:,.2f}")
+    out.append(f"Average Loss: ${avg_loss:,.2f}")
+    out.append(f"Profit Factor: {profit_factor:.2f}")
+    out.append(f"\nTrades:")
+    out.append(trades_df.to_string(index=False))
+    
+    if verbose:
+        sys.stdout.write('\n'.join(out) + '\n')
     
     return {
         "ticker": ticker,
@@ -291,14 +361,79 @@ def backtest_ticker(ticker: str, days: int = 60, initial_capital: float = 10000)
         "profit_factor": profit_factor,
         "prediction_accuracy": prediction_accuracy,
         "correct_predictions": correct_predictions,
-        "total_predictions": len(predictions_df) if len(predictions) > 0 else 0,
+        "total_predictions": total_predictions,
         "trades_df": trades_df,
-        "predictions_df": predictions_df if len(predictions) > 0 else None
+        "predictions_df": predictions_df
     }
 
 
-def backtest_multiple_tickers(tickers: list, days: int = 60, initial_capital: float = 10000):
-    """Backtest multiple tickers and compare results."""
+def _backtest_captured(ticker: str, df: Optional[pd.DataFrame], days: int,
+                       initial_capital: float) -> Tuple[str, Optional[Dict]]:
+    """Run ``backtest_ticker`` and return its printed report along with the result."""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        result = backtest_ticker(ticker, days=days, initial_capital=initial_capital, df=df)
+    return buffer.getvalue(), result
+
+
+def _plot_results(results: List[Dict]):
+    """Chart per-ticker backtest results and save them to backtest_results.png."""
+    import matplotlib
+    headless = (sys.platform.startswith("linux") and not os.environ.get("DISPLAY")
+                and not os.environ.get("WAYLAND_DISPLAY"))
+    if headless and "MPLBACKEND" not in os.environ:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    
+    # Return by ticker
+    tickers_list = [r["ticker"] for r in results]
+    returns = [r["total_return"] for r in results]
+    colors = ["green" if x > 0 else "red" for x in returns]
+    axes[0, 0].bar(tickers_list, returns, color=colors, alpha=0.7)
+    axes[0, 0].set_title("Total Return by Ticker (%)", fontweight="bold")
+    axes[0, 0].set_ylabel("Return %")
+    axes[0, 0].axhline(0, color="black", linestyle="-", linewidth=0.5)
+    axes[0, 0].grid(True, alpha=0.3)
+    
+    # Win rate by ticker
+    win_rates = [r["win_rate"] for r in results]
+    axes[0, 1].bar(tickers_list, win_rates, color="skyblue", alpha=0.7)
+    axes[0, 1].set_title("Win Rate by Ticker (%)", fontweight="bold")
+    axes[0, 1].set_ylabel("Win Rate %")
+    axes[0, 1].axhline(50, color="orange", linestyle="--", linewidth=1)
+    axes[0, 1].grid(True, alpha=0.3)
+    
+    # Profit factor by ticker
+    profit_factors = [min(r["profit_factor"], 5) for r in results]  # Cap at 5 for display
+    axes[1, 0].bar(tickers_list, profit_factors, color="purple", alpha=0.7)
+    axes[1, 0].set_title("Profit Factor by Ticker", fontweight="bold")
+    axes[1, 0].set_ylabel("Profit Factor")
+    axes[1, 0].axhline(1, color="orange", linestyle="--", linewidth=1)
+    axes[1, 0].grid(True, alpha=0.3)
+    
+    # Number of trades by ticker
+    num_trades = [r["trades"] for r in results]
+    axes[1, 1].bar(tickers_list, num_trades, color="teal", alpha=0.7)
+    axes[1, 1].set_title("Number of Trades by Ticker", fontweight="bold")
+    axes[1, 1].set_ylabel("Trades")
+    axes[1, 1].grid(True, alpha=0.3)
+    
+    plt.tight_layout()
+    plt.savefig("backtest_results.png", dpi=150)
+    print(f"\nBacktest chart saved to backtest_results.png")
+    if not headless:
+        plt.show()
+
+
+def backtest_multiple_tickers(tickers: list, days: int = 60, initial_capital: float = 10000,
+                              plot: bool = False):
+    """Backtest multiple tickers and compare results.
+    
+    Set ``plot`` to chart the results to backtest_results.png (and show the
+    chart when a display is available).
+    """
     results = []
     
     print(f"\n{'='*70}")
@@ -308,10 +443,21 @@ def backtest_multiple_tickers(tickers: list, days: int = 60, initial_capital: fl
     print(f"Period: {days} days")
     print(f"Initial Capital: ${initial_capital:,.2f}")
     
-    for ticker in tickers:
-        result = backtest_ticker(ticker, days=days, initial_capital=initial_capital)
-        if result:
-            results.append(result)
+    # One batched download; tickers missing from it fall back to their own fetch
+    try:
+        frames = _fetch_many(tickers, days=days)
+    except Exception as e:
+        print(f"Batch download failed ({e}), fetching tickers individually")
+        frames = {}
+    
+    # Tickers are independent, so backtest them in parallel; each worker's
+    # report is captured and printed in ticker order to avoid interleaving
+    run = partial(_backtest_captured, days=days, initial_capital=initial_capital)
+    with ProcessPoolExecutor(max_workers=max(1, min(len(tickers), os.cpu_count() or 1))) as executor:
+        for output, result in executor.map(run, tickers, [frames.get(t) for t in tickers]):
+            sys.stdout.write(output)
+            if result:
+                results.append(result)
     
     # Summary
     print(f"\n{'='*70}")
@@ -332,47 +478,8 @@ def backtest_multiple_tickers(tickers: list, days: int = 60, initial_capital: fl
     summary_df = pd.DataFrame(summary_data)
     print("\n" + summary_df.to_string(index=False))
     
-    # Plot results
-    if len(results) > 0:
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-        
-        # Return by ticker
-        tickers_list = [r["ticker"] for r in results]
-        returns = [r["total_return"] for r in results]
-        colors = ["green" if x > 0 else "red" for x in returns]
-        axes[0, 0].bar(tickers_list, returns, color=colors, alpha=0.7)
-        axes[0, 0].set_title("Total Return by Ticker (%)", fontweight="bold")
-        axes[0, 0].set_ylabel("Return %")
-        axes[0, 0].axhline(0, color="black", linestyle="-", linewidth=0.5)
-        axes[0, 0].grid(True, alpha=0.3)
-        
-        # Win rate by ticker
-        win_rates = [r["win_rate"] for r in results]
-        axes[0, 1].bar(tickers_list, win_rates, color="skyblue", alpha=0.7)
-        axes[0, 1].set_title("Win Rate by Ticker (%)", fontweight="bold")
-        axes[0, 1].set_ylabel("Win Rate %")
-        axes[0, 1].axhline(50, color="orange", linestyle="--", linewidth=1)
-        axes[0, 1].grid(True, alpha=0.3)
-        
-        # Profit factor by ticker
-        profit_factors = [min(r["profit_factor"], 5) for r in results]  # Cap at 5 for display
-        axes[1, 0].bar(tickers_list, profit_factors, color="purple", alpha=0.7)
-        axes[1, 0].set_title("Profit Factor by Ticker", fontweight="bold")
-        axes[1, 0].set_ylabel("Profit Factor")
-        axes[1, 0].axhline(1, color="orange", linestyle="--", linewidth=1)
-        axes[1, 0].grid(True, alpha=0.3)
-        
-        # Number of trades by ticker
-        num_trades = [r["trades"] for r in results]
-        axes[1, 1].bar(tickers_list, num_trades, color="teal", alpha=0.7)
-        axes[1, 1].set_title("Number of Trades by Ticker", fontweight="bold")
-        axes[1, 1].set_ylabel("Trades")
-        axes[1, 1].grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig("backtest_results.png", dpi=150)
-        print(f"\nBacktest chart saved to backtest_results.png")
-        plt.show()
+    if plot and len(results) > 0:
+        _plot_results(results)
     
     return results
 
@@ -384,7 +491,9 @@ if __name__ == "__main__":
     parser.add_argument("--days", type=int, default=60, help="Number of days of historical data (default 60)")
     parser.add_argument("--capital", type=float, default=10000, help="Initial capital (default 10000)")
     parser.add_argument("--tickers", nargs="+", default=["AAPL", "MSFT", "GOOGL", "AMZN", "TSLA"], help="Tickers to backtest")
+    parser.add_argument("--no-plot", action="store_true", help="Skip the results chart")
     args = parser.parse_args()
     
     # Run backtest
-    results = backtest_multiple_tickers(args.tickers, days=args.days, initial_capital=args.capital)
+    results = backtest_multiple_tickers(args.tickers, days=args.days, initial_capital=args.capital,
+                                        plot=not args.no_plot)
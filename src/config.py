@@ -3,147 +3,210 @@ Configuration manager for IBKR paper trading
 Loads and manages all trading parameters
 """
 
-import configparser
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Strings accepted for boolean settings, as in ConfigParser.getboolean
+BOOLEAN_STATES = {'1': True, 'yes': True, 'true': True, 'on': True,
+                  '0': False, 'no': False, 'false': False, 'off': False}
+
+
+def _parse_ini(text: str) -> Dict[str, Dict[str, str]]:
+    """One-pass INI parse into {section: {option: value}}
+    
+    Follows ConfigParser's defaults for the files used here: '#'/';' comment
+    lines, '=' or ':' delimiters, lower-cased option names and indented
+    continuation lines. Values are not interpolated.
+    """
+    data = {}
+    section = None
+    option = None
+    for lineno, raw in enumerate(text.splitlines(), 1):
+        line = raw.strip()
+        if not line or line[0] in '#;':
+            continue
+        if option is not None and raw[0].isspace():
+            section[option] += '\n' + line
+            continue
+        if line[0] == '[' and line[-1] == ']':
+            section = data.setdefault(line[1:-1].strip(), {})
+            option = None
+            continue
+        cut = min((i for i in (line.find('='), line.find(':')) if i > 0), default=-1)
+        if section is None or cut < 0:
+            raise ValueError(f"Malformed config line {lineno} in INI: {raw!r}")
+        option = line[:cut].strip().lower()
+        section[option] = line[cut + 1:].strip()
+    return data
+
+
+def _to_bool(value: str) -> bool:
+    try:
+        return BOOLEAN_STATES[value.lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value}") from None
+
 
 class TradingConfig:
-    """Manages trading configuration from INI file"""
+    """Manages trading configuration from INI file
+    
+    Each setting is parsed from the INI data on first access and then kept,
+    so repeated reads in trading loops are plain attribute lookups.
+    """
     
     def __init__(self, config_file: str = 'config_paper_trading.ini'):
         self.config_file = Path(config_file)
-        self.config = configparser.ConfigParser()
+        self._data = {}  # {section: {option: raw string value}}
+        self._symbols = {}  # {category: tuple of symbols}, filled by get_symbols
+        self._all_settings = None  # get_all_settings result, built on first call
         
-        if not self.config_file.exists():
+        try:
+            # One read of the whole file (no separate exists() stat), then a
+            # single split instead of ConfigParser's per-line regexes
+            text = self.config_file.read_text(encoding='utf-8')
+        except FileNotFoundError:
             logger.warning(f"Config file not found: {config_file}")
             logger.info("Creating default config...")
             self._create_default_config()
         else:
-            self.config.read(self.config_file)
+            self._data = _parse_ini(text)
             logger.info(f"✓ Loaded config from {config_file}")
     
+    def _get(self, section: str, option: str, fallback: Any, convert=str) -> Any:
+        """Setting value converted by ``convert``, or ``fallback`` when unset"""
+        value = self._data.get(section, {}).get(option.lower())
+        return fallback if value is None else convert(value)
+    
     def _create_default_config(self):
         """Create default configuration if missing"""
         # This would create default values
         pass
     
     # Connection Settings
-    @property
+    @cached_property
     def ibkr_host(self) -> str:
-        return self.config.get('connection', 'host', fallback='127.0.0.1')
+        return self._get('connection', 'host', '127.0.0.1')
     
-    @property
+    @cached_property
     def ibkr_port(self) -> int:
-        return self.config.getint('connection', 'port', fallback=7497)
+        return self._get('connection', 'port', 7497, int)
     
-    @property
+    @cached_property
     def client_id(self) -> int:
-        return self.config.getint('connection', 'clientId', fallback=1)
+        return self._get('connection', 'clientId', 1, int)
     
     # Account Settings
-    @property
+    @cached_property
     def account_size(self) -> float:
-        return self.config.getfloat('account', 'account_size', fallback=10000)
+        return self._get('account', 'account_size', 10000, float)
     
-    @property
+    @cached_property
     def currency(self) -> str:
-        return self.config.get('account', 'currency', fallback='USD')
+        return self._get('account', 'currency', 'USD')
     
-    @property
+    @cached_property
     def trading_mode(self) -> str:
         """paper or live"""
-        return self.config.get('account', 'trading_mode', fallback='paper')
+        return self._get('account', 'trading_mode', 'paper')
     
     # Risk Management
-    @property
+    @cached_property
     def max_risk_percent(self) -> float:
-        return self.config.getfloat('risk_management', 'max_risk_percent', fallback=2.0)
+        return self._get('risk_management', 'max_risk_percent', 2.0, float)
     
-    @property
+    @cached_property
     def max_position_size(self) -> int:
-        return self.config.getint('risk_management', 'max_position_size', fallback=100)
+        return self._get('risk_management', 'max_position_size', 100, int)
     
-    @property
+    @cached_property
     def min_profit_target(self) -> float:
-        return self.config.getfloat('risk_management', 'min_profit_target', fallback=1.5)
+        return self._get('risk_management', 'min_profit_target', 1.5, float)
     
-    @property
+    @cached_property
     def max_positions(self) -> int:
-        return self.config.getint('risk_management', 'max_positions', fallback=5)
+        return self._get('risk_management', 'max_positions', 5, int)
     
-    @property
+    @cached_property
     def use_atr_stops(self) -> bool:
-        return self.config.getboolean('risk_management', 'use_atr_stops', fallback=True)
+        return self._get('risk_management', 'use_atr_stops', True, _to_bool)
     
-    @property
+    @cached_property
     def stop_loss_atr_multiplier(self) -> float:
-        return self.config.getfloat('risk_management', 'stop_loss_atr_multiplier', fallback=1.0)
+        return self._get('risk_management', 'stop_loss_atr_multiplier', 1.0, float)
     
-    @property
+    @cached_property
     def take_profit_atr_multiplier(self) -> float:
-        return self.config.getfloat('risk_management', 'take_profit_atr_multiplier', fallback=2.0)
+        return self._get('risk_management', 'take_profit_atr_multiplier', 2.0, float)
     
     # Predictions
-    @property
+    @cached_property
     def min_confidence(self) -> float:
-        return self.config.getfloat('predictions', 'min_confidence', fallback=60.0)
+        return self._get('predictions', 'min_confidence', 60.0, float)
     
-    @property
+    @cached_property
     def timeframe(self) -> str:
-        return self.config.get('predictions', 'timeframe', fallback='1 min')
+        return self._get('predictions', 'timeframe', '1 min')
     
-    @property
+    @cached_property
     def duration(self) -> int:
-        return self.config.getint('predictions', 'duration', fallback=60)
+        return self._get('predictions', 'duration', 60, int)
     
-    @property
+    @cached_property
     def lookback_period(self) -> int:
-        return self.config.getint('predictions', 'lookback_period', fallback=20)
+        return self._get('predictions', 'lookback_period', 20, int)
     
     # Trading
-    @property
+    @cached_property
     def auto_trading_mode(self) -> str:
         """auto, manual, or dry_run"""
-        return self.config.get('trading', 'trading_mode', fallback='dry_run')
+        return self._get('trading', 'trading_mode', 'dry_run')
     
-    @property
+    @cached_property
     def order_type(self) -> str:
         """bracket, market, or limit"""
-        return self.config.get('trading', 'order_type', fallback='bracket')
+        return self._get('trading', 'order_type', 'bracket')
     
-    @property
+    @cached_property
     def trading_start(self) -> str:
-        return self.config.get('trading', 'trading_start', fallback='09:30')
+        return self._get('trading', 'trading_start', '09:30')
     
-    @property
+    @cached_property
     def trading_end(self) -> str:
-        return self.config.get('trading', 'trading_end', fallback='16:00')
+        return self._get('trading', 'trading_end', '16:00')
     
-    @property
+    @cached_property
     def skip_first_minute(self) -> bool:
-        return self.config.getboolean('trading', 'skip_first_minute', fallback=True)
+        return self._get('trading', 'skip_first_minute', True, _to_bool)
     
     # Symbols
     def get_symbols(self, category: str = 'stocks') -> list:
         """Get symbols by category"""
-        try:
-            symbols_str = self.config.get('symbols', category, fallback='')
-            symbols = [s.strip() for s in symbols_str.split(',') if s.strip()]
-            return symbols
-        except:
-            return []
-    
-    @property
+        symbols = self._symbols.get(category)
+        if symbols is None:
+            try:
+                symbols_str = self._get('symbols', category, '')
+                symbols = tuple(s.strip() for s in symbols_str.split(',') if s.strip())
+            except:
+                symbols = ()
+            self._symbols[category] = symbols
+        return list(symbols)
+    
+    @cached_property
     def all_symbols(self) -> list:
         """Get all configured symbols"""
         all_symbols = []
         try:
-            for option in self.config.options('symbols'):
+            for option in self._data.get('symbols', {}):
                 symbols = self.get_symbols(option)
                 all_symbols.extend(symbols)
         except:
@@ -151,73 +214,84 @@ class TradingConfig:
         return list(set(all_symbols))  # Remove duplicates
     
     # Technical Indicators
-    @property
+    @cached_property
     def rsi_period(self) -> int:
-        return self.config.getint('technical_indicators', 'rsi_period', fallback=14)
+        return self._get('technical_indicators', 'rsi_period', 14, int)
     
-    @property
+    @cached_property
     def rsi_overbought(self) -> float:
-        return self.config.getfloat('technical_indicators', 'rsi_overbought', fallback=70)
+        return self._get('technical_indicators', 'rsi_overbought', 70, float)
     
-    @property
+    @cached_property
     def rsi_oversold(self) -> float:
-        return self.config.getfloat('technical_indicators', 'rsi_oversold', fallback=30)
+        return self._get('technical_indicators', 'rsi_oversold', 30, float)
     
-    @property
+    @cached_property
     def adx_trend_threshold(self) -> float:
-        return self.config.getfloat('technical_indicators', 'adx_trend_threshold', fallback=20)
+        return self._get('technical_indicators', 'adx_trend_threshold', 20, float)
     
     # Filters
-    @property
+    @cached_property
     def min_volume(self) -> int:
-        return self.config.getint('filters', 'min_volume', fallback=1000000)
+        return self._get('filters', 'min_volume', 1000000, int)
     
-    @property
+    @cached_property
     def min_price(self) -> float:
-        return self.config.getfloat('filters', 'min_price', fallback=5.0)
+        return self._get('filters', 'min_price', 5.0, float)
     
-    @property
+    @cached_property
     def max_price(self) -> float:
-        return self.config.getfloat('filters', 'max_price', fallback=500.0)
+        return self._get('filters', 'max_price', 500.0, float)
     
-    @property
+    @cached_property
     def skip_penny_stocks(self) -> bool:
-        return self.config.getboolean('filters', 'skip_penny_stocks', fallback=True)
+        return self._get('filters', 'skip_penny_stocks', True, _to_bool)
     
     # Adaptive Weights
-    @property
+    @cached_property
     def weights_file(self) -> str:
-        return self.config.get('adaptive_weights', 'weights_file', 
-                             fallback='models/regime_weights_20251210_135927.pkl')
+        return self._get('adaptive_weights', 'weights_file',
+                         'models/regime_weights_20251210_135927.pkl')
+    
+    def load_weights(self):
+        """Load the RegimeAdaptiveWeights in ``weights_file`` (shared per file; treat as read-only)"""
+        # Imported here so reading the config does not pull in pandas
+        from _weights_cache import get_optimizer
+        return get_optimizer(self.weights_file)
     
-    @property
+    @cached_property
     def use_adaptive_weights(self) -> bool:
-        return self.config.getboolean('adaptive_weights', 'use_adaptive_weights', fallback=True)
+        return self._get('adaptive_weights', 'use_adaptive_weights', True, _to_bool)
     
     # Debug
-    @property
+    @cached_property
     def debug_mode(self) -> bool:
-        return self.config.getboolean('debug', 'debug_mode', fallback=False)
+        return self._get('debug', 'debug_mode', False, _to_bool)
     
-    @property
+    @cached_property
     def dry_run_mode(self) -> bool:
-        return self.config.getboolean('debug', 'dry_run_mode', fallback=True)
+        return self._get('debug', 'dry_run_mode', True, _to_bool)
     
-    @property
+    @cached_property
     def print_predictions(self) -> bool:
-        return self.config.getboolean('debug', 'print_predictions', fallback=True)
+        return self._get('debug', 'print_predictions', True, _to_bool)
     
     # Logging
-    @property
+    @cached_property
     def log_level(self) -> str:
-        return self.config.get('notifications', 'log_level', fallback='INFO')
+        return self._get('notifications', 'log_level', 'INFO')
     
-    @property
+    @cached_property
     def log_file(self) -> str:
-        return self.config.get('notifications', 'log_file', fallback='logs/trading.log')
+        return self._get('notifications', 'log_file', 'logs/trading.log')
     
     def get_all_settings(self) -> Dict[str, Any]:
-        """Get all settings as dictionary"""
+        """Get all settings as dictionary (built once; treat as read-only)"""
+        if self._all_settings is None:
+            self._all_settings = self._build_all_settings()
+        return self._all_settings
+    
+    def _build_all_settings(self) -> Dict[str, Any]:
         return {
             'connection': {
                 'host': self.ibkr_host,
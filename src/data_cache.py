@@ -0,0 +1,245 @@
+"""On-disk and in-process caching for yfinance OHLCV downloads.
+
+Downloads are written to ``cache/`` as zstd-compressed parquet and reused while
+the file's mtime is within ``max_age`` seconds. ``cached_history`` files are also
+dropped once the bar after their last one has started (``df.index[-1] +
+interval``), since only the latest bar can still change. Within a single process,
+an in-memory cache skips the parquet read as well. Parquet support needs ``pyarrow``;
+without it every call falls through to yfinance. ``fetch_bars`` is the uncached
+batch fetch for live bars; ``cached_history_batch`` fills the ``cached_history``
+cache for many tickers with batched downloads.
+"""
+
+import hashlib
+import re
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import pandas as pd
+import yfinance as yf
+
+CACHE_DIR = Path('cache')
+
+# Tickers per yf.download call; larger batches get throttled by the provider
+BATCH_SIZE = 20
+
+_UNIT_SECONDS = {'m': 60, 'h': 3600, 'd': 86400}
+
+# (frame, fetch time) already loaded in this process, keyed by cache path
+_memory_cache: Dict[Path, Tuple[pd.DataFrame, float]] = {}
+
+
+def _date_key(value: Union[str, date, datetime]) -> str:
+    if isinstance(value, (date, datetime)):
+        return value.strftime('%Y%m%d')
+    return str(value)[:10].replace('-', '')
+
+
+def _ticker_key(tickers: Union[str, Iterable[str]]) -> str:
+    if isinstance(tickers, str):
+        return tickers
+    joined = ','.join(tickers)
+    return 'batch-' + hashlib.sha1(joined.encode()).hexdigest()[:12]
+
+
+def _cache_path(*parts: str) -> Path:
+    name = '_'.join(p.replace('/', '-') for p in parts if p)
+    return CACHE_DIR / f"{name}.parquet"
+
+
+def _bar_seconds(interval: Optional[str]) -> Optional[int]:
+    """Length of an ``interval`` bar, or None for "1wk", "1mo" and the like."""
+    match = re.fullmatch(r'(\d+)([mhd])', interval or '')
+    if match is None:
+        return None
+    return int(match.group(1)) * _UNIT_SECONDS[match.group(2)]
+
+
+def _next_bar_started(df: pd.DataFrame, fetched_at: float, interval: Optional[str]) -> bool:
+    """Whether the bar after ``df``'s last one has started since ``df`` was fetched.
+
+    Bars are timestamped by their start (yfinance anchors intraday bars to the
+    session open), so the next one starts at ``df.index[-1] + interval``. If that
+    time had already passed when ``df`` was fetched, the market was closed and
+    no newer bar exists yet.
+    """
+    seconds = _bar_seconds(interval)
+    if seconds is None or df.empty or not isinstance(df.index, pd.DatetimeIndex):
+        return False
+    next_bar = df.index[-1].timestamp() + seconds
+    return fetched_at < next_bar <= time.time()
+
+
+def _read_cached(path: Path, max_age: Optional[float]) -> Optional[pd.DataFrame]:
+    """Read a cached frame if it exists and is fresh enough."""
+    try:
+        if not path.exists():
+            return None
+        if max_age is not None and time.time() - path.stat().st_mtime > max_age:
+            return None
+        return pd.read_parquet(path)
+    except Exception:
+        return None
+
+
+def _write_cached(df: pd.DataFrame, path: Path):
+    """Best-effort parquet write; caching is never fatal."""
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        df.to_parquet(path, compression='zstd')
+    except Exception:
+        pass
+
+
+def _load(path: Path, max_age: Optional[float],
+          interval: Optional[str] = None) -> Optional[pd.DataFrame]:
+    """Look up a frame in memory, then on disk.
+
+    With ``interval``, a frame is also stale once a newer bar has started.
+    """
+    entry = _memory_cache.get(path)
+    if (entry is not None and (max_age is None or time.time() - entry[1] <= max_age)
+            and not _next_bar_started(*entry, interval)):
+        return entry[0]
+    df = _read_cached(path, max_age)
+    if df is None:
+        return None
+    fetched_at = path.stat().st_mtime
+    if _next_bar_started(df, fetched_at, interval):
+        return None
+    _memory_cache[path] = (df, fetched_at)
+    return df
+
+
+def _store(df: pd.DataFrame, path: Path):
+    if not df.empty:
+        _memory_cache[path] = (df, time.time())
+        _write_cached(df, path)
+
+
+def cached_download(tickers: Union[str, Iterable[str]],
+                    start: Union[str, date, datetime],
+                    end: Union[str, date, datetime],
+                    interval: str = '1d',
+                    max_age: Optional[float] = None,
+                    **kwargs) -> pd.DataFrame:
+    """``yf.download`` with a parquet cache keyed on (tickers, start, end).
+
+    ``start`` and ``end`` are passed to yfinance unchanged but keyed at day
+    resolution, so repeated runs on the same day share one download.
+
+    Args:
+        tickers: Ticker or list of tickers
+        start: Start date
+        end: End date
+        interval: Bar interval
+        max_age: Seconds a cached file stays valid (None = no expiry)
+        **kwargs: Extra yf.download arguments (part of the cache key)
+
+    Returns:
+        Copy of the downloaded DataFrame
+    """
+    if not isinstance(tickers, str):
+        tickers = list(tickers)
+    extra = hashlib.sha1(repr(sorted(kwargs.items())).encode()).hexdigest()[:8] if kwargs else ''
+    path = _cache_path(_ticker_key(tickers), _date_key(start), _date_key(end), interval, extra)
+
+    df = _load(path, max_age)
+    if df is None:
+        df = yf.download(tickers, start=start, end=end, interval=interval,
+                         progress=False, **kwargs)
+        _store(df, path)
+    return df.copy()
+
+
+def cached_history(ticker: str, period: str, interval: str,
+                   max_age: Optional[float] = 3600) -> pd.DataFrame:
+    """``yf.Ticker(ticker).history`` with a parquet cache.
+
+    A cached file is dropped once the bar after its last one has started, even
+    within ``max_age``, because its last bar was still forming when fetched.
+
+    Args:
+        ticker: Stock ticker
+        period: History period, e.g. "90d"
+        interval: Bar interval, e.g. "4h"
+        max_age: Seconds a cached file stays valid (None = until the next bar)
+
+    Returns:
+        Copy of the history DataFrame
+    """
+    path = _cache_path(ticker, period, interval)
+
+    df = _load(path, max_age, interval)
+    if df is None:
+        df = yf.Ticker(ticker).history(period=period, interval=interval, actions=False)
+        _store(df, path)
+    return df.copy()
+
+
+def cached_history_batch(tickers: List[str], period: str, interval: str,
+                         max_age: Optional[float] = 3600,
+                         batch_size: int = BATCH_SIZE) -> Dict[str, pd.DataFrame]:
+    """``cached_history`` for many tickers, downloading the misses in batches.
+
+    Shares ``cached_history``'s per-ticker cache, so a later ``cached_history``
+    call for any of these tickers is a cache hit.
+
+    Args:
+        tickers: Ticker symbols
+        period: History period, e.g. "90d"
+        interval: Bar interval, e.g. "4h"
+        max_age: Seconds a cached file stays valid (None = until the next bar)
+        batch_size: Tickers per ``yf.download`` call
+
+    Returns:
+        Copy of the history DataFrame per ticker (tickers with no data are omitted)
+    """
+    frames = {}
+    missing = []
+    for ticker in tickers:
+        df = _load(_cache_path(ticker, period, interval), max_age, interval)
+        if df is None:
+            missing.append(ticker)
+        else:
+            frames[ticker] = df
+
+    for i in range(0, len(missing), batch_size):
+        fetched = fetch_bars(missing[i:i + batch_size], interval, period=period, actions=False)
+        for ticker, df in fetched.items():
+            _store(df, _cache_path(ticker, period, interval))
+            frames[ticker] = df
+
+    return {ticker: frames[ticker].copy() for ticker in tickers if ticker in frames}
+
+
+def fetch_bars(tickers: List[str], interval: str, period: Optional[str] = None,
+               **kwargs) -> Dict[str, pd.DataFrame]:
+    """Download bars for many tickers in one batched ``yf.download`` call.
+
+    Args:
+        tickers: Ticker symbols
+        interval: Bar interval, e.g. "1h"
+        period: History period, e.g. "30d" (or pass start/end instead)
+        **kwargs: Extra yf.download arguments
+
+    Returns:
+        Flat-column OHLCV DataFrame per ticker (tickers with no data are omitted)
+    """
+    df = yf.download(' '.join(tickers), period=period, interval=interval,
+                     group_by='ticker', threads=True, progress=False, **kwargs)
+    if df.empty:
+        return {}
+    if not isinstance(df.columns, pd.MultiIndex):
+        return {tickers[0]: df}
+
+    available = set(df.columns.get_level_values(0))
+    frames = {}
+    for ticker in tickers:
+        if ticker in available:
+            bars = df.xs(ticker, axis=1, level=0).dropna(how='all')
+            if not bars.empty:
+                frames[ticker] = bars
+    return frames
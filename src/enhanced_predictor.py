@@ -4,15 +4,22 @@ This module provides multi-indicator technical analysis for improved prediction
 accuracy using weighted scoring across 7 different technical indicators.
 """
 
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import pandas as pd
 import numpy as np
-import yfinance as yf
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import StandardScaler
 import warnings
 
+from data_cache import cached_history, cached_history_batch
+from _njit import NUMBA_AVAILABLE, njit
+from _rolling import rolling
+from _slope import compute_slope
+
 warnings.filterwarnings("ignore")
 
 
@@ -26,8 +33,7 @@ def fetch_4hour_data(ticker: str, days: int = 90) -> pd.DataFrame:
     Returns:
         DataFrame with 4-hour OHLCV data
     """
-    t = yf.Ticker(ticker)
-    df = t.history(period=f"{days}d", interval="4h", actions=False)
+    df = cached_history(ticker, period=f"{days}d", interval="4h")
     if df.empty:
         raise RuntimeError(f"No data for {ticker}")
     if isinstance(df.index, pd.DatetimeIndex):
@@ -35,20 +41,50 @@ def fetch_4hour_data(ticker: str, days: int = 90) -> pd.DataFrame:
     return df
 
 
+def fetch_4hour_data_batch(tickers: List[str], days: int = 90) -> Dict[str, pd.DataFrame]:
+    """Fetch 4-hour OHLCV data for many tickers with batched downloads.
+    
+    Args:
+        tickers: Ticker symbols
+        days: Number of days of historical data (default 90)
+    
+    Returns:
+        Dict of ticker -> 4-hour OHLCV DataFrame (tickers without data are omitted)
+    """
+    frames = {}
+    for ticker, df in cached_history_batch(list(tickers), period=f"{days}d", interval="4h").items():
+        if isinstance(df.index, pd.DatetimeIndex) and df.index.tz is not None:
+            df = df.tz_convert(None)
+        frames[ticker] = df
+    return frames
+
+
 def calculate_rsi(df: pd.DataFrame, period: int = 14) -> pd.Series:
     """Calculate Relative Strength Index."""
-    delta = df["Close"].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-    return rsi
+    close = df["Close"].to_numpy(dtype=np.float64)
+    rsi = np.full(len(close), np.nan)
+    if len(close) >= period:
+        # The first bar has no change, so it counts as neither gain nor loss
+        delta = np.diff(close, prepend=close[:1])
+        gain = np.where(delta > 0, delta, 0.0)
+        loss = np.where(delta < 0, -delta, 0.0)
+        # Simple moving averages of every trailing window at once
+        avg_gain = np.lib.stride_tricks.sliding_window_view(gain, period).mean(axis=1)
+        avg_loss = np.lib.stride_tricks.sliding_window_view(loss, period).mean(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi[period - 1:] = 100 - 100 / (1 + avg_gain / avg_loss)
+    return pd.Series(rsi, index=df.index)
 
 
 def calculate_macd(df: pd.DataFrame, fast: int = 12, slow: int = 26, signal: int = 9) -> tuple:
     """Calculate MACD and Signal line."""
     ema_fast = df["Close"].ewm(span=fast).mean()
     ema_slow = df["Close"].ewm(span=slow).mean()
+    return _macd_from_emas(ema_fast, ema_slow, signal)
+
+
+def _macd_from_emas(ema_fast: pd.Series, ema_slow: pd.Series, signal: int = 9) -> tuple:
+    """MACD, signal line and histogram from already computed fast/slow EMAs."""
     macd = ema_fast - ema_slow
     signal_line = macd.ewm(span=signal).mean()
     histogram = macd - signal_line
@@ -57,13 +93,24 @@ def calculate_macd(df: pd.DataFrame, fast: int = 12, slow: int = 26, signal: int
 
 def calculate_bollinger_bands(df: pd.DataFrame, period: int = 20, num_std: float = 2.0) -> tuple:
     """Calculate Bollinger Bands."""
-    sma = df["Close"].rolling(window=period).mean()
-    std = df["Close"].rolling(window=period).std()
+    sma = rolling(df["Close"], period, 'mean')
+    std = rolling(df["Close"], period, 'std')
     upper_band = sma + (std * num_std)
     lower_band = sma - (std * num_std)
     return upper_band, sma, lower_band
 
 
+def _true_range(df: pd.DataFrame) -> pd.Series:
+    """Per-bar true range; like ``pd.concat([...], axis=1).max(axis=1)``, NaN parts are skipped."""
+    high = df["High"].to_numpy(dtype=np.float64)
+    low = df["Low"].to_numpy(dtype=np.float64)
+    prev_close = np.empty_like(high)
+    prev_close[:1] = np.nan
+    prev_close[1:] = df["Close"].to_numpy(dtype=np.float64)[:-1]
+    true_range = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+    return pd.Series(true_range, index=df.index)
+
+
 def calculate_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
     """Calculate Average True Range for volatility measurement.
     
@@ -74,22 +121,17 @@ def calculate_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
     Returns:
         Series with ATR values
     """
-    high_low = df["High"] - df["Low"]
-    high_close = abs(df["High"] - df["Close"].shift())
-    low_close = abs(df["Low"] - df["Close"].shift())
-    
-    ranges = pd.concat([high_low, high_close, low_close], axis=1)
-    true_range = ranges.max(axis=1)
-    atr = true_range.rolling(period).mean()
+    atr = rolling(_true_range(df), period, 'mean')
     return atr
 
 
-def calculate_adx(df: pd.DataFrame, period: int = 14) -> pd.Series:
+def calculate_adx(df: pd.DataFrame, period: int = 14, atr: Optional[pd.Series] = None) -> pd.Series:
     """Calculate Average Directional Index (trend strength).
     
     Args:
         df: DataFrame with OHLCV data
         period: ADX period (default 14)
+        atr: ``calculate_atr(df, period)`` if already computed
     
     Returns:
         Series with ADX values
@@ -100,14 +142,14 @@ def calculate_adx(df: pd.DataFrame, period: int = 14) -> pd.Series:
     plus_dm = high_diff.where((high_diff > low_diff) & (high_diff > 0), 0)
     minus_dm = low_diff.where((low_diff > high_diff) & (low_diff > 0), 0)
     
-    tr = calculate_atr(df, period)
-    plus_di = 100 * (plus_dm.rolling(period).mean() / tr)
-    minus_di = 100 * (minus_dm.rolling(period).mean() / tr)
+    tr = calculate_atr(df, period) if atr is None else atr
+    plus_di = 100 * (rolling(plus_dm, period, 'mean') / tr)
+    minus_di = 100 * (rolling(minus_dm, period, 'mean') / tr)
     
     di_diff = abs(plus_di - minus_di)
     di_sum = plus_di + minus_di
     dx = 100 * (di_diff / di_sum)
-    adx = dx.rolling(period).mean()
+    adx = rolling(dx, period, 'mean')
     
     return adx
 
@@ -124,12 +166,12 @@ def calculate_stochastic(df: pd.DataFrame, period: int = 14, smooth_k: int = 3,
     Returns:
         Tuple of (k_percent_smooth, d_percent)
     """
-    low_min = df["Low"].rolling(window=period).min()
-    high_max = df["High"].rolling(window=period).max()
+    low_min = rolling(df["Low"], period, 'min')
+    high_max = rolling(df["High"], period, 'max')
     
     k_percent = 100 * ((df["Close"] - low_min) / (high_max - low_min))
-    k_percent_smooth = k_percent.rolling(window=smooth_k).mean()
-    d_percent = k_percent_smooth.rolling(window=smooth_d).mean()
+    k_percent_smooth = rolling(k_percent, smooth_k, 'mean')
+    d_percent = rolling(k_percent_smooth, smooth_d, 'mean')
     
     return k_percent_smooth, d_percent
 
@@ -148,11 +190,8 @@ def compute_enhanced_features(df: pd.DataFrame) -> Dict[str, float]:
     """
     
     # Trend indicators
-    prices = df["Close"].values
-    times = np.arange(len(prices)).reshape(-1, 1)
-    lr = LinearRegression()
-    lr.fit(times, prices)
-    slope = float(lr.coef_[0])
+    prices = df["Close"].to_numpy(dtype=np.float64)
+    slope = compute_slope(prices)
     
     # Returns
     last_return = (prices[-1] / prices[0] - 1.0) if len(prices) >= 2 else 0.0
@@ -160,11 +199,13 @@ def compute_enhanced_features(df: pd.DataFrame) -> Dict[str, float]:
     # Volatility
     volatility = float(df["Close"].std())
     
-    # Moving Averages
-    sma_20 = df["Close"].rolling(20).mean().iloc[-1]
-    sma_50 = df["Close"].rolling(50).mean().iloc[-1]
-    ema_12 = df["Close"].ewm(span=12).mean().iloc[-1]
-    ema_26 = df["Close"].ewm(span=26).mean().iloc[-1]
+    # Moving Averages (the EMA series are reused for MACD below)
+    sma_20 = rolling(df["Close"], 20, 'mean').iloc[-1]
+    sma_50 = rolling(df["Close"], 50, 'mean').iloc[-1]
+    ema_12_series = df["Close"].ewm(span=12).mean()
+    ema_26_series = df["Close"].ewm(span=26).mean()
+    ema_12 = ema_12_series.iloc[-1]
+    ema_26 = ema_26_series.iloc[-1]
     
     # Price position
     price = df["Close"].iloc[-1]
@@ -174,7 +215,7 @@ def compute_enhanced_features(df: pd.DataFrame) -> Dict[str, float]:
     rsi = calculate_rsi(df, 14).iloc[-1]
     
     # MACD
-    macd, signal, histogram = calculate_macd(df)
+    macd, signal, histogram = _macd_from_emas(ema_12_series, ema_26_series)
     macd_value = macd.iloc[-1]
     macd_signal = signal.iloc[-1]
     macd_histogram = histogram.iloc[-1]
@@ -184,11 +225,12 @@ def compute_enhanced_features(df: pd.DataFrame) -> Dict[str, float]:
     bb_position = (price - lower_bb.iloc[-1]) / (upper_bb.iloc[-1] - lower_bb.iloc[-1]) if (upper_bb.iloc[-1] - lower_bb.iloc[-1]) != 0 else 0.5
     
     # ATR and Volatility
-    atr = calculate_atr(df, 14).iloc[-1]
+    atr_series = calculate_atr(df, 14)
+    atr = atr_series.iloc[-1]
     atr_percent = (atr / price * 100) if price != 0 else 0
     
-    # ADX
-    adx = calculate_adx(df, 14).iloc[-1]
+    # ADX (reusing the ATR series)
+    adx = calculate_adx(df, 14, atr=atr_series).iloc[-1]
     
     # Stochastic
     k_stoch, d_stoch = calculate_stochastic(df, 14, 3, 3)
@@ -222,133 +264,189 @@ def compute_enhanced_features(df: pd.DataFrame) -> Dict[str, float]:
     }
 
 
-def enhanced_prediction(features: Dict) -> Dict:
-    """Generate enhanced prediction using multiple indicators.
+# Feature order expected by ``_score_kernel``
+SCORE_FEATURES = (
+    "slope", "sma_20", "sma_50", "ema_12", "ema_26", "rsi", "macd", "macd_signal",
+    "macd_histogram", "bb_position", "atr_percent", "adx", "k_stoch", "d_stoch",
+)
+
+WEIGHT_NAMES = ("trend", "momentum", "volatility", "trend_strength", "stochastic")
+
+# Share of each WEIGHT_NAMES category in the final score
+_CATEGORY_WEIGHTS = np.array([0.20, 0.25, 0.20, 0.20, 0.15], dtype=np.float64)
+
+
+@njit(cache=True)
+def _clip01(x):
+    """``max(0, min(1, x))`` (NaN clips to 1, like the builtins)."""
+    x = x if x < 1.0 else 1.0
+    return x if x > 0.0 else 0.0
+
+
+@njit(cache=True)
+def _score_kernel(x):
+    """Category weights (``WEIGHT_NAMES`` order) then the final score, for ``SCORE_FEATURES`` values."""
+    (slope, sma_20, sma_50, ema_12, ema_26, rsi, macd, macd_signal,
+     macd_histogram, bb_position, atr_percent, adx, k_stoch, d_stoch) = (
+        x[0], x[1], x[2], x[3], x[4], x[5], x[6], x[7], x[8], x[9], x[10], x[11], x[12], x[13])
     
-    Uses weighted scoring across 5 categories:
-    - Trend (20%): slope, SMA, EMA
-    - Momentum (25%): RSI, MACD
-    - Volatility (20%): Bollinger Bands, ATR
-    - Trend Strength (20%): ADX
-    - Stochastic (15%): K/D crossover
+    # 1. Trend Analysis (Weight: 20%)
+    trend_score = 0.0
+    if slope > 0:
+        trend_score += 1
+    if sma_20 > sma_50:
+        trend_score += 1
+    if ema_12 > ema_26:
+        trend_score += 1
+    trend = trend_score / 3.0  # 0-1 scale
+    
+    # 2. Momentum Analysis (Weight: 25%)
+    momentum_score = 0.0
+    if rsi < 30:
+        momentum_score += 2  # Oversold - strong buy signal
+    elif rsi < 50:
+        momentum_score += 1
+    elif rsi > 70:
+        momentum_score -= 2  # Overbought - strong sell signal
+    if macd_histogram > 0 and macd > macd_signal:
+        momentum_score += 1
+    elif macd_histogram < 0 and macd < macd_signal:
+        momentum_score -= 1
+    momentum = _clip01((momentum_score + 2) / 4.0)  # Normalize to 0-1
+    
+    # 3. Volatility & Support/Resistance (Weight: 20%)
+    volatility_score = 0.0
+    if bb_position < 0.2:
+        volatility_score += 1
+    elif bb_position > 0.8:
+        volatility_score -= 1
+    # Low volatility (consolidation) is good for trending
+    if atr_percent < 1.0:
+        volatility_score += 1
+    elif atr_percent > 3.0:
+        volatility_score -= 1
+    volatility = _clip01((volatility_score + 1) / 2.0)
+    
+    # 4. Trend Strength (Weight: 20%)
+    trend_strength = _clip01(adx / 40.0)
+    
+    # 5. Stochastic RSI (Weight: 15%)
+    stoch_score = 0.0
+    if k_stoch < 20:
+        stoch_score += 1
+    elif k_stoch > 80:
+        stoch_score -= 1
+    if k_stoch > d_stoch:
+        stoch_score += 0.5
+    elif k_stoch < d_stoch:
+        stoch_score -= 0.5
+    stochastic = _clip01((stoch_score + 1) / 2.0)
+    
+    # Calculate weighted final score
+    final_score = (
+        trend * 0.20 +
+        momentum * 0.25 +
+        volatility * 0.20 +
+        trend_strength * 0.20 +
+        stochastic * 0.15
+    )
+    return trend, momentum, volatility, trend_strength, stochastic, final_score
+
+
+def explain_signals(features: Dict) -> list:
+    """Human-readable reasons behind ``enhanced_prediction``'s score.
     
     Args:
         features: Dict with 20 technical indicators
     
     Returns:
-        Dict with prediction, confidence, signals, weights
+        List of signal descriptions, one per scoring rule that fired
     """
-    
-    score = 0
     signals = []
-    weights = {}
     
-    # 1. Trend Analysis (Weight: 20%)
-    trend_score = 0
     if features["slope"] > 0:
-        trend_score += 1
         signals.append("Positive slope (bullish)")
     else:
         signals.append("Negative slope (bearish)")
     
     if features["sma_20"] > features["sma_50"]:
-        trend_score += 1
         signals.append("SMA20 > SMA50 (uptrend)")
     else:
         signals.append("SMA20 <= SMA50 (downtrend)")
     
     if features["ema_12"] > features["ema_26"]:
-        trend_score += 1
         signals.append("EMA12 > EMA26 (bullish)")
     else:
         signals.append("EMA12 <= EMA26 (bearish)")
     
-    weights["trend"] = trend_score / 3.0  # 0-1 scale
-    
-    # 2. Momentum Analysis (Weight: 25%)
-    momentum_score = 0
     if features["rsi"] < 30:
-        momentum_score += 2  # Oversold - strong buy signal
         signals.append("RSI < 30 (Oversold - Strong Buy)")
     elif features["rsi"] < 50:
-        momentum_score += 1
         signals.append("RSI 30-50 (Mild Buy)")
     elif features["rsi"] > 70:
-        momentum_score -= 2  # Overbought - strong sell signal
         signals.append("RSI > 70 (Overbought - Strong Sell)")
     else:
-        momentum_score += 0
         signals.append("RSI 50-70 (Neutral)")
     
     if features["macd_histogram"] > 0 and features["macd"] > features["macd_signal"]:
-        momentum_score += 1
         signals.append("MACD bullish (histogram > 0, MACD > Signal)")
     elif features["macd_histogram"] < 0 and features["macd"] < features["macd_signal"]:
-        momentum_score -= 1
         signals.append("MACD bearish (histogram < 0, MACD < Signal)")
     
-    weights["momentum"] = max(0, min(1, (momentum_score + 2) / 4.0))  # Normalize to 0-1
-    
-    # 3. Volatility & Support/Resistance (Weight: 20%)
-    volatility_score = 0
     if features["bb_position"] < 0.2:
-        volatility_score += 1
         signals.append("Price near lower Bollinger Band (Support)")
     elif features["bb_position"] > 0.8:
-        volatility_score -= 1
         signals.append("Price near upper Bollinger Band (Resistance)")
     else:
         signals.append(f"Price at {features['bb_position']*100:.1f}% of BB range")
     
-    # Low volatility (consolidation) is good for trending
     if features["atr_percent"] < 1.0:
-        volatility_score += 1
         signals.append("Low volatility (good for trending)")
     elif features["atr_percent"] > 3.0:
-        volatility_score -= 1
         signals.append("High volatility (risky)")
     
-    weights["volatility"] = max(0, min(1, (volatility_score + 1) / 2.0))
-    
-    # 4. Trend Strength (Weight: 20%)
-    adx_score = 0
     if features["adx"] > 25:
-        adx_score += 1
         signals.append(f"Strong trend (ADX: {features['adx']:.1f})")
     elif features["adx"] > 20:
-        adx_score += 0.5
         signals.append(f"Moderate trend (ADX: {features['adx']:.1f})")
     else:
         signals.append(f"Weak/no trend (ADX: {features['adx']:.1f})")
     
-    weights["trend_strength"] = max(0, min(1, features["adx"] / 40.0))
-    
-    # 5. Stochastic RSI (Weight: 15%)
-    stoch_score = 0
     if features["k_stoch"] < 20:
-        stoch_score += 1
         signals.append("Stochastic oversold (< 20)")
     elif features["k_stoch"] > 80:
-        stoch_score -= 1
         signals.append("Stochastic overbought (> 80)")
     
     if features["k_stoch"] > features["d_stoch"]:
-        stoch_score += 0.5
         signals.append("K > D (Bullish crossover)")
     elif features["k_stoch"] < features["d_stoch"]:
-        stoch_score -= 0.5
         signals.append("K < D (Bearish crossover)")
     
-    weights["stochastic"] = max(0, min(1, (stoch_score + 1) / 2.0))
+    return signals
+
+
+def enhanced_prediction(features: Dict, explain: bool = False) -> Dict:
+    """Generate enhanced prediction using multiple indicators.
     
-    # Calculate weighted final score
-    final_score = (
-        weights["trend"] * 0.20 +
-        weights["momentum"] * 0.25 +
-        weights["volatility"] * 0.20 +
-        weights["trend_strength"] * 0.20 +
-        weights["stochastic"] * 0.15
-    )
+    Uses weighted scoring across 5 categories:
+    - Trend (20%): slope, SMA, EMA
+    - Momentum (25%): RSI, MACD
+    - Volatility (20%): Bollinger Bands, ATR
+    - Trend Strength (20%): ADX
+    - Stochastic (15%): K/D crossover
+    
+    Args:
+        features: Dict with 20 technical indicators
+        explain: Also build the human-readable ``signals`` list (see
+            ``explain_signals``); left empty otherwise
+    
+    Returns:
+        Dict with prediction, confidence, signals, weights
+    """
+    x = [float(features[name]) for name in SCORE_FEATURES]
+    # The compiled kernel needs an array; the pure-Python fallback is faster on a list
+    *weight_values, final_score = _score_kernel(np.array(x) if NUMBA_AVAILABLE else x)
+    weights = dict(zip(WEIGHT_NAMES, weight_values))
     
     # Prediction: > 0.5 = Up, < 0.5 = Down
     prediction = "Up" if final_score > 0.5 else "Down"
@@ -358,7 +456,7 @@ def enhanced_prediction(features: Dict) -> Dict:
         "prediction": prediction,
         "score": final_score,
         "confidence": confidence,
-        "signals": signals,
+        "signals": explain_signals(features) if explain else [],
         "weights": weights,
         "rsi": features["rsi"],
         "adx": features["adx"],
@@ -367,6 +465,79 @@ def enhanced_prediction(features: Dict) -> Dict:
     }
 
 
+def features_to_array(features_list: List[Dict]) -> np.ndarray:
+    """Stack feature dicts into one ``(n, len(SCORE_FEATURES))`` float64 array.
+    
+    Args:
+        features_list: Dicts from ``compute_enhanced_features``
+    
+    Returns:
+        One row per dict, columns in ``SCORE_FEATURES`` order
+    """
+    out = np.empty((len(features_list), len(SCORE_FEATURES)))
+    for row, features in enumerate(features_list):
+        out[row] = [features[name] for name in SCORE_FEATURES]
+    return out
+
+
+def _clip01_array(x: np.ndarray) -> np.ndarray:
+    """Elementwise ``_clip01``."""
+    x = np.where(x < 1.0, x, 1.0)
+    return np.where(x > 0.0, x, 0.0)
+
+
+def enhanced_prediction_batch(feats: np.ndarray) -> Dict:
+    """``enhanced_prediction`` for many feature rows in one vectorized pass.
+    
+    Args:
+        feats: ``(n, len(SCORE_FEATURES))`` array, e.g. from ``features_to_array``
+    
+    Returns:
+        Dict of length-n arrays: prediction, score, confidence, and weights
+        (dict of per-category arrays)
+    """
+    col = dict(zip(SCORE_FEATURES, feats.T))
+    rsi, k_stoch, d_stoch = col["rsi"], col["k_stoch"], col["d_stoch"]
+    
+    trend_score = ((col["slope"] > 0).astype(np.float64) +
+                   (col["sma_20"] > col["sma_50"]) +
+                   (col["ema_12"] > col["ema_26"]))
+    
+    momentum_score = np.where(rsi < 30, 2.0, np.where(rsi < 50, 1.0, np.where(rsi > 70, -2.0, 0.0)))
+    momentum_score += np.where(
+        (col["macd_histogram"] > 0) & (col["macd"] > col["macd_signal"]), 1.0,
+        np.where((col["macd_histogram"] < 0) & (col["macd"] < col["macd_signal"]), -1.0, 0.0))
+    
+    bb_position, atr_percent = col["bb_position"], col["atr_percent"]
+    volatility_score = (np.where(bb_position < 0.2, 1.0, np.where(bb_position > 0.8, -1.0, 0.0)) +
+                        np.where(atr_percent < 1.0, 1.0, np.where(atr_percent > 3.0, -1.0, 0.0)))
+    
+    stoch_score = (np.where(k_stoch < 20, 1.0, np.where(k_stoch > 80, -1.0, 0.0)) +
+                   np.where(k_stoch > d_stoch, 0.5, np.where(k_stoch < d_stoch, -0.5, 0.0)))
+    
+    weights_matrix = np.empty((len(feats), len(WEIGHT_NAMES)))
+    weights_matrix[:, 0] = trend_score / 3.0
+    weights_matrix[:, 1] = _clip01_array((momentum_score + 2) / 4.0)
+    weights_matrix[:, 2] = _clip01_array((volatility_score + 1) / 2.0)
+    weights_matrix[:, 3] = _clip01_array(col["adx"] / 40.0)
+    weights_matrix[:, 4] = _clip01_array((stoch_score + 1) / 2.0)
+    
+    # Weighted sum accumulated left to right like _score_kernel rather than
+    # with a BLAS dot, whose summation order can tip scores of exactly 0.5
+    weighted = weights_matrix * _CATEGORY_WEIGHTS
+    final_score = weighted[:, 0].copy()
+    for k in range(1, len(WEIGHT_NAMES)):
+        final_score += weighted[:, k]
+    weights = dict(zip(WEIGHT_NAMES, weights_matrix.T))
+    
+    return {
+        "prediction": np.where(final_score > 0.5, "Up", "Down"),
+        "score": final_score,
+        "confidence": np.abs(final_score - 0.5) * 2 * 100,
+        "weights": weights,
+    }
+
+
 def generate_trading_levels(price: float, prediction: str, atr: float, volatility: Dict) -> Dict:
     """Generate stop-loss and take-profit levels based on volatility.
     
@@ -418,7 +589,7 @@ if __name__ == "__main__":
     try:
         df = fetch_4hour_data(ticker, days=90)
         features = compute_enhanced_features(df)
-        result = enhanced_prediction(features)
+        result = enhanced_prediction(features, explain=True)
         
         print(f"\nTicker: {ticker}")
         print(f"Current Price: ${features['price']:.2f}")
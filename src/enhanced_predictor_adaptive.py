@@ -4,7 +4,9 @@ This module combines the original enhanced_predictor functionality with the
 adaptive weight optimizer to learn optimal indicator weights from market data.
 """
 
-from typing import Dict, Tuple
+from typing import Dict, List, Mapping, Tuple
+from collections import deque
+from dataclasses import dataclass, field
 import sys
 import os
 
@@ -13,20 +15,32 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import pandas as pd
 import numpy as np
-import yfinance as yf
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import StandardScaler
 import warnings
 
 from adaptive_weights import AdaptiveWeightOptimizer
+from data_cache import cached_history, cached_history_batch
+from _njit import njit
+from _rolling import rolling
+from _slope import compute_slope
+
+try:
+    import talib  # Optional C implementations of rolling indicators
+except ImportError:
+    talib = None
 
 warnings.filterwarnings("ignore")
 
+# Default static weights, in WEIGHT_CATEGORIES order
+STATIC_WEIGHTS = np.array([0.20, 0.25, 0.20, 0.20, 0.15])
+
+# Bars compute_enhanced_features needs: SMA50 is the longest window, and the
+# RSI-14, ADX (2x14) and MACD (26+9) warm-ups all fit inside it
+REQUIRED_LOOKBACK = max(14 + 1, 2 * 14, 26 + 9, 50) + 10
+
 
 def fetch_4hour_data(ticker: str, days: int = 90) -> pd.DataFrame:
     """Fetch 4-hour OHLCV data."""
-    t = yf.Ticker(ticker)
-    df = t.history(period=f"{days}d", interval="4h", actions=False)
+    df = cached_history(ticker, period=f"{days}d", interval="4h")
     if df.empty:
         raise RuntimeError(f"No data for {ticker}")
     if isinstance(df.index, pd.DatetimeIndex):
@@ -34,14 +48,31 @@ def fetch_4hour_data(ticker: str, days: int = 90) -> pd.DataFrame:
     return df
 
 
+def fetch_4hour_data_batch(tickers: List[str], days: int = 90) -> Dict[str, pd.DataFrame]:
+    """Fetch 4-hour OHLCV data for many tickers with batched downloads."""
+    frames = {}
+    for ticker, df in cached_history_batch(list(tickers), period=f"{days}d", interval="4h").items():
+        if isinstance(df.index, pd.DatetimeIndex) and df.index.tz is not None:
+            df = df.tz_convert(None)
+        frames[ticker] = df
+    return frames
+
+
 def calculate_rsi(df: pd.DataFrame, period: int = 14) -> pd.Series:
     """Calculate Relative Strength Index."""
-    delta = df["Close"].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-    return rsi
+    close = df["Close"].to_numpy(dtype=np.float64)
+    rsi = np.full(len(close), np.nan)
+    if len(close) >= period:
+        # The first bar has no change, so it counts as neither gain nor loss
+        delta = np.diff(close, prepend=close[:1])
+        gain = np.where(delta > 0, delta, 0.0)
+        loss = np.where(delta < 0, -delta, 0.0)
+        # Simple moving averages of every trailing window at once
+        avg_gain = np.lib.stride_tricks.sliding_window_view(gain, period).mean(axis=1)
+        avg_loss = np.lib.stride_tricks.sliding_window_view(loss, period).mean(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi[period - 1:] = 100 - 100 / (1 + avg_gain / avg_loss)
+    return pd.Series(rsi, index=df.index)
 
 
 def calculate_macd(df: pd.DataFrame, fast: int = 12, slow: int = 26, signal: int = 9) -> tuple:
@@ -56,22 +87,27 @@ def calculate_macd(df: pd.DataFrame, fast: int = 12, slow: int = 26, signal: int
 
 def calculate_bollinger_bands(df: pd.DataFrame, period: int = 20, num_std: float = 2.0) -> tuple:
     """Calculate Bollinger Bands."""
-    sma = df["Close"].rolling(window=period).mean()
-    std = df["Close"].rolling(window=period).std()
+    sma = rolling(df["Close"], period, 'mean')
+    std = rolling(df["Close"], period, 'std')
     upper_band = sma + (std * num_std)
     lower_band = sma - (std * num_std)
     return upper_band, sma, lower_band
 
 
+def _true_range(df: pd.DataFrame) -> pd.Series:
+    """Per-bar true range; like ``pd.concat([...], axis=1).max(axis=1)``, NaN parts are skipped."""
+    high = df["High"].to_numpy(dtype=np.float64)
+    low = df["Low"].to_numpy(dtype=np.float64)
+    prev_close = np.empty_like(high)
+    prev_close[:1] = np.nan
+    prev_close[1:] = df["Close"].to_numpy(dtype=np.float64)[:-1]
+    true_range = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+    return pd.Series(true_range, index=df.index)
+
+
 def calculate_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
     """Calculate Average True Range for volatility measurement."""
-    high_low = df["High"] - df["Low"]
-    high_close = abs(df["High"] - df["Close"].shift())
-    low_close = abs(df["Low"] - df["Close"].shift())
-    
-    ranges = pd.concat([high_low, high_close, low_close], axis=1)
-    true_range = ranges.max(axis=1)
-    atr = true_range.rolling(period).mean()
+    atr = rolling(_true_range(df), period, 'mean')
     return atr
 
 
@@ -83,10 +119,7 @@ def calculate_adx(df: pd.DataFrame, period: int = 14) -> pd.Series:
     plus_dm = high_diff.where((high_diff > low_diff) & (high_diff > 0), 0)
     minus_dm = low_diff.where((low_diff > high_diff) & (low_diff > 0), 0)
     
-    tr1 = df["High"] - df["Low"]
-    tr2 = abs(df["High"] - df["Close"].shift())
-    tr3 = abs(df["Low"] - df["Close"].shift())
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    tr = _true_range(df)
     
     plus_dm_smooth = plus_dm.ewm(span=period).mean()
     minus_dm_smooth = minus_dm.ewm(span=period).mean()
@@ -105,24 +138,100 @@ def calculate_adx(df: pd.DataFrame, period: int = 14) -> pd.Series:
 
 def calculate_stochastic(df: pd.DataFrame, k: int = 14, k_smooth: int = 3, d_smooth: int = 3) -> Tuple[pd.Series, pd.Series]:
     """Calculate Stochastic Oscillator K and D lines."""
-    low_min = df["Low"].rolling(window=k).min()
-    high_max = df["High"].rolling(window=k).max()
+    low_min = rolling(df["Low"], k, 'min')
+    high_max = rolling(df["High"], k, 'max')
     
     k_percent = 100 * (df["Close"] - low_min) / (high_max - low_min)
-    k_line = k_percent.rolling(window=k_smooth).mean()
-    d_line = k_line.rolling(window=d_smooth).mean()
+    k_line = rolling(k_percent, k_smooth, 'mean')
+    d_line = rolling(k_line, d_smooth, 'mean')
     
     return k_line, d_line
 
 
+@njit(cache=True, error_model="numpy")
+def _ewm_kernel(values, span):
+    """``Series.ewm(span=span).mean()`` (adjust=True, NaN-aware) over an array."""
+    n = values.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    alpha = 2.0 / (span + 1.0)
+    old_wt_factor = 1.0 - alpha
+    weighted = values[0]
+    old_wt = 1.0
+    out[0] = weighted
+    for i in range(1, n):
+        cur = values[i]
+        is_obs = cur == cur
+        if weighted == weighted:
+            old_wt *= old_wt_factor
+            if is_obs:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + cur) / (old_wt + 1.0)
+                old_wt += 1.0
+        elif is_obs:
+            weighted = cur
+        out[i] = weighted
+    return out
+
+
+@njit(cache=True, error_model="numpy")
+def _true_range_kernel(high, low, close):
+    """True range per bar (the first bar uses its high-low range)."""
+    n = high.shape[0]
+    tr = np.empty(n)
+    if n == 0:
+        return tr
+    tr[0] = high[0] - low[0]
+    for i in range(1, n):
+        prev_close = close[i - 1]
+        tr[i] = max(high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close))
+    return tr
+
+
+@njit(cache=True, error_model="numpy")
+def _rsi_kernel(close, period):
+    """Latest ``calculate_rsi`` value (NaN until ``period`` bars exist)."""
+    n = close.shape[0]
+    if n < period:
+        return np.nan
+    gain = np.float64(0.0)
+    loss = np.float64(0.0)
+    for i in range(max(n - period, 1), n):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            gain += delta
+        elif delta < 0:
+            loss -= delta
+    rs = (gain / period) / (loss / period)
+    return 100.0 - 100.0 / (1.0 + rs)
+
+
+@njit(cache=True, error_model="numpy")
+def _adx_kernel(high, low, close, period):
+    """Latest ``calculate_adx`` value."""
+    n = high.shape[0]
+    plus_dm = np.zeros(n)
+    minus_dm = np.zeros(n)
+    for i in range(1, n):
+        up = high[i] - high[i - 1]
+        down = low[i - 1] - low[i]
+        if up > down and up > 0:
+            plus_dm[i] = up
+        if down > up and down > 0:
+            minus_dm[i] = down
+    tr_smooth = _ewm_kernel(_true_range_kernel(high, low, close), period)
+    plus_di = 100.0 * _ewm_kernel(plus_dm, period) / tr_smooth
+    minus_di = 100.0 * _ewm_kernel(minus_dm, period) / tr_smooth
+    dx = 100.0 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+    return _ewm_kernel(dx, period)[-1]
+
+
 def compute_enhanced_features(df: pd.DataFrame) -> Dict[str, float]:
     """Compute 20 technical indicators for enhanced analysis."""
     # Trend indicators
-    prices = df["Close"].values
-    times = np.arange(len(prices)).reshape(-1, 1)
-    lr = LinearRegression()
-    lr.fit(times, prices)
-    slope = float(lr.coef_[0])
+    prices = df["Close"].to_numpy(dtype=np.float64)
+    slope = compute_slope(prices)
     
     # Returns
     last_return = (prices[-1] / prices[0] - 1.0) if len(prices) >= 2 else 0.0
@@ -131,10 +240,13 @@ def compute_enhanced_features(df: pd.DataFrame) -> Dict[str, float]:
     volatility = float(df["Close"].std())
     
     # Moving Averages
-    sma_20 = df["Close"].rolling(20).mean().iloc[-1]
-    sma_50 = df["Close"].rolling(50).mean().iloc[-1]
-    ema_12 = df["Close"].ewm(span=12).mean().iloc[-1]
-    ema_26 = df["Close"].ewm(span=26).mean().iloc[-1]
+    sma_20 = rolling(df["Close"], 20, 'mean').iloc[-1]
+    sma_50 = rolling(df["Close"], 50, 'mean').iloc[-1]
+    close = df["Close"].to_numpy(dtype=np.float64)
+    ema_fast = _ewm_kernel(close, 12)
+    ema_slow = _ewm_kernel(close, 26)
+    ema_12 = ema_fast[-1]
+    ema_26 = ema_slow[-1]
     
     # Price position
     price = df["Close"].iloc[-1]
@@ -145,13 +257,13 @@ def compute_enhanced_features(df: pd.DataFrame) -> Dict[str, float]:
         current_position = (price - sma_50) / sma_50
     
     # RSI
-    rsi = calculate_rsi(df, 14).iloc[-1]
+    rsi = _rsi_kernel(close, 14)
     
     # MACD
-    macd, signal, histogram = calculate_macd(df)
-    macd_value = macd.iloc[-1]
-    macd_signal = signal.iloc[-1]
-    macd_histogram = histogram.iloc[-1]
+    macd = ema_fast - ema_slow
+    macd_value = macd[-1]
+    macd_signal = _ewm_kernel(macd, 9)[-1]
+    macd_histogram = macd_value - macd_signal
     
     # Bollinger Bands
     upper_bb, middle_bb, lower_bb = calculate_bollinger_bands(df, 20, 2.0)
@@ -164,11 +276,14 @@ def compute_enhanced_features(df: pd.DataFrame) -> Dict[str, float]:
         bb_position = (price - lower_val) / bb_range
     
     # ATR and Volatility
-    atr = calculate_atr(df, 14).iloc[-1]
+    high = df["High"].to_numpy(dtype=np.float64)
+    low = df["Low"].to_numpy(dtype=np.float64)
+    true_range = _true_range_kernel(high, low, close)
+    atr = true_range[-14:].mean() if len(true_range) >= 14 else np.nan
     atr_percent = (atr / price * 100) if price != 0 else 0
     
     # ADX
-    adx = calculate_adx(df, 14).iloc[-1]
+    adx = _adx_kernel(high, low, close, 14)
     
     # Stochastic
     k_stoch, d_stoch = calculate_stochastic(df, 14, 3, 3)
@@ -202,6 +317,342 @@ def compute_enhanced_features(df: pd.DataFrame) -> Dict[str, float]:
     }
 
 
+def _rolling_slope(values: np.ndarray, window: int) -> np.ndarray:
+    """Least-squares slope of every trailing window (NaN until the window fills)."""
+    out = np.full(len(values), np.nan)
+    if window < 2 or len(values) < window:
+        return out
+    t = np.arange(window) - (window - 1) / 2.0
+    windows = np.lib.stride_tricks.sliding_window_view(values, window)
+    out[window - 1:] = windows @ t / (t @ t)
+    return out
+
+
+def _rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average, via TA-Lib or bottleneck when installed (NaN until the window fills)."""
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    if talib is not None and len(values) >= period:
+        return talib.SMA(values, timeperiod=period)
+    return rolling(pd.Series(values), period, 'mean').to_numpy()
+
+
+def compute_enhanced_features_batch(df: pd.DataFrame, window: int = 20) -> Dict[str, np.ndarray]:
+    """Compute the 20 enhanced features for every bar in a single pass.
+
+    Row ``j`` of each array holds the features ``compute_enhanced_features``
+    would report using data up to and including bar ``j``. Indicators are
+    computed once over the full series, so rolling indicators see all prior
+    history; slope, return, volatility and average volume use the trailing
+    ``window`` bars.
+
+    Args:
+        df: DataFrame with OHLCV data
+        window: Trailing window for slope/return/volatility/volume stats
+
+    Returns:
+        Dict mapping feature name to a NumPy array aligned to ``df.index``
+    """
+    close = df["Close"]
+    prices = close.to_numpy(dtype=np.float64)
+    n = len(prices)
+
+    # Trailing-window statistics
+    slope = _rolling_slope(prices, window)
+    last_return = np.full(n, np.nan)
+    volatility = np.full(n, np.nan)
+    if n >= window >= 2:
+        windows = np.lib.stride_tricks.sliding_window_view(prices, window)
+        last_return[window - 1:] = prices[window - 1:] / prices[:n - window + 1] - 1.0
+        volatility[window - 1:] = windows.std(axis=1, ddof=1)
+    if "Volume" in df.columns:
+        avg_volume = _rolling_mean(df["Volume"].to_numpy(), window)
+    else:
+        avg_volume = np.zeros(n)
+
+    # Moving averages
+    sma_20 = _rolling_mean(prices, 20)
+    sma_50 = _rolling_mean(prices, 50)
+    ema_12 = close.ewm(span=12).mean().to_numpy()
+    ema_26 = close.ewm(span=26).mean().to_numpy()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        current_position = np.where(np.isnan(sma_50) | (sma_50 == 0), 0.0,
+                                    (prices - sma_50) / sma_50)
+
+        macd, signal, histogram = calculate_macd(df)
+
+        upper_bb, _, lower_bb = calculate_bollinger_bands(df, 20, 2.0)
+        bb_range = (upper_bb - lower_bb).to_numpy()
+        bb_position = np.where(np.isnan(bb_range) | (bb_range == 0), 0.5,
+                               (prices - lower_bb.to_numpy()) / bb_range)
+
+        atr = calculate_atr(df, 14).to_numpy()
+        atr_percent = np.where(prices != 0, atr / prices * 100, 0.0)
+
+    k_stoch, d_stoch = calculate_stochastic(df, 14, 3, 3)
+
+    return {
+        "slope": slope,
+        "last_return": last_return,
+        "volatility": volatility,
+        "sma_20": sma_20,
+        "sma_50": sma_50,
+        "ema_12": ema_12,
+        "ema_26": ema_26,
+        "price": prices,
+        "current_position": current_position,
+        "rsi": calculate_rsi(df, 14).to_numpy(),
+        "macd": macd.to_numpy(),
+        "macd_signal": signal.to_numpy(),
+        "macd_histogram": histogram.to_numpy(),
+        "bb_position": bb_position,
+        "atr": atr,
+        "atr_percent": atr_percent,
+        "adx": calculate_adx(df, 14).to_numpy(),
+        "k_stoch": k_stoch.to_numpy(),
+        "d_stoch": d_stoch.to_numpy(),
+        "avg_volume": avg_volume
+    }
+
+
+def _ewm_step(num: float, den: float, x: float, span: int) -> Tuple[float, float]:
+    """One step of ``Series.ewm(span=span, adjust=True).mean()`` as num/den."""
+    decay = 1.0 - 2.0 / (span + 1.0)
+    num *= decay
+    den *= decay
+    if not np.isnan(x):
+        num += x
+        den += 1.0
+    return num, den
+
+
+def _safe_div(a: float, b: float) -> float:
+    """Divide like NumPy (inf/NaN) instead of raising ZeroDivisionError."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return float(np.float64(a) / np.float64(b))
+
+
+@dataclass
+class StreamingFeatureState:
+    """Running state for computing enhanced features one bar at a time.
+
+    Mirrors ``compute_enhanced_features_batch``: each call to
+    ``update_streaming_features`` folds in the newest bar and returns the
+    features for data up to and including that bar, in O(1) per bar instead
+    of recomputing every indicator over the trailing window.
+    """
+    window: int = 20
+    n_bars: int = 0
+    prev_high: float = np.nan
+    prev_low: float = np.nan
+    prev_close: float = np.nan
+
+    # Trailing-window close/volume stats (slope, return, volatility)
+    closes: deque = None
+    volumes: deque = None
+    close_sum: float = 0.0
+    close_sq_sum: float = 0.0
+    close_idx_sum: float = 0.0
+    volume_sum: float = 0.0
+
+    # Moving averages
+    sma20_window: deque = field(default_factory=lambda: deque(maxlen=20))
+    sma20_sum: float = 0.0
+    sma20_sq_sum: float = 0.0
+    sma50_window: deque = field(default_factory=lambda: deque(maxlen=50))
+    sma_sum: float = 0.0
+
+    # EWM numerators/denominators
+    ema12: Tuple[float, float] = (0.0, 0.0)
+    ema26: Tuple[float, float] = (0.0, 0.0)
+    macd_signal: Tuple[float, float] = (0.0, 0.0)
+    plus_dm: Tuple[float, float] = (0.0, 0.0)
+    minus_dm: Tuple[float, float] = (0.0, 0.0)
+    tr_ewm: Tuple[float, float] = (0.0, 0.0)
+    adx: Tuple[float, float] = (0.0, 0.0)
+
+    # RSI / ATR rolling sums
+    gains: deque = field(default_factory=lambda: deque(maxlen=14))
+    losses: deque = field(default_factory=lambda: deque(maxlen=14))
+    rsi_avg_gain: float = 0.0
+    rsi_avg_loss: float = 0.0
+    true_ranges: deque = field(default_factory=lambda: deque(maxlen=14))
+    atr: float = 0.0
+
+    # Stochastic
+    lows: deque = field(default_factory=lambda: deque(maxlen=14))
+    highs: deque = field(default_factory=lambda: deque(maxlen=14))
+    k_percent: deque = field(default_factory=lambda: deque(maxlen=3))
+    k_line: deque = field(default_factory=lambda: deque(maxlen=3))
+
+    def __post_init__(self):
+        if self.closes is None:
+            self.closes = deque(maxlen=self.window)
+        if self.volumes is None:
+            self.volumes = deque(maxlen=self.window)
+
+
+def _push_sum(window: deque, total: float, x: float) -> float:
+    """Append ``x`` to a bounded window and return the adjusted running sum."""
+    if len(window) == window.maxlen:
+        total -= window[0]
+    window.append(x)
+    return total + x
+
+
+def _window_mean(window: deque, total: float) -> float:
+    return total / window.maxlen if len(window) == window.maxlen else np.nan
+
+
+def update_streaming_features(state: StreamingFeatureState,
+                              bar: Mapping) -> Tuple[StreamingFeatureState, Dict[str, float]]:
+    """Fold one OHLCV bar into ``state`` and return the updated features.
+
+    Args:
+        state: Running state (mutated in place and returned)
+        bar: Mapping with High, Low, Close and optionally Volume
+
+    Returns:
+        Tuple of (state, features dict with the same keys as
+        ``compute_enhanced_features``)
+    """
+    high = float(bar["High"])
+    low = float(bar["Low"])
+    price = float(bar["Close"])
+    volume = float(bar.get("Volume", 0.0))
+    prev_close = state.prev_close
+    first = state.n_bars == 0
+
+    # Trailing window: slope via running sum of index-weighted closes
+    w = state.window
+    closes = state.closes
+    if len(closes) == w:
+        # Dropping the oldest close shifts every remaining index down by one
+        oldest = closes.popleft()
+        state.close_sum -= oldest
+        state.close_sq_sum -= oldest * oldest
+        state.close_idx_sum -= state.close_sum
+    state.close_idx_sum += len(closes) * price
+    closes.append(price)
+    state.close_sum += price
+    state.close_sq_sum += price * price
+    state.volume_sum = _push_sum(state.volumes, state.volume_sum, volume)
+
+    if len(closes) == w and w >= 2:
+        t_mean = (w - 1) / 2.0
+        t_var = w * (w * w - 1) / 12.0
+        slope = (state.close_idx_sum - t_mean * state.close_sum) / t_var
+        last_return = price / closes[0] - 1.0
+        var = (state.close_sq_sum - state.close_sum ** 2 / w) / (w - 1)
+        volatility = float(np.sqrt(max(var, 0.0)))
+        avg_volume = state.volume_sum / w
+    else:
+        slope = last_return = volatility = avg_volume = np.nan
+
+    # Moving averages
+    if len(state.sma20_window) == 20:
+        old = state.sma20_window[0]
+        state.sma20_sq_sum -= old * old
+    state.sma20_sum = _push_sum(state.sma20_window, state.sma20_sum, price)
+    state.sma20_sq_sum += price * price
+    state.sma_sum = _push_sum(state.sma50_window, state.sma_sum, price)
+    sma_20 = _window_mean(state.sma20_window, state.sma20_sum)
+    sma_50 = _window_mean(state.sma50_window, state.sma_sum)
+
+    state.ema12 = _ewm_step(*state.ema12, price, 12)
+    state.ema26 = _ewm_step(*state.ema26, price, 26)
+    ema_12 = state.ema12[0] / state.ema12[1]
+    ema_26 = state.ema26[0] / state.ema26[1]
+    macd_value = ema_12 - ema_26
+    state.macd_signal = _ewm_step(*state.macd_signal, macd_value, 9)
+    macd_signal = state.macd_signal[0] / state.macd_signal[1]
+
+    if np.isnan(sma_50) or sma_50 == 0:
+        current_position = 0
+    else:
+        current_position = (price - sma_50) / sma_50
+
+    # Bollinger Bands (20, 2.0)
+    if np.isnan(sma_20):
+        bb_position = 0.5
+    else:
+        var20 = max((state.sma20_sq_sum - state.sma20_sum ** 2 / 20) / 19, 0.0)
+        std20 = np.sqrt(var20)
+        bb_range = 4.0 * std20
+        bb_position = 0.5 if bb_range == 0 else (price - (sma_20 - 2.0 * std20)) / bb_range
+
+    # RSI (14)
+    delta = 0.0 if first else price - prev_close
+    state.rsi_avg_gain = _push_sum(state.gains, state.rsi_avg_gain, max(delta, 0.0))
+    state.rsi_avg_loss = _push_sum(state.losses, state.rsi_avg_loss, max(-delta, 0.0))
+    rs = _safe_div(_window_mean(state.gains, state.rsi_avg_gain),
+                   _window_mean(state.losses, state.rsi_avg_loss))
+    rsi = 100 - (100 / (1 + rs))
+
+    # True range, ATR (14) and ADX (14)
+    if first:
+        tr = high - low
+        plus_dm = minus_dm = 0.0
+    else:
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        high_diff = high - state.prev_high
+        low_diff = state.prev_low - low
+        plus_dm = high_diff if (high_diff > low_diff and high_diff > 0) else 0.0
+        minus_dm = low_diff if (low_diff > high_diff and low_diff > 0) else 0.0
+    state.atr = _push_sum(state.true_ranges, state.atr, tr)
+    atr = _window_mean(state.true_ranges, state.atr)
+    atr_percent = (atr / price * 100) if price != 0 else 0
+
+    state.plus_dm = _ewm_step(*state.plus_dm, plus_dm, 14)
+    state.minus_dm = _ewm_step(*state.minus_dm, minus_dm, 14)
+    state.tr_ewm = _ewm_step(*state.tr_ewm, tr, 14)
+    tr_smooth = state.tr_ewm[0] / state.tr_ewm[1]
+    plus_di = 100 * _safe_div(state.plus_dm[0] / state.plus_dm[1], tr_smooth)
+    minus_di = 100 * _safe_div(state.minus_dm[0] / state.minus_dm[1], tr_smooth)
+    dx = 100 * _safe_div(abs(plus_di - minus_di), plus_di + minus_di)
+    state.adx = _ewm_step(*state.adx, dx, 14)
+    adx = _safe_div(*state.adx) if state.adx[1] > 0 else np.nan
+
+    # Stochastic (14, 3, 3)
+    state.lows.append(low)
+    state.highs.append(high)
+    if len(state.lows) == 14:
+        low_min = min(state.lows)
+        k_pct = 100 * _safe_div(price - low_min, max(state.highs) - low_min)
+    else:
+        k_pct = np.nan
+    state.k_percent.append(k_pct)
+    k_value = sum(state.k_percent) / 3 if len(state.k_percent) == 3 else np.nan
+    state.k_line.append(k_value)
+    d_value = sum(state.k_line) / 3 if len(state.k_line) == 3 else np.nan
+
+    state.prev_high, state.prev_low, state.prev_close = high, low, price
+    state.n_bars += 1
+
+    return state, {
+        "slope": slope,
+        "last_return": last_return,
+        "volatility": volatility,
+        "sma_20": sma_20,
+        "sma_50": sma_50,
+        "ema_12": ema_12,
+        "ema_26": ema_26,
+        "price": price,
+        "current_position": current_position,
+        "rsi": rsi,
+        "macd": macd_value,
+        "macd_signal": macd_signal,
+        "macd_histogram": macd_value - macd_signal,
+        "bb_position": bb_position,
+        "atr": atr,
+        "atr_percent": atr_percent,
+        "adx": adx,
+        "k_stoch": k_value,
+        "d_stoch": d_value,
+        "avg_volume": avg_volume
+    }
+
+
 def detect_volatility_regime(features: Dict[str, float]) -> str:
     """Detect market volatility regime.
     
@@ -404,6 +855,48 @@ def enhanced_prediction_adaptive(features: Dict,
     }
 
 
+def prediction_components_batch(features: Dict[str, np.ndarray]) -> np.ndarray:
+    """Normalized component scores for every row of a feature batch.
+
+    Args:
+        features: Dict of feature arrays, e.g. from compute_enhanced_features_batch
+
+    Returns:
+        Array of shape (n, 5) with columns in WEIGHT_CATEGORIES order
+    """
+    f = features
+
+    # 1. Trend
+    trend = ((f["slope"] > 0).astype(float) +
+             (f["sma_20"] > f["sma_50"]) +
+             (f["ema_12"] > f["ema_26"])) / 3.0
+
+    # 2. Momentum
+    rsi = f["rsi"]
+    momentum_score = np.select([rsi < 30, rsi < 50, rsi > 70], [2, 1, -2], 0)
+    macd, macd_signal, hist = f["macd"], f["macd_signal"], f["macd_histogram"]
+    momentum_score = momentum_score + np.select(
+        [(hist > 0) & (macd > macd_signal), (hist < 0) & (macd < macd_signal)], [1, -1], 0)
+    momentum = np.clip((momentum_score + 2) / 4.0, 0, 1)
+
+    # 3. Volatility & Support/Resistance
+    bb, atr_pct = f["bb_position"], f["atr_percent"]
+    volatility_score = (np.select([bb < 0.2, bb > 0.8], [1, -1], 0) +
+                        np.select([atr_pct < 1.0, atr_pct > 3.0], [1, -1], 0))
+    volatility = np.clip((volatility_score + 1) / 2.0, 0, 1)
+
+    # 4. Trend Strength (fmin/fmax treat NaN like the scalar min/max chain)
+    trend_strength = np.fmax(0.0, np.fmin(1.0, f["adx"] / 40.0))
+
+    # 5. Stochastic
+    k, d = f["k_stoch"], f["d_stoch"]
+    stoch_score = (np.select([k < 20, k > 80], [1.0, -1.0], 0.0) +
+                   np.select([k > d, k < d], [0.5, -0.5], 0.0))
+    stochastic = np.clip((stoch_score + 1) / 2.0, 0, 1)
+
+    return np.column_stack([trend, momentum, volatility, trend_strength, stochastic])
+
+
 def generate_trading_levels(price: float, atr: float) -> Dict[str, float]:
     """Generate dynamic trading levels based on price and ATR.
     
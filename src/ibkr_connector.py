@@ -80,7 +80,8 @@ class IBKRConnector:
             bar_size: Bar size ('1 min', '5 mins', '15 mins', '1 hour', '1 day')
         
         Returns:
-            DataFrame with OHLCV data or None if failed
+            DataFrame with DateTime and flat OHLCV columns on a RangeIndex,
+            or None if failed
         """
         try:
             if not self.connected:
@@ -9,6 +9,7 @@ stop-loss and take-profit levels.
 """
 
 import argparse
+import os
 import sys
 from datetime import datetime
 from typing import Tuple, Dict
@@ -18,7 +19,11 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import yfinance as yf
-from sklearn.linear_model import LinearRegression
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _slope import compute_slope
 
 
 def _normalize_timezone(df: pd.DataFrame) -> pd.DataFrame:
@@ -97,14 +102,12 @@ def compute_sma(df_daily: pd.DataFrame):
     return float(sma20), float(sma50)
 
 
-def _compute_slope(prices: np.ndarray) -> float:
-    """Compute linear regression slope of prices."""
-    if len(prices) < 2:
-        return 0.0
-    times = np.arange(len(prices)).reshape(-1, 1)
-    lr = LinearRegression()
-    lr.fit(times, prices)
-    return float(lr.coef_[0])
+def _project_trend(prices: np.ndarray, steps: int) -> np.ndarray:
+    """Extend the least-squares trend line of prices ``steps`` bars past the end."""
+    n = len(prices)
+    # The fitted line passes through (mean time, mean price)
+    future_times = np.arange(n, n + steps) - (n - 1) / 2.0
+    return prices.mean() + compute_slope(prices) * future_times
 
 
 def compute_intraday_features(df_min: pd.DataFrame) -> Dict[str, float]:
@@ -117,7 +120,7 @@ def compute_intraday_features(df_min: pd.DataFrame) -> Dict[str, float]:
         Dict with slope, last_return, avg_volume
     """
     prices = df_min["Close"].values
-    slope = _compute_slope(prices)
+    slope = compute_slope(prices)
     last_return = (prices[-1] / prices[0] - 1.0) if len(prices) >= 2 else 0.0
     avg_volume = float(df_min["Volume"].mean()) if "Volume" in df_min.columns else 0.0
     return {"slope": slope, "last_return": last_return, "avg_volume": avg_volume}
@@ -132,11 +135,14 @@ def compute_4h_features(df_4h: pd.DataFrame) -> Dict[str, float]:
     Returns:
         Dict with slope, last_return, volatility, avg_volatility
     """
-    prices = df_4h["Close"].values
-    slope = _compute_slope(prices)
-    last_return = (prices[-1] / prices[0] - 1.0) if len(prices) >= 2 else 0.0
-    volatility = float(df_4h["Close"].std())
-    avg_volatility = float(df_4h["Close"].rolling(window=2).std().mean())
+    prices = df_4h["Close"].to_numpy(dtype=np.float64)
+    slope = compute_slope(prices)
+    if len(prices) < 2:
+        return {"slope": slope, "last_return": 0.0, "volatility": float("nan"), "avg_volatility": float("nan")}
+    last_return = prices[-1] / prices[0] - 1.0
+    volatility = float(prices.std(ddof=1))
+    # rolling(2).std().mean(): the std of two points is |a - b| / sqrt(2)
+    avg_volatility = float(np.abs(np.diff(prices)).mean() / np.sqrt(2.0))
     return {"slope": slope, "last_return": last_return, "volatility": volatility, "avg_volatility": avg_volatility}
 
 
@@ -240,14 +246,10 @@ def plot_intraday(df_min: pd.DataFrame, df_extended: pd.DataFrame, ticker: str,
     ax.plot(df_min.index, df_min["Close"], label="Price (Last 20m - Analysis)", color="darkblue", linewidth=3, marker="o", markersize=5)
     
     # Calculate trend for next 10 minutes
-    prices = df_min["Close"].values
-    times = np.arange(len(prices)).reshape(-1, 1)
-    lr = LinearRegression()
-    lr.fit(times, prices)
+    prices = df_min["Close"].to_numpy(dtype=np.float64)
     
     # Project next 10 candles
-    future_times = np.arange(len(prices), len(prices) + 10).reshape(-1, 1)
-    future_prices = lr.predict(future_times)
+    future_prices = _project_trend(prices, 10)
     
     # Create future index (assuming 1-minute intervals)
     last_time = df_min.index[-1]
@@ -302,14 +304,10 @@ def plot_4h(df_4h: pd.DataFrame, ticker: str, prediction: str):
     ax.plot(df_4h.index, df_4h["Close"], label="Close Price", color="tab:purple", linewidth=2, marker="o", markersize=6)
     
     # Calculate trend for next 2 periods (extrapolate ~8 hours)
-    prices_4h = df_4h["Close"].values
-    times_4h = np.arange(len(prices_4h)).reshape(-1, 1)
-    lr_4h = LinearRegression()
-    lr_4h.fit(times_4h, prices_4h)
+    prices_4h = df_4h["Close"].to_numpy(dtype=np.float64)
     
     # Project next 2 candles
-    future_times_4h = np.arange(len(prices_4h), len(prices_4h) + 2).reshape(-1, 1)
-    future_prices_4h = lr_4h.predict(future_times_4h)
+    future_prices_4h = _project_trend(prices_4h, 2)
     
     # Create future index (assuming 4-hour intervals)
     last_time_4h = df_4h.index[-1]
@@ -0,0 +1,404 @@
+"""QUBT direction prediction from hourly or 1-minute bars.
+
+``predict_qubt`` backs both the ``predict_qubt.py`` (hourly) and
+``predict_qubt_10min.py`` (1-minute) scripts. Importing this module is cheap:
+pandas, yfinance and the predictor stack are imported on the first prediction.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Hourly report layout; filled in with plain values by _predict_hourly
+_HOURLY_REPORT = """
+╔════════════════════════════════════════════════════════════════════════════╗
+║                      QUBT DIRECTION PREDICTION                             ║
+║                                                                            ║
+║  Will QUBT go UP or DOWN next?                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+
+📊 QUBT MARKET SNAPSHOT
+═══════════════════════════════════════════════════════════════════════════
+Ticker:              QUBT (Quantum Computing)
+Current Price:       ${current_price:.4f}
+Last Hour Change:    {change_pct:+.3f}%
+Data Points:         {candles} hourly candles (last 30 days)
+Time:                {time}
+
+🎯 PREDICTION RESULT
+═══════════════════════════════════════════════════════════════════════════
+Next Move:           {direction}
+Confidence:          {confidence:.1f}%
+Signal Type:         {action_emoji}
+
+{confidence_label}
+
+📈 TECHNICAL INDICATORS
+═══════════════════════════════════════════════════════════════════════════
+RSI (14):            {rsi:.2f}
+  Status:            {rsi_status}
+
+MACD:                {macd_status}
+  Line: {macd:.6f}, Signal: {macd_signal:.6f}
+
+ADX (Trend Strength): {adx:.2f}
+  Interpretation:    {adx_status}
+
+ATR (Volatility):    ${atr:.4f} per hour
+
+Momentum:            {momentum:+.4f}
+  Direction:         {momentum_status}
+
+📊 PRICE TARGETS
+═══════════════════════════════════════════════════════════════════════════
+Entry Price:         ${current_price:.4f}
+Upside Target:       ${target_up:.4f} (+{upside_pct:.2f}%)
+Downside Target:     ${target_down:.4f} ({downside_pct:.2f}%)
+
+Stop Loss:           ${long_stop:.4f} (1 ATR below entry)
+Take Profit:         ${long_target:.4f} (2 ATR above entry)
+
+Risk/Reward:         1:2.0 (excellent ratio)
+
+💡 TRADING ACTION
+═══════════════════════════════════════════════════════════════════════════
+Expected Direction:  {direction}
+Signal Strength:     {confidence:.1f}%
+
+IF BULLISH ({is_long}):
+  • BUY if RSI < 70
+  • Set stop at ${long_stop:.4f}
+  • Target profit at ${long_target:.4f}
+  • Position size: {position_size}
+
+IF BEARISH ({is_short}):
+  • SELL if RSI > 30
+  • Set stop at ${short_stop:.4f}
+  • Target profit at ${short_target:.4f}
+  • Position size: {position_size}
+
+IF NEUTRAL:
+  • WAIT for clearer signal
+  • Monitor ADX for trend confirmation
+  • Consider breakout strategy
+
+⚠️  RISK DISCLAIMER
+═══════════════════════════════════════════════════════════════════════════
+• This is hourly analysis (not 10-minute) due to data limitations
+• ML predictions are probabilistic, not guaranteed
+• Always use stops and proper position sizing
+• Only risk what you can afford to lose
+• Past performance does not guarantee future results
+• Paper trading recommended for new strategies
+
+═══════════════════════════════════════════════════════════════════════════
+                 📌 QUBT DIRECTION PREDICTION COMPLETE
+             Next move: {direction} | Confidence: {confidence:.1f}%
+═══════════════════════════════════════════════════════════════════════════
+"""
+
+# Status labels, indexed by band (NaN falls in the same band as before)
+_HOURLY_CONFIDENCE = ('❌ LOW CONFIDENCE - AVOID', '⚠ MODERATE CONFIDENCE', '✓ HIGH CONFIDENCE')
+_HOURLY_RSI_STATUS = ('Oversold (<30)', 'Neutral (30-70)', 'Overbought (>70)')
+_HOURLY_ADX_STATUS = ('Weak trend', 'Moderate trend', 'Strong trend')
+
+
+def _predict_hourly(verbose):
+    """Predict QUBT's next hourly move; prints the report unless verbose is False"""
+    # Heavy imports (pandas, yfinance, sklearn) are deferred to the first call
+    import pandas as pd
+    from _weights_cache import get_optimizer
+    from data_cache import fetch_bars
+    from enhanced_predictor_adaptive import enhanced_prediction_adaptive, compute_enhanced_features
+    
+    ticker = 'QUBT'
+    
+    try:
+        # Fetch hourly data (1-minute not available right now)
+        end_time = datetime.now()
+        start_time = end_time - timedelta(days=30)
+        
+        df = fetch_bars([ticker], '1h', start=start_time, end=end_time).get(ticker, pd.DataFrame())
+        
+        if len(df) < 20:
+            print(f'\n❌ Insufficient data for {ticker}')
+            return None
+        
+        # Reset index to avoid issues with timestamp index (fetch_bars
+        # already returns flat OHLCV columns)
+        if not isinstance(df.index, pd.RangeIndex):
+            df = df.reset_index(drop=True)
+        
+        # Load adaptive weights
+        optimizer = get_optimizer()
+        
+        # Compute features
+        features = compute_enhanced_features(df)
+        
+        # Generate prediction
+        prediction = enhanced_prediction_adaptive(features, optimizer, use_adaptive_weights=True)
+        
+        close = df['Close'].to_numpy()
+        current_price = close[-1]
+        prev_price = close[-2] if len(close) > 1 else current_price
+        change_pct = ((current_price - prev_price) / prev_price * 100) if prev_price > 0 else 0
+        
+        rsi = features['rsi']
+        macd = features['macd']
+        macd_signal = features['macd_signal']
+        atr = features['atr']
+        adx = features['adx']
+        momentum = features['slope']  # Using slope as momentum proxy
+        
+        direction = prediction.get('direction', 'NEUTRAL').upper()
+        confidence = prediction.get('confidence', 0)
+        
+        # Calculate next move targets
+        if direction == 'LONG':
+            target_up = current_price + (atr * 2)
+            target_down = current_price - atr
+            action_emoji = '🟢 BUY (BULLISH)'
+        elif direction == 'SHORT':
+            target_up = current_price + atr
+            target_down = current_price - (atr * 2)
+            action_emoji = '🔴 SELL (BEARISH)'
+        else:
+            target_up = current_price + atr
+            target_down = current_price - atr
+            action_emoji = '⚪ NEUTRAL'
+        
+        result = {
+            'ticker': ticker,
+            'price': current_price,
+            'direction': direction,
+            'confidence': confidence,
+            'rsi': rsi,
+            'adx': adx,
+            'atr': atr,
+            'target_up': target_up,
+            'target_down': target_down
+        }
+        if not verbose:
+            return result
+        
+        print(_HOURLY_REPORT.format(
+            current_price=current_price,
+            change_pct=change_pct,
+            candles=len(df),
+            time=end_time.strftime('%Y-%m-%d %H:%M:%S'),
+            direction=direction,
+            confidence=confidence,
+            action_emoji=action_emoji,
+            confidence_label=_HOURLY_CONFIDENCE[int(confidence >= 50) + int(confidence >= 70)],
+            rsi=rsi,
+            rsi_status=_HOURLY_RSI_STATUS[1 - int(rsi < 30) + int(rsi > 70)],
+            macd_status='🔺 BULLISH (above signal)' if macd > macd_signal else '🔻 BEARISH (below signal)',
+            macd=macd,
+            macd_signal=macd_signal,
+            adx=adx,
+            adx_status=_HOURLY_ADX_STATUS[2 - int(adx < 40) - int(adx < 20)],
+            atr=atr,
+            momentum=momentum,
+            momentum_status='Positive (bullish)' if momentum > 0 else 'Negative (bearish)',
+            target_up=target_up,
+            upside_pct=(target_up / current_price - 1) * 100,
+            target_down=target_down,
+            downside_pct=(target_down / current_price - 1) * 100,
+            long_stop=current_price - atr,
+            long_target=current_price + atr * 2,
+            short_stop=current_price + atr,
+            short_target=current_price - atr * 2,
+            is_long=direction == 'LONG',
+            is_short=direction == 'SHORT',
+            position_size='NORMAL (50%)' if confidence >= 60 else 'SMALL (25%)',
+        ))
+        
+        return result
+    
+    except Exception as e:
+        print(f'\n❌ ERROR: {str(e)}')
+        import traceback
+        traceback.print_exc()
+        return None
+
+
+# 10-minute report layout; filled in with plain values by _predict_minute
+_MINUTE_REPORT = """
+╔════════════════════════════════════════════════════════════════════════════╗
+║                      10-MINUTE QUBT PREDICTION                             ║
+║                                                                            ║
+║  Will {ticker} go UP or DOWN in the next 10 minutes?                      ║
+╚════════════════════════════════════════════════════════════════════════════╝
+
+📊 MARKET DATA
+═══════════════════════════════════════════════════════════════════════════
+Ticker:              {ticker}
+Current Price:       ${current_price:.4f}
+Last Candle Δ:       {change_pct:+.3f}%
+Time:                {run_time}
+Candles Analyzed:    {candles} (1-minute)
+
+🎯 PREDICTION FOR NEXT 10 MINUTES
+═══════════════════════════════════════════════════════════════════════════
+Direction:           {direction}
+Signal Strength:     {signal_strength} ({confidence:.1f}% confidence)
+Recommendation:      {recommendation}
+
+📈 TECHNICAL ANALYSIS
+═══════════════════════════════════════════════════════════════════════════
+RSI (14):            {rsi:.2f}  {rsi_status}
+MACD:                {macd_status}
+ADX:                 {adx:.2f}  {adx_status}
+ATR (Volatility):    {atr:.4f}
+Momentum:            {momentum:+.4f}
+
+💰 NEXT 10 MINUTES ACTION
+═══════════════════════════════════════════════════════════════════════════
+Expected Direction:  {direction}
+Risk Level:          {risk_level}
+Action:              
+   ✓ Direction: {direction}
+   ✓ Confidence: {confidence:.1f}%
+   ✓ Stop: Use tight stop (1 ATR = {stop_pct:.2f}% of price)
+   ✓ Target: 2-3 ATR ({target_low_pct:.2f}% - {target_high_pct:.2f}%)
+
+⚠️  IMPORTANT DISCLAIMERS
+═══════════════════════════════════════════════════════════════════════════
+• 1-minute predictions are HIGH RISK and HIGHLY VOLATILE
+• Should only be used for scalping with TIGHT STOPS
+• Requires ACTIVE MARKET HOURS (9:30 AM - 4:00 PM ET)
+• Confidence < 40% = DO NOT TRADE
+• Machine learning models are probabilistic, not guaranteed
+• Always use risk management and position sizing
+• Demo/paper trading recommended for testing
+
+═══════════════════════════════════════════════════════════════════════════
+Generated: {run_time}
+═══════════════════════════════════════════════════════════════════════════
+"""
+
+# Status labels, indexed by band (NaN falls in the same band as before)
+_MINUTE_SIGNAL_STRENGTHS = ('⚪ WEAK', '🟡 MODERATE', '🟢 STRONG')
+_MINUTE_RECOMMENDATIONS = {'LONG': '🚀 BUY (expect UP)', 'SHORT': '📉 SELL (expect DOWN)'}
+_MINUTE_RSI_STATUS = ('(Oversold)', '(Neutral)', '(Overbought)')
+_MINUTE_ADX_STATUS = ('(Weak trend)', '(Moderate trend)', '(Strong trend)')
+_MINUTE_RISK_LEVELS = ('HIGH', 'MEDIUM', 'MODERATE')
+
+
+def _predict_minute(verbose):
+    """Predict QUBT's next 10-minute move; prints the report unless verbose is False"""
+    # Heavy imports (pandas, yfinance, sklearn) are deferred to the first call
+    import pandas as pd
+    from _weights_cache import get_optimizer
+    from data_cache import fetch_bars
+    from enhanced_predictor_adaptive import enhanced_prediction_adaptive, compute_enhanced_features
+    
+    ticker = 'QUBT'
+    
+    try:
+        # Fetch 1-minute data for the last 60 minutes
+        end_time = datetime.now()
+        run_time = end_time.strftime('%Y-%m-%d %H:%M:%S')
+        start_time = end_time - timedelta(minutes=75)
+        
+        df = fetch_bars([ticker], '1m', start=start_time, end=end_time).get(ticker, pd.DataFrame())
+        
+        if len(df) < 20:
+            print(f'\n❌ INSUFFICIENT DATA')
+            print(f'Got {len(df)} 1-minute candles, need at least 20')
+            print(f'\nℹ️  Note: 1-minute data is only available during market hours (9:30 AM - 4:00 PM ET)')
+            print(f'Current time: {run_time}')
+            print(f'\nAlternative: Try hourly prediction instead')
+            return None
+        
+        # Load adaptive weights
+        optimizer = get_optimizer()
+        
+        # Compute features
+        features = compute_enhanced_features(df)
+        
+        # Generate prediction
+        prediction = enhanced_prediction_adaptive(features, optimizer, use_adaptive_weights=True)
+        
+        close = df['Close'].to_numpy()
+        current_price = close[-1]
+        prev_price = close[-2] if len(close) > 1 else current_price
+        change_pct = ((current_price - prev_price) / prev_price * 100) if prev_price > 0 else 0
+        
+        # compute_enhanced_features already returns the latest value of each indicator
+        rsi = features['rsi']
+        macd_line = features['macd']
+        macd_signal = features['macd_signal']
+        atr = features['atr']
+        adx = features['adx']
+        momentum = features['slope']  # Using slope as momentum proxy
+        
+        direction = prediction.get('direction', 'NEUTRAL').upper()
+        confidence = prediction.get('confidence', 0)
+        
+        result = {
+            'ticker': ticker,
+            'price': current_price,
+            'direction': direction,
+            'confidence': confidence,
+            'rsi': rsi,
+            'adx': adx,
+            'atr': atr
+        }
+        if not verbose:
+            return result
+        
+        print(_MINUTE_REPORT.format(
+            ticker=ticker,
+            current_price=current_price,
+            change_pct=change_pct,
+            run_time=run_time,
+            candles=len(df),
+            direction=direction,
+            signal_strength=_MINUTE_SIGNAL_STRENGTHS[int(confidence >= 50) + int(confidence >= 70)],
+            confidence=confidence,
+            recommendation=_MINUTE_RECOMMENDATIONS.get(direction, '⚪ NO CLEAR SIGNAL'),
+            rsi=rsi,
+            rsi_status=_MINUTE_RSI_STATUS[1 - int(rsi < 30) + int(rsi > 70)],
+            macd_status='🔺 BULLISH' if macd_line > macd_signal else '🔻 BEARISH',
+            adx=adx,
+            adx_status=_MINUTE_ADX_STATUS[2 - int(adx < 40) - int(adx < 20)],
+            atr=atr,
+            momentum=momentum,
+            risk_level=_MINUTE_RISK_LEVELS[2 - int(confidence < 60) - int(confidence < 40)],
+            stop_pct=atr * 100,
+            target_low_pct=atr * 2 * 100,
+            target_high_pct=atr * 3 * 100,
+        ))
+        
+        return result
+    
+    except Exception as e:
+        print(f'\n❌ ERROR: {str(e)}')
+        print(f'\nPossible causes:')
+        print(f'  1. Market is closed (only works during 9:30 AM - 4:00 PM ET)')
+        print(f'  2. QUBT ticker data not available')
+        print(f'  3. Network connectivity issue')
+        return None
+
+
+_PREDICTORS = {'1h': _predict_hourly, '1m': _predict_minute}
+
+
+def predict_qubt(interval: str = '1h', verbose: bool = True):
+    """Predict QUBT's next move.
+
+    Args:
+        interval: '1h' for the hourly analysis, '1m' for the 10-minute outlook
+        verbose: Print the report (False just returns the result)
+
+    Returns:
+        Result dict, or None if data was unavailable or the prediction failed
+    """
+    try:
+        predict = _PREDICTORS[interval]
+    except KeyError:
+        raise ValueError(f"Unsupported interval: {interval!r} (use '1h' or '1m')") from None
+    return predict(verbose)
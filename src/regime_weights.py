@@ -5,13 +5,32 @@ optimal weights by testing different combinations on historical data.
 """
 
 from typing import Dict, Tuple, List
+import os
+import sys
 import numpy as np
 import pandas as pd
 from itertools import combinations
 import warnings
 
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _mmap_pickle import map_pickle
+
 warnings.filterwarnings("ignore")
 
+# Weight categories in the order used for weight vectors/matrices
+WEIGHT_CATEGORIES = ('trend', 'momentum', 'volatility', 'trend_strength', 'stochastic')
+
+# Regime categories that carry their own weights, in code order for batch lookups
+REGIME_CATEGORIES = ('trending_strong', 'trending_weak', 'ranging_high', 'ranging')
+
+
+def _metadata_path(npz_path: str) -> str:
+    """JSON metadata file stored next to a ``save_npz`` weights file."""
+    root, ext = os.path.splitext(npz_path)
+    return (root if ext == '.npz' else npz_path) + '.json'
+
 
 class RegimeAdaptiveWeights:
     """Learns weights by testing combinations on historical data."""
@@ -21,6 +40,8 @@ class RegimeAdaptiveWeights:
         self.regime_weights = {}
         self.tested_combinations = {}
         self.is_trained = False
+        self._weight_vectors = {}
+        self._weight_source = None
         
     def generate_weight_combinations(self, num_categories: int = 5) -> List[Dict]:
         """Generate weight combinations for testing.
@@ -254,6 +275,7 @@ class RegimeAdaptiveWeights:
         
         print(f"\nImprovement: {improvement:+.2f}% (baseline: {baseline:.2f}% → best: {best_accuracy:.2f}%)")
         
+        self._weight_vectors = {}
         self.is_trained = True
     
     def get_adaptive_weights(self, features: Dict[str, float]) -> Dict[str, float]:
@@ -268,29 +290,60 @@ class RegimeAdaptiveWeights:
         if not self.is_trained:
             return self._default_weights()
         
-        # Detect regime
-        regime = self.detect_market_regime(features)
+        vector = self.get_weight_vector(self._regime_category(features))
+        return dict(zip(WEIGHT_CATEGORIES, vector.tolist()))
+    
+    def _regime_category(self, features: Dict[str, float]) -> str:
+        """Map features straight to the weight category used by detect_market_regime."""
+        adx = features.get('adx', 20)
+        if adx > 30:
+            return 'trending_strong'
+        if adx > 20:
+            return 'trending_weak'
+        if features.get('atr_percent', 1.5) > 2.5:
+            return 'ranging_high'
+        return 'ranging'
+    
+    def get_weight_vector(self, category: str) -> np.ndarray:
+        """Get the weights for a regime category as an array.
         
-        # Map complex regime to simple category
-        if 'strong' in regime:
-            weights = self.regime_weights.get('trending_strong', {})
-        elif 'weak' in regime:
-            weights = self.regime_weights.get('trending_weak', {})
-        elif 'high_vol' in regime:
-            weights = self.regime_weights.get('ranging_high', {})
-        else:
-            weights = self.regime_weights.get('ranging', {})
+        Vectors are built once per category and reused until the weights are
+        retrained, reloaded or ``regime_weights`` is reassigned.
         
-        if not weights:
-            return self._default_weights()
+        Args:
+            category: One of REGIME_CATEGORIES
         
-        return {
-            'trend': weights.get('trend', 0.20),
-            'momentum': weights.get('momentum', 0.25),
-            'volatility': weights.get('volatility', 0.20),
-            'trend_strength': weights.get('trend_strength', 0.20),
-            'stochastic': weights.get('stochastic', 0.15)
-        }
+        Returns:
+            Read-only array of weights in WEIGHT_CATEGORIES order
+        """
+        if self._weight_source is not self.regime_weights:
+            self._weight_vectors = {}
+            self._weight_source = self.regime_weights
+        
+        vector = self._weight_vectors.get(category)
+        if vector is None:
+            default = self._default_weights()
+            weights = self.regime_weights.get(category, {}) or default
+            vector = np.array([weights.get(k, default[k]) for k in WEIGHT_CATEGORIES])
+            vector.flags.writeable = False
+            self._weight_vectors[category] = vector
+        return vector
+    
+    def regime_codes_batch(self, features: Dict[str, np.ndarray]) -> np.ndarray:
+        """Classify every row into an index of REGIME_CATEGORIES.
+        
+        Args:
+            features: Dict of technical indicator arrays
+        
+        Returns:
+            Integer array of regime category codes
+        """
+        n = len(next(iter(features.values())))
+        adx = np.asarray(features.get('adx', np.full(n, 20.0)))
+        atr_percent = np.asarray(features.get('atr_percent', np.full(n, 1.5)))
+        
+        # Same regime -> category mapping as get_adaptive_weights
+        return np.select([adx > 30, adx > 20, atr_percent > 2.5], [0, 1, 2], 3)
     
     def _default_weights(self) -> Dict[str, float]:
         """Return default static weights."""
@@ -310,17 +363,63 @@ class RegimeAdaptiveWeights:
                 'regime_weights': self.regime_weights,
                 'tested_combinations': self.tested_combinations,
                 'is_trained': self.is_trained
-            }, f)
+            }, f, protocol=5)
+        print(f"Weights saved to {filepath}")
+    
+    def save_npz(self, filepath: str):
+        """Save optimized weights without pickle.
+        
+        Each regime's weights go into an .npz as an array in WEIGHT_CATEGORIES
+        order; the remaining fields (regime names/accuracies, tested
+        combinations, trained flag) go into a .json file next to it.
+        """
+        import json
+        arrays = {}
+        regimes = {}
+        for category, weights in self.regime_weights.items():
+            arrays[category] = np.array([weights[k] for k in WEIGHT_CATEGORIES], dtype=np.float64)
+            regimes[category] = {k: v for k, v in weights.items() if k not in WEIGHT_CATEGORIES}
+        
+        np.savez(filepath, **arrays)
+        with open(_metadata_path(filepath), 'w') as f:
+            json.dump({
+                'regime_weights': regimes,
+                'tested_combinations': self.tested_combinations,
+                'is_trained': self.is_trained
+            }, f, indent=2, default=float)
         print(f"Weights saved to {filepath}")
     
+    def load_npz(self, filepath: str):
+        """Load weights written by ``save_npz``."""
+        import json
+        with open(_metadata_path(filepath)) as f:
+            meta = json.load(f)
+        with np.load(filepath) as arrays:
+            vectors = {category: arrays[category] for category in arrays.files}
+        
+        regime_weights = {}
+        for category, vector in vectors.items():
+            vector.flags.writeable = False
+            regime_weights[category] = dict(zip(WEIGHT_CATEGORIES, vector.tolist()))
+            regime_weights[category].update(meta['regime_weights'].get(category, {}))
+        self.regime_weights = regime_weights
+        self.tested_combinations = meta['tested_combinations']
+        self.is_trained = meta['is_trained']
+        # The stored arrays already are the per-category weight vectors
+        self._weight_vectors = vectors
+        self._weight_source = self.regime_weights
+        print(f"Weights loaded from {filepath}")
+    
     def load_weights(self, filepath: str):
-        """Load optimized weights from file."""
-        import pickle
-        with open(filepath, 'rb') as f:
-            data = pickle.load(f)
-            self.regime_weights = data['regime_weights']
-            self.tested_combinations = data['tested_combinations']
-            self.is_trained = data['is_trained']
+        """Load optimized weights from file (pickle, or .npz from ``save_npz``)."""
+        if filepath.endswith('.npz'):
+            return self.load_npz(filepath)
+        
+        data = map_pickle(filepath)
+        self.regime_weights = data['regime_weights']
+        self.tested_combinations = data['tested_combinations']
+        self.is_trained = data['is_trained']
+        self._weight_vectors = {}
         print(f"Weights loaded from {filepath}")
 
 
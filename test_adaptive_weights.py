@@ -16,7 +16,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from regime_weights import RegimeAdaptiveWeights
 from enhanced_predictor_adaptive import (
-    fetch_4hour_data, compute_enhanced_features, 
+    fetch_4hour_data, fetch_4hour_data_batch, StreamingFeatureState, update_streaming_features,
     enhanced_prediction_adaptive, detect_volatility_regime,
     generate_trading_levels
 )
@@ -54,20 +54,24 @@ def test_ticker_adaptive_vs_static(ticker: str,
     regime_counts = {}
     total = 0
     
-    for i in range(lookback, len(df) - 1):
-        historical_df = df.iloc[max(0, i-lookback):i].copy()
+    # Features for bar i are the streaming state after folding in bar i-1
+    state = StreamingFeatureState(window=lookback)
+    bars = df[['High', 'Low', 'Close', 'Volume']].to_dict('records')
+    close = df['Close'].to_numpy(dtype=np.float64)
+    
+    for i in range(1, len(df) - 1):
+        state, features = update_streaming_features(state, bars[i - 1])
         
-        if len(historical_df) < 5:
+        if i < lookback:
             continue
         
         try:
-            features = compute_enhanced_features(historical_df)
             regime = detect_volatility_regime(features)
             regime_counts[regime] = regime_counts.get(regime, 0) + 1
             
             # Actual direction
-            actual_close_next = df['Close'].iloc[i + 1]
-            actual_close_curr = df['Close'].iloc[i]
+            actual_close_next = close[i + 1]
+            actual_close_curr = close[i]
             price_change = actual_close_next - actual_close_curr
             actual_direction = 1 if price_change > 0 else 0
             
@@ -175,6 +179,8 @@ def main():
     print("-"*70)
     
     results = []
+    # One batched download; the per-ticker fetches below are cache hits
+    fetch_4hour_data_batch(args.tickers, days=args.days)
     for ticker in args.tickers:
         result = test_ticker_adaptive_vs_static(ticker, optimizer, days=args.days)
         if result:
@@ -7,6 +7,7 @@ import argparse
 from datetime import datetime
 from src.enhanced_predictor import (
     fetch_4hour_data,
+    fetch_4hour_data_batch,
     compute_enhanced_features,
     enhanced_prediction,
     generate_trading_levels
@@ -28,6 +29,9 @@ def main(tickers=None, export_csv=True):
     print("ENHANCED PREDICTOR - MULTI-TICKER ANALYSIS")
     print("=" * 100)
 
+    # One batched download; the per-ticker fetches below are cache hits
+    fetch_4hour_data_batch(tickers, days=90)
+
     for ticker in tickers:
         try:
             df = fetch_4hour_data(ticker, days=90)
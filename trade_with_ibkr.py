@@ -11,6 +11,7 @@ from typing import Dict, Optional
 from src.ibkr_connector import IBKRConnector
 from src.ibkr_executor import IBKRTradeExecutor, RiskManager
 from src.regime_weights import RegimeAdaptiveWeights
+from src._weights_cache import get_optimizer
 from src.enhanced_predictor_adaptive import enhanced_prediction_adaptive, compute_enhanced_features
 
 
@@ -23,11 +24,11 @@ class IBKRTradingBot:
         self.risk_manager = RiskManager(account_size, max_risk_percent)
         
         # Load weights
-        self.optimizer = RegimeAdaptiveWeights()
         try:
-            self.optimizer.load_weights('models/regime_weights_20251210_135927.pkl')
+            self.optimizer = get_optimizer()
         except:
             print("Warning: Could not load pre-trained weights")
+            self.optimizer = RegimeAdaptiveWeights()
     
     async def analyze_and_trade(self, symbol: str, min_confidence: float = 60.0,
                                dry_run: bool = True) -> Dict:
@@ -17,7 +17,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from adaptive_weights import AdaptiveWeightOptimizer
 from enhanced_predictor_adaptive import (
-    fetch_4hour_data, compute_enhanced_features, 
+    fetch_4hour_data, fetch_4hour_data_batch, compute_enhanced_features, 
     enhanced_prediction_adaptive, generate_trading_levels
 )
 
@@ -50,6 +50,8 @@ def collect_backtest_data(ticker: str,
     predictions_list = []
     features_list = []
     
+    close = df['Close'].to_numpy(dtype=np.float64)
+    
     # Iterate through historical data
     for i in range(lookback, len(df) - 1):  # -1 to have next candle for target
         # Get historical window
@@ -78,8 +80,8 @@ def collect_backtest_data(ticker: str,
             features_list.append(features_normalized)
             
             # Get next candle's actual close for target
-            actual_close_next = df['Close'].iloc[i + 1]
-            actual_close_curr = df['Close'].iloc[i]
+            actual_close_next = close[i + 1]
+            actual_close_curr = close[i]
             
             # Determine actual direction
             price_change = actual_close_next - actual_close_curr
@@ -137,7 +139,7 @@ def train_optimizer(predictions_df: pd.DataFrame,
     features_df = features_df.iloc[:min_len].reset_index(drop=True)
     
     # Create optimizer
-    optimizer = AdaptiveWeightOptimizer(model_type='random_forest')
+    optimizer = AdaptiveWeightOptimizer(model_type='hgb')
     
     # Prepare training data
     X = features_df.copy()
@@ -181,6 +183,7 @@ def evaluate_adaptive_weights(ticker: str,
     
     lookback = 20
     
+    close = df['Close'].to_numpy(dtype=np.float64)
     for i in range(lookback, len(df)):
         historical_df = df.iloc[max(0, i-lookback):i].copy()
         
@@ -191,8 +194,8 @@ def evaluate_adaptive_weights(ticker: str,
             features = compute_enhanced_features(historical_df)
             
             # Actual direction
-            actual_close_next = df['Close'].iloc[i]
-            actual_close_curr = df['Close'].iloc[i-1]
+            actual_close_next = close[i]
+            actual_close_curr = close[i-1]
             price_change = actual_close_next - actual_close_curr
             actual_direction = 1 if price_change > 0 else 0
             
@@ -267,6 +270,8 @@ def main():
     all_predictions = []
     all_features = []
     
+    # One batched download; the per-ticker fetches below are cache hits
+    fetch_4hour_data_batch(args.tickers, days=args.days)
     for ticker in args.tickers:
         predictions_df, features_list = collect_backtest_data(ticker, days=args.days)
         
@@ -297,6 +302,7 @@ def main():
     print("="*70)
     
     results = []
+    fetch_4hour_data_batch(args.tickers, days=30)
     for ticker in args.tickers:
         result = evaluate_adaptive_weights(ticker, optimizer, days=30)
         if result:
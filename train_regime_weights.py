@@ -17,7 +17,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from regime_weights import RegimeAdaptiveWeights
 from enhanced_predictor_adaptive import (
-    fetch_4hour_data, compute_enhanced_features, 
+    fetch_4hour_data_batch, compute_enhanced_features, 
     enhanced_prediction_adaptive
 )
 
@@ -38,13 +38,18 @@ def collect_training_data(tickers: List[str],
     all_features = []
     all_predictions = []
     
+    try:
+        frames = fetch_4hour_data_batch(tickers, days=days)
+    except Exception as e:
+        print(f"Error fetching data: {e}")
+        frames = {}
+    
     for ticker in tickers:
         print(f"\nCollecting data for {ticker}...")
         
-        try:
-            df = fetch_4hour_data(ticker, days=days)
-        except Exception as e:
-            print(f"Error fetching {ticker}: {e}")
+        df = frames.get(ticker)
+        if df is None:
+            print(f"Error fetching {ticker}: no data")
             continue
         
         if len(df) < lookback + 1:
@@ -54,6 +59,7 @@ def collect_training_data(tickers: List[str],
         ticker_features = []
         ticker_predictions = []
         
+        close = df['Close'].to_numpy(dtype=np.float64)
         for i in range(lookback, len(df) - 1):
             historical_df = df.iloc[max(0, i-lookback):i].copy()
             
@@ -66,8 +72,8 @@ def collect_training_data(tickers: List[str],
                 ticker_features.append(features)
                 
                 # Get next candle's actual direction
-                actual_close_next = df['Close'].iloc[i + 1]
-                actual_close_curr = df['Close'].iloc[i]
+                actual_close_next = close[i + 1]
+                actual_close_curr = close[i]
                 price_change = actual_close_next - actual_close_curr
                 actual_direction = 1 if price_change > 0 else 0
                 